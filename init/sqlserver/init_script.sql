@@ -519,11 +519,13 @@ EXEC sp_addextendedproperty
 GO
 
 -- Triggers para atualizar automaticamente o campo updated_at
+-- (exceto nas sessões do sync, que gravam o updated_at vindo da origem)
 CREATE TRIGGER tr_clientes_updated_at
 ON clientes
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE clientes 
     SET updated_at = GETDATE() 
     WHERE id IN (SELECT id FROM inserted);
@@ -535,6 +537,7 @@ ON produtos
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE produtos 
     SET updated_at = GETDATE() 
     WHERE id IN (SELECT id FROM inserted);
@@ -546,6 +549,7 @@ ON pedidos
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE pedidos 
     SET updated_at = GETDATE() 
     WHERE id IN (SELECT id FROM inserted);
@@ -557,6 +561,7 @@ ON itens_pedido
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE itens_pedido 
     SET updated_at = GETDATE() 
     WHERE pedido_id IN (SELECT pedido_id FROM inserted) 
@@ -569,6 +574,7 @@ ON logs
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE logs 
     SET updated_at = GETDATE() 
     WHERE id IN (SELECT id FROM inserted);
@@ -580,6 +586,7 @@ ON generic_table
 AFTER UPDATE
 AS
 BEGIN
+    IF CAST(SESSION_CONTEXT(N'auto_data_sync') AS INT) = 1 RETURN;
     UPDATE generic_table 
     SET updated_at = GETDATE() 
     WHERE id IN (SELECT id FROM inserted);
@@ -10,14 +10,38 @@ Inclui tabela generic com operações automáticas a cada 30 segundos
 import time
 import random
 import datetime
+import decimal
+import functools
+import gzip
+import hashlib
 import logging
-from typing import Dict, List, Any
+import argparse
+import threading
+import multiprocessing
+import asyncio
+import csv
+import io
+import itertools
+import json
+import math
+import os
+import platform
+import queue
+import re
+import tempfile
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from array import array
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
 import sys
 
 # Dependências necessárias
 try:
     import pymysql
     import psycopg2
+    import psycopg2.extras
     import pymssql  # Alternativa mais simples ao pyodbc
 except ImportError as e:
     print(f"❌ Erro: Dependência não encontrada: {e}")
@@ -25,6 +49,37 @@ except ImportError as e:
     print("   pip install pymysql psycopg2-binary pymssql")
     sys.exit(1)
 
+# Drivers assíncronos opcionais (modo --async)
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+try:
+    import aiomysql
+except ImportError:
+    aiomysql = None
+
+# Perfis de carga (--profile): TOML pela biblioteca padrão (3.11+) ou tomli, YAML opcional
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# NumPy opcional: geração vetorizada de linhas sintéticas
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -67,539 +122,4343 @@ class DatabaseConfig:
         'database': 'testdb'  # Iniciar com master depois trocar
     }
 
-class DataManager:
-    """Gerenciador automático de dados"""
+# Limites do SQL Server para INSERT ... VALUES com múltiplas linhas
+SQLSERVER_MAX_ROWS_PER_INSERT = 1000
+SQLSERVER_MAX_PARAMS_PER_STATEMENT = 2100
+MYSQL_MAX_ROWS_PER_INSERT = 1000
+# Tamanho alvo de cada INSERT multi-linha com linhas largas (abaixo do
+# max_allowed_packet padrão do MySQL, 64MB, e do limite de 1GB do PostgreSQL)
+WIDE_INSERT_MAX_BYTES = 16 * 1024 * 1024
+
+# Diretório raiz do projeto (resultados de benchmark vão para metrics/benchmark)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class IdCache:
+    """Cache em memória dos IDs existentes por tabela, para sortear IDs sem ORDER BY RAND()"""
+    
+    def __init__(self, refresh_seconds: float = 300):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._ids: Dict[str, array] = {}
+        self._loaded_at: Dict[str, float] = {}
+    
+    def needs_refresh(self, table: str) -> bool:
+        """Indica se a tabela nunca foi carregada ou se o cache expirou"""
+        loaded_at = self._loaded_at.get(table)
+        return loaded_at is None or time.time() - loaded_at >= self.refresh_seconds
     
-    def __init__(self, database_type: str = 'mysql'):
+    def replace(self, table: str, ids: Iterable[int]):
+        """Substitui todos os IDs conhecidos de uma tabela"""
+        values = array('q', ids)
+        with self._lock:
+            self._ids[table] = values
+            self._loaded_at[table] = time.time()
+    
+    def add(self, table: str, ids: Iterable[int]):
+        """Registra IDs recém-inseridos (ignorado se a tabela ainda não foi carregada)"""
+        with self._lock:
+            if table in self._ids:
+                self._ids[table].extend(ids)
+    
+    def discard(self, table: str, id_value: int):
+        """Remove um ID que não existe mais no banco"""
+        with self._lock:
+            values = self._ids.get(table)
+            if not values:
+                return
+            try:
+                index = values.index(id_value)
+            except ValueError:
+                return
+            values[index] = values[-1]
+            values.pop()
+    
+    def sample(self, table: str) -> Optional[int]:
+        """Sorteia um ID conhecido da tabela"""
+        with self._lock:
+            values = self._ids.get(table)
+            if not values:
+                return None
+            return values[random.randrange(len(values))]
+    
+    def sample_many(self, table: str, count: int, distinct: bool = False) -> List[int]:
+        """Sorteia ``count`` IDs conhecidos (sem repetição se ``distinct``, limitado ao tamanho do cache)"""
+        with self._lock:
+            values = self._ids.get(table)
+            if not values:
+                return []
+            if distinct:
+                indexes = random.sample(range(len(values)), min(count, len(values)))
+            else:
+                indexes = [random.randrange(len(values)) for _ in range(count)]
+            return [values[index] for index in indexes]
+    
+    def size(self, table: str) -> int:
+        """Quantidade de IDs conhecidos da tabela"""
+        return len(self._ids.get(table, ()))
+
+class ConnectionPool:
+    """Pool de conexões compartilhado pelos três bancos, com health check e reconexão"""
+    
+    # Variantes de conexão MySQL, tentadas em ordem até uma funcionar
+    MYSQL_VARIANTS = [
+        ('padrão', {}),
+        ('auth_plugin_map', {'auth_plugin_map': {'caching_sha2_password': 'mysql_native_password'}}),
+        ('ssl_disabled', {'ssl_disabled': True}),
+    ]
+    
+    # Índice da variante MySQL que funcionou (compartilhado por todos os pools)
+    _mysql_variant: Optional[int] = None
+    _mysql_variant_lock = threading.Lock()
+    
+    def __init__(self, database_type: str, min_size: int = 1, max_size: int = 5,
+                 ping_interval: float = 30, acquire_timeout: float = 30,
+                 connect_options: Dict[str, Any] = None):
         self.database_type = database_type
-        self.connection = None
-        
-        # Dados para simulação
-        self.sample_names = [
-            'Ana Costa', 'Bruno Lima', 'Carlos Pereira', 'Diana Silva', 'Eduardo Santos',
-            'Fernanda Oliveira', 'Gabriel Ferreira', 'Helena Rodrigues', 'Igor Almeida',
-            'Juliana Nascimento'
-        ]
-        
-        self.sample_products = [
-            ('Smartphone Samsung', 1200.00), ('iPhone 15', 5000.00), ('Tablet iPad', 3000.00),
-            ('Notebook Gamer', 4500.00), ('Headset Bluetooth', 250.00), ('Smartwatch', 800.00)
-        ]
-        
-        self.sample_messages = [
-            'Operação automática executada', 'Dados atualizados pelo sistema',
-            'Sincronização de dados realizada', 'Sistema operando normalmente'
-        ]
-        
-        # Dados para tabela generic
-        self.sample_generic_types = [
-            'config', 'settings', 'metadata', 'cache', 'session', 'temp'
-        ]
+        # Parâmetros extras do driver (ex.: local_infile no MySQL para LOAD DATA, ou
+        # 'database' para outro banco do mesmo servidor); sobrepõem DatabaseConfig
+        self.connect_options = connect_options or {}
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.ping_interval = ping_interval
+        self.acquire_timeout = acquire_timeout
+        self.reconnects = 0
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._cond = threading.Condition()
+        self._opened = False
+    
+    def _connect_mysql(self):
+        with ConnectionPool._mysql_variant_lock:
+            cached = ConnectionPool._mysql_variant
+        candidates = [cached] if cached is not None else range(len(self.MYSQL_VARIANTS))
         
-        self.sample_generic_keys = [
-            'user_preference', 'system_setting', 'app_config', 'session_data',
-            'cache_entry', 'temp_storage', 'metadata_info', 'sync_status'
-        ]
+        last_error = None
+        for index in candidates:
+            name, extra = self.MYSQL_VARIANTS[index]
+            mysql_config = DatabaseConfig.MYSQL.copy()
+            mysql_config.update(extra)
+            mysql_config.update(self.connect_options)
+            try:
+                connection = pymysql.connect(**mysql_config)
+            except Exception as e:
+                last_error = e
+                logging.warning(f"⚠️ Tentativa de conexão MySQL ({name}) falhou: {e}")
+                continue
+            with ConnectionPool._mysql_variant_lock:
+                ConnectionPool._mysql_variant = index
+            return connection
         
-        self.sample_generic_values = [
-            'enabled', 'disabled', 'active', 'inactive', 'pending', 'completed',
-            'processing', 'error', 'success', 'waiting', 'approved', 'rejected'
-        ]
+        # A variante em cache deixou de funcionar: na próxima vez tentar todas
+        with ConnectionPool._mysql_variant_lock:
+            ConnectionPool._mysql_variant = None
+        raise last_error
+    
+    def _open_sqlserver(self, database: str):
+        options = {name: value for name, value in self.connect_options.items() if name != 'database'}
+        return pymssql.connect(
+            server=DatabaseConfig.SQLSERVER['server'],
+            port=DatabaseConfig.SQLSERVER['port'],
+            user=DatabaseConfig.SQLSERVER['user'],
+            password=DatabaseConfig.SQLSERVER['password'],
+            database=database,
+            **options
+        )
+    
+    def _connect_sqlserver(self):
+        database = self.connect_options.get('database', DatabaseConfig.SQLSERVER['database'])
+        try:
+            return self._open_sqlserver(database)
+        except pymssql.OperationalError as e:
+            # Só na primeira vez, com o banco ainda inexistente (erro 4060): cria pelo master e reconecta
+            if 'Cannot open database' not in str(e) and '4060' not in str(e):
+                raise
         
-        # Controle de timer para operações a cada 30 segundos
-        self.last_generic_operation = time.time()
+        master = self._open_sqlserver('master')
+        try:
+            # CREATE DATABASE não pode rodar dentro de transação
+            master.autocommit(True)
+            cursor = master.cursor()
+            cursor.execute(f"IF DB_ID(N'{database}') IS NULL CREATE DATABASE [{database}]")
+            cursor.close()
+            logging.info(f"✅ Database {database} criado no SQL Server")
+        finally:
+            master.close()
+        return self._open_sqlserver(database)
     
-    def connect(self) -> bool:
-        """Estabelece conexão com o banco de dados"""
+    def create_connection(self):
+        """Abre uma nova conexão com o banco (fora do controle do pool)"""
+        if self.database_type == 'mysql':
+            return self._connect_mysql()
+        elif self.database_type == 'postgres':
+            return psycopg2.connect(**{**DatabaseConfig.POSTGRES, **self.connect_options})
+        elif self.database_type == 'sqlserver':
+            return self._connect_sqlserver()
+        raise ValueError(f"Tipo de banco inválido: {self.database_type}")
+    
+    def ping(self, connection) -> bool:
+        """Verifica se a conexão ainda está viva"""
         try:
             if self.database_type == 'mysql':
-                # Tentar conexão MySQL com configurações melhoradas
-                mysql_config = DatabaseConfig.MYSQL.copy()
-                
-                # Tentar diferentes configurações de autenticação
-                try:
-                    self.connection = pymysql.connect(**mysql_config)
-                except Exception as e1:
-                    logging.warning(f"⚠️ Primeira tentativa de conexão MySQL falhou: {e1}")
-                    
-                    # Tentar com auth_plugin_map para compatibilidade
-                    try:
-                        mysql_config['auth_plugin_map'] = {
-                            'caching_sha2_password': 'mysql_native_password'
-                        }
-                        self.connection = pymysql.connect(**mysql_config)
-                    except Exception as e2:
-                        logging.warning(f"⚠️ Segunda tentativa de conexão MySQL falhou: {e2}")
-                        
-                        # Tentar sem SSL
-                        mysql_config.pop('auth_plugin_map', None)
-                        mysql_config['ssl_disabled'] = True
-                        self.connection = pymysql.connect(**mysql_config)
-                        
-            elif self.database_type == 'postgres':
-                self.connection = psycopg2.connect(**DatabaseConfig.POSTGRES)
-            elif self.database_type == 'sqlserver':
-                # Conectar usando pymssql
-                self.connection = pymssql.connect(
-                    server=DatabaseConfig.SQLSERVER['server'],
-                    port=DatabaseConfig.SQLSERVER['port'],
-                    user=DatabaseConfig.SQLSERVER['user'],
-                    password=DatabaseConfig.SQLSERVER['password'],
-                    database=DatabaseConfig.SQLSERVER['database']
-                )
-                
-                # Criar/usar database testdb
-                cursor = self.connection.cursor()
-                try:
-                    cursor.execute("IF NOT EXISTS (SELECT name FROM sys.databases WHERE name = 'testdb') CREATE DATABASE testdb")
-                    self.connection.commit()
-                    cursor.execute("USE testdb")
-                    self.connection.commit()
-                    logging.info("✅ Database testdb preparado")
-                except Exception as e:
-                    logging.warning(f"⚠️ Aviso ao preparar database: {e}")
-                cursor.close()
-            
-            logging.info(f"✅ Conectado ao {self.database_type.upper()}")
+                connection.ping(reconnect=False)
+                return True
+            if self.database_type == 'postgres' and connection.closed:
+                return False
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
             return True
-            
-        except Exception as e:
-            logging.error(f"❌ Erro ao conectar com {self.database_type}: {e}")
-            return False
+        except Exception:
+            # No PostgreSQL uma transação abortada também falha, mas a conexão segue viva
+            return self.database_type == 'postgres' and not connection.closed
     
-    def disconnect(self):
-        """Fecha a conexão com o banco de dados"""
-        if self.connection:
-            self.connection.close()
-            logging.info(f"🔌 Desconectado do {self.database_type.upper()}")
+    def _close_quietly(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
     
-    def execute_query(self, query: str, params: tuple = None) -> Dict[str, Any]:
-        """Executa uma query no banco de dados"""
+    def open(self):
+        """Abre as ``min_size`` conexões iniciais"""
+        with self._cond:
+            if self._opened:
+                return
+            self._opened = True
+            missing = self.min_size - self._size
+            self._size += max(0, missing)
+        created = []
         try:
-            cursor = self.connection.cursor()
-            
-            if params:
-                cursor.execute(query, params)
+            for _ in range(max(0, missing)):
+                created.append((self.create_connection(), time.monotonic()))
+        except Exception:
+            with self._cond:
+                self._size -= missing - len(created)
+                self._idle.extend(created)
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._idle.extend(created)
+            self._cond.notify_all()
+    
+    def acquire(self):
+        """Entrega uma conexão viva, criando uma nova se houver espaço no pool"""
+        self.open()
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    connection, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    connection, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Nenhuma conexão livre no pool {self.database_type} após {self.acquire_timeout}s")
+                self._cond.wait(remaining)
+        
+        if connection is not None and time.monotonic() - last_used >= self.ping_interval:
+            if self.ping(connection):
+                try:
+                    connection.rollback()
+                except Exception:
+                    pass
             else:
-                cursor.execute(query)
-            
-            result = {
-                'success': True,
-                'rowcount': cursor.rowcount if hasattr(cursor, 'rowcount') else 0
-            }
-            
-            self.connection.commit()
-            cursor.close()
-            
-            return result
-            
-        except Exception as e:
-            logging.error(f"❌ Erro ao executar query: {e}")
+                logging.warning(f"⚠️ Conexão ociosa com {self.database_type} perdida; reconectando")
+                self._close_quietly(connection)
+                connection = None
+                self.reconnects += 1
+        
+        if connection is None:
             try:
-                self.connection.rollback()
-            except:
-                pass
-            return {'success': False, 'error': str(e)}
+                connection = self.create_connection()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+        return connection
     
-    def get_random_existing_id(self, table: str, id_column: str = 'id') -> int:
-        """Obtém um ID aleatório existente de uma tabela"""
-        try:
-            cursor = self.connection.cursor()
-            
-            if self.database_type == 'postgres':
-                cursor.execute(f"SELECT {id_column} FROM {table} ORDER BY RANDOM() LIMIT 1")
-            elif self.database_type == 'sqlserver':
-                cursor.execute(f"SELECT TOP 1 {id_column} FROM {table} ORDER BY NEWID()")
-            else:  # MySQL
-                cursor.execute(f"SELECT {id_column} FROM {table} ORDER BY RAND() LIMIT 1")
-                
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else None
-        except Exception as e:
-            logging.error(f"❌ Erro ao buscar ID aleatório: {e}")
-            return None
+    def release(self, connection):
+        """Devolve a conexão ao pool"""
+        with self._cond:
+            self._idle.append((connection, time.monotonic()))
+            self._cond.notify()
     
-    def check_tables_exist(self) -> bool:
-        """Verifica se as tabelas existem e as cria se necessário"""
+    def replace(self, connection):
+        """Descarta uma conexão quebrada e devolve uma nova no lugar dela"""
+        self._close_quietly(connection)
+        self.reconnects += 1
         try:
-            cursor = self.connection.cursor()
-            
-            if self.database_type == 'sqlserver':
-                # SQL Server - Verificar se as tabelas existem
-                cursor.execute("""
-                    IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='clientes' AND xtype='U')
-                    CREATE TABLE clientes (
-                        id INT IDENTITY(1,1) PRIMARY KEY,
-                        nome NVARCHAR(100) NOT NULL,
-                        email NVARCHAR(100),
-                        created_at DATETIME2 DEFAULT GETDATE(),
-                        updated_at DATETIME2 DEFAULT GETDATE()
-                    )
-                """)
-                
-                cursor.execute("""
-                    IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='produtos' AND xtype='U')
-                    CREATE TABLE produtos (
-                        id INT IDENTITY(1,1) PRIMARY KEY,
-                        nome NVARCHAR(100) NOT NULL,
-                        preco DECIMAL(10,2) NOT NULL,
-                        created_at DATETIME2 DEFAULT GETDATE(),
-                        updated_at DATETIME2 DEFAULT GETDATE()
-                    )
-                """)
-                
-                cursor.execute("""
-                    IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='logs' AND xtype='U')
-                    CREATE TABLE logs (
-                        id INT IDENTITY(1,1) PRIMARY KEY,
-                        timestamp DATETIME2 DEFAULT GETDATE(),
-                        mensagem NVARCHAR(255),
-                        created_at DATETIME2 DEFAULT GETDATE(),
-                        updated_at DATETIME2 DEFAULT GETDATE()
-                    )
-                """)
-                
-                cursor.execute("""
-                    IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='generic' AND xtype='U')
-                    CREATE TABLE generic (
-                        id INT IDENTITY(1,1) PRIMARY KEY,
-                        tipo NVARCHAR(50) NOT NULL,
-                        chave NVARCHAR(100) NOT NULL,
-                        valor NVARCHAR(MAX),
-                        metadata NVARCHAR(MAX),
-                        created_at DATETIME2 DEFAULT GETDATE(),
-                        updated_at DATETIME2 DEFAULT GETDATE()
-                    )
-                """)
-                
-                self.connection.commit()
-                logging.info("✅ Tabelas verificadas/criadas no SQL Server (incluindo tabela generic)")
-                
-            elif self.database_type == 'mysql':
-                # MySQL - Criar tabelas se não existirem
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS clientes (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        nome VARCHAR(100) NOT NULL,
-                        email VARCHAR(100),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                    ) ENGINE=InnoDB
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS produtos (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        nome VARCHAR(100) NOT NULL,
-                        preco DECIMAL(10,2) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                    ) ENGINE=InnoDB
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS logs (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        mensagem VARCHAR(255),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                    ) ENGINE=InnoDB
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS generic (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        tipo VARCHAR(50) NOT NULL,
-                        chave VARCHAR(100) NOT NULL,
-                        valor TEXT,
-                        metadata TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                    ) ENGINE=InnoDB
-                """)
-                
-                self.connection.commit()
-                logging.info("✅ Tabelas verificadas/criadas no MySQL (incluindo tabela generic)")
-                
-            elif self.database_type == 'postgres':
-                # PostgreSQL - Criar tabelas se não existirem
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS clientes (
-                        id SERIAL PRIMARY KEY,
-                        nome VARCHAR(100) NOT NULL,
-                        email VARCHAR(100),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS produtos (
-                        id SERIAL PRIMARY KEY,
-                        nome VARCHAR(100) NOT NULL,
-                        preco DECIMAL(10,2) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS logs (
-                        id SERIAL PRIMARY KEY,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        mensagem VARCHAR(255),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS generic (
-                        id SERIAL PRIMARY KEY,
-                        tipo VARCHAR(50) NOT NULL,
-                        chave VARCHAR(100) NOT NULL,
-                        valor TEXT,
-                        metadata TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                self.connection.commit()
-                logging.info("✅ Tabelas verificadas/criadas no PostgreSQL (incluindo tabela generic)")
-            
-            cursor.close()
+            return self.create_connection()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+    
+    def close(self):
+        """Fecha todas as conexões ociosas"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._opened = False
+        for connection, _ in idle:
+            self._close_quietly(connection)
+    
+    def stats(self) -> Dict[str, int]:
+        """Uso atual do pool"""
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size,
+                'reconnects': self.reconnects
+            }
+
+class CommitPolicy:
+    """Política de COMMIT das escritas: statement, count:N, interval:MS ou cycle"""
+    
+    MODES = ('statement', 'count', 'interval', 'cycle')
+    
+    def __init__(self, mode: str = 'statement', every_n: int = 100, interval_ms: float = 100):
+        if mode not in self.MODES:
+            raise ValueError(f"Política de commit inválida: {mode}. Use: {', '.join(self.MODES)}")
+        self.mode = mode
+        self.every_n = max(1, every_n)
+        self.interval_ms = interval_ms
+    
+    @classmethod
+    def parse(cls, spec: str) -> 'CommitPolicy':
+        """Interpreta 'statement', 'count:N', 'interval:MS' ou 'cycle'"""
+        mode, separator, value = spec.partition(':')
+        if mode in ('count', 'interval'):
+            try:
+                number = int(value or 100) if mode == 'count' else float(value or 100)
+            except ValueError:
+                number = 0
+            if not (number > 0 and math.isfinite(number)):
+                raise ValueError(f"Política de commit inválida: {spec}. Use {mode}:N com N > 0")
+            return cls(mode, every_n=number) if mode == 'count' else cls(mode, interval_ms=number)
+        if separator and mode in cls.MODES:
+            raise ValueError(f"Política de commit inválida: {spec}. {mode} não aceita valor")
+        return cls(mode)
+    
+    def should_commit(self, pending: int, pending_since: float) -> bool:
+        """Indica se a transação aberta deve ser confirmada após uma escrita"""
+        if self.mode == 'statement':
             return True
-            
-        except Exception as e:
-            logging.error(f"❌ Erro ao verificar/criar tabelas: {e}")
+        if self.mode == 'count':
+            return pending >= self.every_n
+        if self.mode == 'interval':
+            return (time.monotonic() - pending_since) * 1000 >= self.interval_ms
+        return False  # cycle: confirmada em end_cycle()
+    
+    def __str__(self) -> str:
+        if self.mode == 'count':
+            return f"count:{self.every_n}"
+        if self.mode == 'interval':
+            return f"interval:{self.interval_ms:g}"
+        return self.mode
+
+class CsvStream(io.RawIOBase):
+    """Arquivo somente leitura que gera CSV sob demanda a partir de um iterador de linhas"""
+    
+    def __init__(self, rows: Iterable[Tuple], rows_per_read: int = 1000):
+        self._rows = iter(rows)
+        self._rows_per_read = rows_per_read
+        self._buffer = bytearray()
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, lineterminator='\n')
+        self.rows = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def _fill(self) -> bool:
+        chunk = list(itertools.islice(self._rows, self._rows_per_read))
+        if not chunk:
             return False
+        self._text.seek(0)
+        self._text.truncate()
+        self._writer.writerows(chunk)
+        self._buffer += self._text.getvalue().encode('utf-8')
+        self.rows += len(chunk)
+        return True
     
-    def insert_cliente(self) -> bool:
-        """Insere um novo cliente"""
-        nome = random.choice(self.sample_names)
-        email = f"{nome.lower().replace(' ', '.')}_{random.randint(1000, 9999)}@email.com"
-        
-        if self.database_type == 'sqlserver':
-            query = "INSERT INTO clientes (nome, email) VALUES (%s, %s)"
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self._buffer) < size) and self._fill():
+            pass
+        if size < 0:
+            data, self._buffer = bytes(self._buffer), bytearray()
         else:
-            query = "INSERT INTO clientes (nome, email) VALUES (%s, %s)"
-        
-        result = self.execute_query(query, (nome, email))
-        
-        if result['success']:
-            logging.info(f"➕ Cliente inserido: {nome} ({email})")
-            return True
-        return False
+            # bytearray: remover do início não copia o restante do buffer a cada leitura
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+class LatencyHistogram:
+    """Histograma de latências log-linear no estilo HDR (erro relativo < 1/256)"""
     
-    def update_cliente(self) -> bool:
-        """Atualiza um cliente existente"""
-        cliente_id = self.get_random_existing_id('clientes')
-        if not cliente_id:
-            return False
-        
-        novo_nome = random.choice(self.sample_names) + " (Atualizado)"
-        
-        query = "UPDATE clientes SET nome = %s WHERE id = %s"
-        result = self.execute_query(query, (novo_nome, cliente_id))
-        
-        if result['success'] and result['rowcount'] > 0:
-            logging.info(f"🔄 Cliente atualizado: ID {cliente_id} -> {novo_nome}")
-            return True
-        return False
+    SUB_BUCKET_BITS = 9
     
-    def insert_produto(self) -> bool:
-        """Insere um novo produto"""
-        nome, preco_base = random.choice(self.sample_products)
-        preco = round(preco_base * random.uniform(0.8, 1.2), 2)
-        
-        query = "INSERT INTO produtos (nome, preco) VALUES (%s, %s)"
-        result = self.execute_query(query, (nome, preco))
-        
-        if result['success']:
-            logging.info(f"➕ Produto inserido: {nome} (R$ {preco})")
-            return True
-        return False
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
     
-    def update_produto(self) -> bool:
-        """Atualiza um produto existente"""
-        produto_id = self.get_random_existing_id('produtos')
-        if not produto_id:
-            return False
-        
-        variacao = random.uniform(0.9, 1.15)
-        query = "UPDATE produtos SET preco = preco * %s WHERE id = %s"
-        result = self.execute_query(query, (variacao, produto_id))
-        
-        if result['success'] and result['rowcount'] > 0:
-            logging.info(f"🔄 Produto atualizado: ID {produto_id} (preço ajustado em {(variacao-1)*100:.1f}%)")
-            return True
-        return False
+    @classmethod
+    def _index(cls, value: int) -> int:
+        shift = max(0, value.bit_length() - cls.SUB_BUCKET_BITS)
+        return (shift << cls.SUB_BUCKET_BITS) | (value >> shift)
     
-    def insert_log(self) -> bool:
-        """Insere uma entrada no log"""
-        mensagem = random.choice(self.sample_messages)
-        
-        query = "INSERT INTO logs (mensagem) VALUES (%s)"
-        result = self.execute_query(query, (mensagem,))
-        
-        if result['success']:
-            logging.info(f"📝 Log inserido: {mensagem}")
-            return True
-        return False
+    @classmethod
+    def _highest_value(cls, index: int) -> int:
+        """Maior valor (µs) equivalente ao bucket"""
+        shift = index >> cls.SUB_BUCKET_BITS
+        sub_bucket = index & ((1 << cls.SUB_BUCKET_BITS) - 1)
+        return ((sub_bucket + 1) << shift) - 1
     
-    def insert_generic(self) -> bool:
-        """Insere um novo registro na tabela generic"""
-        tipo = random.choice(self.sample_generic_types)
-        chave = random.choice(self.sample_generic_keys)
-        valor = random.choice(self.sample_generic_values)
-        
-        # Gerar metadata JSON-like
-        metadata = f'{{"timestamp": "{datetime.datetime.now().isoformat()}", "source": "auto-system", "version": "{random.randint(1, 10)}.{random.randint(0, 9)}"}}'
-        
-        query = "INSERT INTO generic (tipo, chave, valor, metadata) VALUES (%s, %s, %s, %s)"
-        result = self.execute_query(query, (tipo, chave, valor, metadata))
-        
-        if result['success']:
-            logging.info(f"🔧 Generic inserido: {tipo} -> {chave} = {valor}")
-            return True
-        return False
+    def record(self, seconds: float):
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if not self.count or value < self.min_us:
+            self.min_us = value
+        self.max_us = max(self.max_us, value)
+        self.count += 1
+        self.total_us += value
     
-    def update_generic(self) -> bool:
-        """Atualiza um registro existente na tabela generic"""
-        generic_id = self.get_random_existing_id('generic')
-        if not generic_id:
-            return False
-        
-        novo_valor = random.choice(self.sample_generic_values)
-        novo_metadata = f'{{"timestamp": "{datetime.datetime.now().isoformat()}", "source": "auto-update", "operation": "scheduled_update"}}'
-        
-        if self.database_type == 'sqlserver':
-            query = "UPDATE generic SET valor = %s, metadata = %s, updated_at = GETDATE() WHERE id = %s"
-        elif self.database_type == 'mysql':
-            query = "UPDATE generic SET valor = %s, metadata = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s"
-        elif self.database_type == 'postgres':
-            query = "UPDATE generic SET valor = %s, metadata = %s, updated_at = CURRENT_TIMESTAMP WHERE id = %s"
-        
-        result = self.execute_query(query, (novo_valor, novo_metadata, generic_id))
-        
-        if result['success'] and result['rowcount'] > 0:
-            logging.info(f"🔧 Generic atualizado: ID {generic_id} -> {novo_valor}")
-            return True
-        return False
+    def count_at_or_below(self, value_us: int) -> int:
+        """Amostras em buckets cujo maior valor equivalente é <= ``value_us``"""
+        return sum(count for index, count in self.counts.items() if self._highest_value(index) <= value_us)
     
-    def should_execute_generic_operations(self) -> bool:
-        """Verifica se deve executar operações na tabela generic (a cada 30 segundos)"""
-        current_time = time.time()
-        if current_time - self.last_generic_operation >= 30:
-            self.last_generic_operation = current_time
-            return True
-        return False
+    def merge(self, other: 'LatencyHistogram'):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count and (not self.count or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
     
-    def execute_generic_operations_cycle(self):
-        """Executa operações específicas na tabela generic"""
-        logging.info("⏰ Executando ciclo especial da tabela GENERIC (30s)")
-        
-        operations = [
-            ('INSERT Generic', self.insert_generic),
-            ('UPDATE Generic', self.update_generic)
-        ]
-        
-        # Executar 1-2 operações na tabela generic
-        num_operations = random.randint(1, 2)
-        selected_operations = random.sample(operations, num_operations)
-        
-        success_count = 0
-        for operation_name, operation_func in selected_operations:
-            try:
-                if operation_func():
-                    success_count += 1
-                time.sleep(0.5)  # Pequena pausa entre operações
-            except Exception as e:
-                logging.error(f"❌ Erro na operação {operation_name}: {e}")
-        
-        logging.info(f"🔧 Ciclo GENERIC concluído: {success_count}/{len(selected_operations)} operações executadas")
+    def percentile(self, fraction: float) -> float:
+        """Percentil em milissegundos (``fraction`` entre 0 e 1)"""
+        if not self.count:
+            return 0.0
+        target = min(self.count, max(1, math.ceil(fraction * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max_us) / 1000
+        return self.max_us / 1000
     
-    def execute_operations_cycle(self):
-        """Executa um ciclo completo de operações"""
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean_ms': self.total_us / self.count / 1000,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_us / 1000,
+        }
+
+class OperationMetrics:
+    """Latência e contadores por (banco, tabela, operação), acumulados e por intervalo"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (banco, tabela, operação) -> [histograma, sucessos, erros]
+        self._total: Dict[Tuple[str, str, str], list] = {}
+        self._interval: Dict[Tuple[str, str, str], list] = {}
+        self._interval_start = time.monotonic()
+    
+    @staticmethod
+    def _add(series: Dict[Tuple[str, str, str], list], key: Tuple[str, str, str],
+             histogram: LatencyHistogram, ok: int, errors: int):
+        entry = series.get(key)
+        if entry is None:
+            entry = series[key] = [LatencyHistogram(), 0, 0]
+        entry[0].merge(histogram)
+        entry[1] += ok
+        entry[2] += errors
+    
+    def record(self, engine: str, table: str, operation: str, seconds: float, success: bool):
+        key = (engine, table, operation)
+        with self._lock:
+            for series in (self._total, self._interval):
+                entry = series.get(key)
+                if entry is None:
+                    entry = series[key] = [LatencyHistogram(), 0, 0]
+                entry[0].record(seconds)
+                entry[1 if success else 2] += 1
+    
+    def snapshot(self) -> Dict[Tuple[str, str, str], list]:
+        """Cópia do acumulado (serializável, para enviar entre processos)"""
+        with self._lock:
+            copy = {}
+            for key, (histogram, ok, errors) in self._total.items():
+                self._add(copy, key, histogram, ok, errors)
+            return copy
+    
+    def merge(self, snapshot: Dict[Tuple[str, str, str], list]):
+        with self._lock:
+            for key, (histogram, ok, errors) in snapshot.items():
+                self._add(self._total, key, histogram, ok, errors)
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Acumulado por rótulo 'banco/tabela/operação': contadores e percentis"""
+        result = {}
+        for key, (histogram, ok, errors) in sorted(self.snapshot().items()):
+            result['/'.join(key)] = dict(histogram.summary(), ok=ok, errors=errors)
+        return result
+    
+    @staticmethod
+    def _log_series(series: Dict[Tuple[str, str, str], list], elapsed: float):
+        for (engine, table, operation), (histogram, ok, errors) in sorted(series.items()):
+            rate = histogram.count / elapsed if elapsed > 0 else 0.0
+            logging.info(
+                f"   {engine:<10} {table:<13} {operation:<10} n={histogram.count:<7} erros={errors:<5} "
+                f"{rate:>8.1f}/s  p50={histogram.percentile(0.50):.2f}ms p95={histogram.percentile(0.95):.2f}ms "
+                f"p99={histogram.percentile(0.99):.2f}ms max={histogram.max_us / 1000:.2f}ms"
+            )
+    
+    def log_interval(self):
+        """Resumo periódico: operações desde o último resumo, e zera o parcial"""
+        with self._lock:
+            series, self._interval = self._interval, {}
+            now = time.monotonic()
+            elapsed, self._interval_start = now - self._interval_start, now
+        if series:
+            logging.info(f"⏱️ Latência por operação (últimos {elapsed:.0f}s):")
+            self._log_series(series, elapsed)
+    
+    def log_report(self, elapsed: float, title: str = "Latência por operação"):
+        """Relatório final com o acumulado da execução"""
+        series = self.snapshot()
+        if series:
+            logging.info(f"⏱️ {title} (execução completa):")
+            self._log_series(series, elapsed)
+
+def timed_operation(operation: str, table: str = None):
+    """Decorador de métodos do DataManager: mede a chamada em self.metrics"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            result = None
+            try:
+                result = method(self, *args, **kwargs)
+                return result
+            finally:
+                self.metrics.record(self.database_type, table or args[0], operation,
+                                    time.perf_counter() - start, bool(result))
+        return wrapper
+    return decorator
+
+class TraceRecorder:
+    """Gravação do trace de uma carga em JSONL (compactado com gzip se o nome terminar em .gz)"""
+    
+    VERSION = 1
+    
+    def __init__(self, path: str, **header):
+        self.path = path
+        self._file = gzip.open(path, 'wt', encoding='utf-8') if path.endswith('.gz') else open(path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.events = 0
+        self._write(dict(header, trace=self.VERSION, created=datetime.datetime.now().isoformat(timespec='seconds')))
+    
+    def _write(self, item: Dict[str, Any]):
+        self._file.write(json.dumps(item, separators=(',', ':'), ensure_ascii=False, default=str) + '\n')
+    
+    def record(self, worker: int, operation: str, table: Optional[str], params: Dict[str, Any]):
+        with self._lock:
+            event = {'t': round(time.monotonic() - self._start, 6), 'w': worker, 'op': operation}
+            if table:
+                event['table'] = table
+            if params:
+                event['params'] = params
+            self._write(event)
+            self.events += 1
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+        logging.info(f"💾 Trace gravado em {self.path}: {self.events} operações")
+    
+    @staticmethod
+    def _open(path: str):
+        return gzip.open(path, 'rt', encoding='utf-8') if path.endswith('.gz') else open(path, encoding='utf-8')
+    
+    @staticmethod
+    def read_header(path: str) -> Dict[str, Any]:
+        """Cabeçalho de um trace gravado"""
+        with TraceRecorder._open(path) as trace_file:
+            header = json.loads(trace_file.readline() or '{}')
+        if header.get('trace') != TraceRecorder.VERSION:
+            raise ValueError(f"Formato de trace não suportado em {path}")
+        return header
+    
+    @staticmethod
+    def read_events(path: str) -> Iterable[Dict[str, Any]]:
+        """Eventos de um trace gravado, lidos em fluxo"""
+        with TraceRecorder._open(path) as trace_file:
+            trace_file.readline()
+            for line in trace_file:
+                if line.strip():
+                    yield json.loads(line)
+
+class RowGenerator:
+    """Gerador de linhas sintéticas em lotes (vetorizado com NumPy, se instalado)"""
+    
+    TABLE_COLUMNS = {
+        'clientes': ('nome', 'email'),
+        'produtos': ('nome', 'preco'),
+        'logs': ('mensagem',),
+        'generic': ('tipo', 'chave', 'valor', 'metadata'),
+        'pedidos': ('cliente_id', 'data_pedido'),
+        'itens_pedido': ('pedido_id', 'produto_id', 'quantidade'),
+    }
+    
+    def __init__(self, samples, database_type: str = 'mysql', seed: int = None):
+        self.samples = samples
+        self.database_type = database_type
+        # Sem semente própria, deriva do módulo random (reprodutível com random.seed)
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.random = random.Random(seed)
+        self.np_random = np.random.default_rng(seed) if np is not None else None
+        
+        # E-mails únicos: marca por gerador + sequência. A marca vem do sistema, não
+        # da semente, para que execuções com a mesma semente não colidam no UNIQUE
+        self._email_tag = os.urandom(4).hex()
+        self._email_seq = 0
+        self._slugs = {name: name.lower().replace(' ', '.') for name in samples.sample_names}
+        self._object_arrays: Dict[int, Any] = {}
+        self._generic_table = None
+    
+    @property
+    def generic_table(self) -> 'GenericTableGenerator':
+        """Gerador das linhas largas da generic_table (criado no primeiro uso)"""
+        if self._generic_table is None:
+            self._generic_table = GenericTableGenerator(self)
+        return self._generic_table
+    
+    def columns(self, table: str) -> Sequence[str]:
+        if table == 'generic_table':
+            return self.generic_table.columns
+        return self.TABLE_COLUMNS[table]
+    
+    # Primitivas vetorizadas (NumPy) com alternativa em Python puro
+    
+    def _choice(self, values: Sequence, size: int) -> list:
+        if self.np_random is None:
+            return self.random.choices(values, k=size)
+        array_values = self._object_arrays.get(id(values))
+        if array_values is None:
+            array_values = np.empty(len(values), dtype=object)
+            array_values[:] = list(values)
+            self._object_arrays[id(values)] = array_values
+        return array_values[self.np_random.integers(0, len(values), size)].tolist()
+    
+    def _choice_ids(self, ids: array, size: int) -> list:
+        if self.np_random is None:
+            return [ids[self.random.randrange(len(ids))] for _ in range(size)]
+        return np.frombuffer(ids, dtype=np.int64)[self.np_random.integers(0, len(ids), size)].tolist()
+    
+    def _integers(self, low: int, high: int, size: int) -> list:
+        """Inteiros em [low, high)"""
+        if self.np_random is None:
+            return [self.random.randrange(low, high) for _ in range(size)]
+        return self.np_random.integers(low, high, size, dtype=np.int64).tolist()
+    
+    def _uniform(self, low: float, high: float, size: int, decimals: int = None) -> list:
+        if self.np_random is None:
+            values = [self.random.uniform(low, high) for _ in range(size)]
+            return [round(value, decimals) for value in values] if decimals is not None else values
+        values = self.np_random.uniform(low, high, size)
+        return (np.round(values, decimals) if decimals is not None else values).tolist()
+    
+    def _dates_before(self, reference: datetime.date, max_days: int, size: int) -> list:
+        if self.np_random is None:
+            return [reference - datetime.timedelta(days=self.random.randint(0, max_days)) for _ in range(size)]
+        offsets = self.np_random.integers(0, max_days + 1, size).astype('timedelta64[D]')
+        return (np.datetime64(reference, 'D') - offsets).astype(object).tolist()
+    
+    def _datetimes_before(self, reference: datetime.datetime, max_seconds: int, size: int) -> list:
+        if self.np_random is None:
+            return [reference - datetime.timedelta(seconds=self.random.randint(0, max_seconds)) for _ in range(size)]
+        offsets = self.np_random.integers(0, max_seconds + 1, size).astype('timedelta64[s]')
+        return (np.datetime64(reference, 's') - offsets).astype(object).tolist()
+    
+    # Colunas por tabela
+    
+    def _clientes(self, size: int) -> List[list]:
+        nomes = self._choice(self.samples.sample_names, size)
+        start, self._email_seq = self._email_seq, self._email_seq + size
+        emails = [f"{self._slugs[nome]}.{self._email_tag}{start + i}@email.com" for i, nome in enumerate(nomes)]
+        return [nomes, emails]
+    
+    def _produtos(self, size: int) -> List[list]:
+        products = self.samples.sample_products
+        if self.np_random is None:
+            chosen = self.random.choices(products, k=size)
+            return [[nome for nome, _ in chosen],
+                    [round(preco * self.random.uniform(0.8, 1.2), 2) for _, preco in chosen]]
+        index = self.np_random.integers(0, len(products), size)
+        bases = np.array([preco for _, preco in products])[index]
+        precos = np.round(bases * self.np_random.uniform(0.8, 1.2, size), 2).tolist()
+        nomes = [products[i][0] for i in index.tolist()]
+        return [nomes, precos]
+    
+    def _logs(self, size: int) -> List[list]:
+        return [self._choice(self.samples.sample_messages, size)]
+    
+    def _generic(self, size: int) -> List[list]:
+        timestamp = datetime.datetime.now().isoformat()
+        majors = self._integers(1, 11, size)
+        minors = self._integers(0, 10, size)
+        metadata = [
+            f'{{"timestamp": "{timestamp}", "source": "auto-system", "version": "{major}.{minor}"}}'
+            for major, minor in zip(majors, minors)
+        ]
+        return [
+            self._choice(self.samples.sample_generic_types, size),
+            self._choice(self.samples.sample_generic_keys, size),
+            self._choice(self.samples.sample_generic_values, size),
+            metadata
+        ]
+    
+    def _pedidos(self, size: int, cliente_ids: array) -> List[list]:
+        return [self._choice_ids(cliente_ids, size),
+                self._dates_before(datetime.date.today(), 730, size)]
+    
+    def _itens_pedido(self, pedido_ids: Sequence[int], produto_ids: array, per_order: int) -> List[list]:
+        """Itens com produtos distintos por pedido (PK composta pedido_id, produto_id)"""
+        per_order = min(per_order, len(produto_ids))
+        orders = len(pedido_ids)
+        if self.np_random is None:
+            pedidos, produtos = [], []
+            for pedido_id in pedido_ids:
+                pedidos.extend([pedido_id] * per_order)
+                produtos.extend(self.random.sample(produto_ids, per_order))
+        else:
+            # Posições início + j*passo (mod N), com passo <= N/per_order: distintas por pedido
+            total_produtos = len(produto_ids)
+            starts = self.np_random.integers(0, total_produtos, orders)
+            steps = self.np_random.integers(1, max(1, total_produtos // per_order) + 1, orders)
+            positions = (starts[:, None] + steps[:, None] * np.arange(per_order)) % total_produtos
+            produtos = np.frombuffer(produto_ids, dtype=np.int64)[positions.ravel()].tolist()
+            pedidos = np.repeat(np.asarray(pedido_ids, dtype=np.int64), per_order).tolist()
+        return [pedidos, produtos, self._integers(1, 11, len(pedidos))]
+    
+    def column_batch(self, table: str, size: int, cliente_ids: array = None) -> List[list]:
+        """Um lote de ``size`` linhas da tabela, em colunas (uma lista por coluna)"""
+        if table == 'clientes':
+            return self._clientes(size)
+        if table == 'produtos':
+            return self._produtos(size)
+        if table == 'logs':
+            return self._logs(size)
+        if table == 'generic':
+            return self._generic(size)
+        if table == 'pedidos':
+            return self._pedidos(size, cliente_ids)
+        if table == 'generic_table':
+            return self.generic_table.column_batch(size)
+        raise ValueError(f"Tabela sem gerador por tamanho: {table}")
+    
+    def batch(self, table: str, size: int, **refs) -> List[Tuple]:
+        """Um lote de ``size`` linhas da tabela, como tuplas"""
+        return list(zip(*self.column_batch(table, size, **refs)))
+    
+    def batches(self, table: str, total: int, batch_size: int = 10000, **refs) -> Iterable[List[Tuple]]:
+        """Gera ``total`` linhas em lotes de até ``batch_size``"""
+        for start in range(0, total, batch_size):
+            yield self.batch(table, min(batch_size, total - start), **refs)
+    
+    def itens_pedido_batches(self, pedido_ids: Sequence[int], produto_ids: array, per_order: int,
+                             batch_size: int = 10000) -> Iterable[List[Tuple]]:
+        """Itens para cada pedido de ``pedido_ids``, em lotes de ~``batch_size`` linhas"""
+        orders_per_batch = max(1, batch_size // max(1, per_order))
+        for start in range(0, len(pedido_ids), orders_per_batch):
+            chunk = pedido_ids[start:start + orders_per_batch]
+            yield list(zip(*self._itens_pedido(chunk, produto_ids, per_order)))
+    
+    @staticmethod
+    def rows(batches: Iterable[List[Tuple]]) -> Iterable[Tuple]:
+        """Achata um fluxo de lotes em um fluxo de linhas"""
+        return itertools.chain.from_iterable(batches)
+
+class GenericTableGenerator:
+    """Linhas da generic_table com valores válidos para todos os tipos de cada banco"""
+    
+    DEFAULT_BLOB_SIZE = 1024
+    
+    # Preenchidos pelo próprio banco
+    DATABASE_COLUMNS = {'id', 'created_at', 'updated_at'}
+    DATABASE_TYPES = {'SERIAL', 'BIGSERIAL', 'SMALLSERIAL', 'ROWVERSION'}
+    
+    # Coluna: nome, tipo (com UNSIGNED/PRECISION/VARYING), argumentos entre parênteses e sufixo de array
+    COLUMN_PATTERN = re.compile(
+        r"^\s*(\w+)\s+([A-Za-z]\w*(?:\s+(?:PRECISION|VARYING))?)\s*(\([^)]*\))?\s*(UNSIGNED\b)?\s*(\[\])?",
+        re.IGNORECASE
+    )
+    CONSTRAINT_KEYWORDS = {'CONSTRAINT', 'PRIMARY', 'FOREIGN', 'UNIQUE', 'KEY', 'INDEX', 'CHECK'}
+    
+    # Faixas [mínimo, máximo) dos inteiros
+    INTEGER_RANGES = {
+        'TINYINT': (-2**7, 2**7), 'SMALLINT': (-2**15, 2**15), 'MEDIUMINT': (-2**23, 2**23),
+        'INT': (-2**31, 2**31), 'INTEGER': (-2**31, 2**31), 'BIGINT': (-2**63, 2**63 - 1),
+        'TINYINT UNSIGNED': (0, 2**8), 'SMALLINT UNSIGNED': (0, 2**16), 'MEDIUMINT UNSIGNED': (0, 2**24),
+        'INT UNSIGNED': (0, 2**32), 'BIGINT UNSIGNED': (0, 2**63 - 1),
+        'OID': (0, 2**32), 'YEAR': (1901, 2156),
+    }
+    
+    # Capacidade (bytes) dos binários sem tamanho declarado
+    BLOB_LIMITS = {'BLOB': 2**16 - 1, 'MEDIUMBLOB': 2**24 - 1, 'LONGBLOB': 2**32 - 1,
+                   'BYTEA': 2**30 - 1, 'IMAGE': 2**31 - 1}
+    
+    # Mesmo nome, significado diferente por banco
+    DIALECT_TYPES = {
+        ('sqlserver', 'TINYINT'): 'TINYINT UNSIGNED',
+        ('sqlserver', 'BIT'): 'BOOLEAN',
+        ('postgres', 'BIT'): 'BIT STRING',
+        ('postgres', 'BIT VARYING'): 'BIT STRING',
+        ('postgres', 'POINT'): 'PG POINT',
+        ('postgres', 'POLYGON'): 'PG POLYGON',
+    }
+    
+    # Tipo -> método que gera ``size`` valores
+    GENERATORS = {
+        **{name: '_integers' for name in INTEGER_RANGES},
+        'DECIMAL': '_decimals', 'NUMERIC': '_decimals',
+        'REAL': '_floats', 'FLOAT': '_floats', 'DOUBLE': '_floats', 'DOUBLE PRECISION': '_floats',
+        'MONEY': '_money', 'SMALLMONEY': '_money',
+        'CHAR': '_short_texts', 'NCHAR': '_short_texts', 'VARCHAR': '_short_texts',
+        'NVARCHAR': '_short_texts', 'NAME': '_short_texts', 'TSVECTOR': '_short_texts', 'TSQUERY': '_short_texts',
+        'TEXT': '_long_texts', 'NTEXT': '_long_texts', 'MEDIUMTEXT': '_long_texts', 'LONGTEXT': '_long_texts',
+        'DATE': '_dates', 'TIME': '_times', 'TIMETZ': '_times',
+        'DATETIME': '_datetimes', 'DATETIME2': '_datetimes', 'SMALLDATETIME': '_datetimes', 'TIMESTAMP': '_datetimes',
+        'TIMESTAMPTZ': '_datetimes', 'DATETIMEOFFSET': '_datetimes', 'INTERVAL': '_intervals',
+        'BOOLEAN': '_booleans', 'BIT': '_bit_integers', 'BIT STRING': '_bit_strings',
+        'BINARY': '_binaries', 'VARBINARY': '_binaries',
+        **{name: '_binaries' for name in BLOB_LIMITS},
+        'UUID': '_uuids', 'UNIQUEIDENTIFIER': '_uuids',
+        'JSON': '_json', 'JSONB': '_json', 'XML': '_xml', 'SQL_VARIANT': '_variants', 'HIERARCHYID': '_hierarchy_ids',
+        'ENUM': '_enums', 'SET': '_sets',
+        'INET': '_inets', 'CIDR': '_inets', 'MACADDR': '_macaddrs', 'MACADDR8': '_macaddrs',
+        'INTEGER[]': '_integer_arrays', 'TEXT[]': '_text_arrays',
+        'PG POINT': '_pg_geometries', 'LINE': '_pg_geometries', 'LSEG': '_pg_geometries', 'BOX': '_pg_geometries',
+        'PATH': '_pg_geometries', 'PG POLYGON': '_pg_geometries', 'CIRCLE': '_pg_geometries',
+        'INT4RANGE': '_ranges', 'INT8RANGE': '_ranges', 'NUMRANGE': '_ranges', 'TSRANGE': '_ranges',
+        'TSTZRANGE': '_ranges', 'DATERANGE': '_ranges',
+        'TID': '_tids', 'XID': '_xids', 'PG_LSN': '_lsns',
+        'GEOMETRY': '_wkt', 'POINT': '_wkt', 'LINESTRING': '_wkt', 'POLYGON': '_wkt', 'MULTIPOINT': '_wkt',
+        'MULTILINESTRING': '_wkt', 'MULTIPOLYGON': '_wkt', 'GEOMETRYCOLLECTION': '_wkt', 'GEOGRAPHY': '_wkt',
+    }
+    
+    # Conversões no SQL para tipos sem adaptação direta do parâmetro
+    PLACEHOLDERS = {
+        **{('mysql', name): 'ST_GeomFromText(%s)'
+           for name in ('GEOMETRY', 'POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT', 'MULTILINESTRING',
+                        'MULTIPOLYGON', 'GEOMETRYCOLLECTION')},
+        ('sqlserver', 'GEOMETRY'): 'geometry::STGeomFromText(%s, 0)',
+        ('sqlserver', 'GEOGRAPHY'): 'geography::STGeomFromText(%s, 4326)',
+        ('postgres', 'TSVECTOR'): "to_tsvector('simple', %s)",
+        ('postgres', 'TSQUERY'): "plainto_tsquery('simple', %s)",
+    }
+    
+    # Fuso fixo dos tipos com fuso horário
+    TIMEZONE = datetime.timezone(datetime.timedelta(hours=-3))
+    
+    def __init__(self, rows: 'RowGenerator', ddl: str = None, blob_size: int = DEFAULT_BLOB_SIZE):
+        self.rows = rows
+        self.database_type = rows.database_type
+        self.blob_size = blob_size
+        ddl = ddl or SchemaBootstrap.init_script_table(self.database_type, 'generic_table')
+        if not ddl:
+            raise ValueError(f"generic_table não encontrada no init_script.sql de {self.database_type}")
+        
+        self.columns, self.placeholders, self._specs = [], [], []
+        for name, type_name, args in self.parse_columns(ddl):
+            if name.lower() in self.DATABASE_COLUMNS or type_name in self.DATABASE_TYPES:
+                continue
+            kind = self.DIALECT_TYPES.get((self.database_type, type_name), type_name)
+            method = self.GENERATORS.get(kind)
+            if method is None:
+                logging.warning(f"⚠️ generic_table.{name}: tipo {type_name} sem gerador, coluna ignorada")
+                continue
+            self.columns.append(name)
+            self.placeholders.append(self.PLACEHOLDERS.get((self.database_type, type_name), '%s'))
+            self._specs.append((getattr(self, method), kind, args))
+    
+    @classmethod
+    def parse_columns(cls, ddl: str) -> List[Tuple[str, str, List[str]]]:
+        """(nome, tipo, argumentos) de cada coluna de um CREATE TABLE com uma coluna por linha"""
+        columns = []
+        for line in ddl.splitlines()[1:]:
+            match = cls.COLUMN_PATTERN.match(line)
+            if not match or match.group(1).upper() in cls.CONSTRAINT_KEYWORDS:
+                continue
+            name, type_name, args, unsigned, array_suffix = match.groups()
+            type_name = ' '.join(type_name.upper().split())
+            if unsigned:
+                type_name += ' UNSIGNED'
+            if array_suffix:
+                type_name += '[]'
+            args = [arg.strip().strip("'") for arg in args[1:-1].split(',')] if args else []
+            columns.append((name, type_name, args))
+        return columns
+    
+    def capacity(self, kind: str, args: List[str]) -> int:
+        """Bytes gravados por valor de uma coluna binária"""
+        if kind == 'BINARY':
+            return int(args[0]) if args else 1
+        limit = int(args[0]) if args and args[0].isdigit() else self.BLOB_LIMITS.get(kind, 2**31 - 1)
+        return min(self.blob_size, limit)
+    
+    def row_bytes(self) -> int:
+        """Estimativa do tamanho de uma linha no texto do INSERT (binários em hexadecimal)"""
+        total = 0
+        for method, kind, args in self._specs:
+            if method == self._binaries:
+                total += 2 * self.capacity(kind, args) + 8
+            elif method == self._long_texts:
+                total += 1024
+            else:
+                total += 64
+        return total
+    
+    def insert_options(self) -> Dict[str, Any]:
+        """Argumentos de ``DataManager.execute_batch`` para as linhas deste gerador"""
+        return {'placeholders': self.placeholders,
+                'max_rows': max(1, WIDE_INSERT_MAX_BYTES // self.row_bytes())}
+    
+    def column_batch(self, size: int) -> List[list]:
+        """Um lote de ``size`` linhas, em colunas"""
+        return [method(size, kind, args) for method, kind, args in self._specs]
+    
+    def batch(self, size: int) -> List[Tuple]:
+        return list(zip(*self.column_batch(size)))
+    
+    # Geradores por tipo: (size, tipo, argumentos) -> lista de valores
+    
+    def _integers(self, size: int, kind: str, args: List[str]) -> list:
+        low, high = self.INTEGER_RANGES[kind]
+        return self.rows._integers(low, high, size)
+    
+    def _decimals(self, size: int, kind: str, args: List[str]) -> list:
+        precision, scale = (int(args[0]), int(args[1]) if len(args) > 1 else 0) if args else (18, 0)
+        limit = 10 ** (precision - scale) - 1
+        return [decimal.Decimal(f"{value:.{scale}f}") for value in self.rows._uniform(-limit, limit, size, scale)]
+    
+    def _floats(self, size: int, kind: str, args: List[str]) -> list:
+        return self.rows._uniform(-1e6, 1e6, size)
+    
+    def _money(self, size: int, kind: str, args: List[str]) -> list:
+        limit = 200000 if kind == 'SMALLMONEY' else 10**9
+        return [f"{value:.2f}" for value in self.rows._uniform(-limit, limit, size, 2)]
+    
+    def _short_texts(self, size: int, kind: str, args: List[str]) -> list:
+        limit = int(args[0]) if args else 63
+        return [message[:limit] for message in self.rows._choice(self.rows.samples.sample_messages, size)]
+    
+    def _long_texts(self, size: int, kind: str, args: List[str]) -> list:
+        messages = self.rows.samples.sample_messages
+        return [' '.join(self.rows.random.choices(messages, k=count)) for count in self.rows._integers(1, 21, size)]
+    
+    def _dates(self, size: int, kind: str, args: List[str]) -> list:
+        return self.rows._dates_before(datetime.date.today(), 3650, size)
+    
+    def _datetimes(self, size: int, kind: str, args: List[str]) -> list:
+        now = datetime.datetime.now().replace(microsecond=0)
+        values = self.rows._datetimes_before(now, 315360000, size)
+        if kind in ('TIMESTAMPTZ', 'DATETIMEOFFSET'):
+            return [value.replace(tzinfo=self.TIMEZONE).isoformat(sep=' ') for value in values]
+        return values
+    
+    def _times(self, size: int, kind: str, args: List[str]) -> list:
+        seconds = self.rows._integers(0, 86400, size)
+        values = [datetime.time(value // 3600, value // 60 % 60, value % 60) for value in seconds]
+        if kind == 'TIMETZ':
+            return [value.replace(tzinfo=self.TIMEZONE).isoformat() for value in values]
+        return values
+    
+    def _intervals(self, size: int, kind: str, args: List[str]) -> list:
+        return [datetime.timedelta(seconds=value) for value in self.rows._integers(0, 90 * 86400, size)]
+    
+    def _booleans(self, size: int, kind: str, args: List[str]) -> list:
+        return [value == 1 for value in self.rows._integers(0, 2, size)]
+    
+    def _bit_integers(self, size: int, kind: str, args: List[str]) -> list:
+        return self.rows._integers(0, 2 ** int(args[0]) if args else 2, size)
+    
+    def _bit_strings(self, size: int, kind: str, args: List[str]) -> list:
+        length = int(args[0]) if args else 1
+        return [format(value, f'0{length}b') for value in self.rows._integers(0, 2 ** length, size)]
+    
+    def _random_bytes(self, length: int) -> bytes:
+        if self.rows.np_random is not None:
+            return self.rows.np_random.bytes(length)
+        return self.rows.random.getrandbits(length * 8).to_bytes(length, 'little')
+    
+    def _binaries(self, size: int, kind: str, args: List[str]) -> list:
+        length = self.capacity(kind, args)
+        return [self._random_bytes(length) for _ in range(size)]
+    
+    def _uuids(self, size: int, kind: str, args: List[str]) -> list:
+        return [str(uuid.UUID(int=self.rows.random.getrandbits(128), version=4)) for _ in range(size)]
+    
+    def _json(self, size: int, kind: str, args: List[str]) -> list:
+        samples = self.rows.samples
+        return [json.dumps({'tipo': tipo, 'chave': chave, 'valor': valor})
+                for tipo, chave, valor in zip(self.rows._choice(samples.sample_generic_types, size),
+                                              self.rows._choice(samples.sample_generic_keys, size),
+                                              self.rows._choice(samples.sample_generic_values, size))]
+    
+    def _xml(self, size: int, kind: str, args: List[str]) -> list:
+        return [f'<registro id="{value}"><origem>auto-data-manager</origem></registro>'
+                for value in self.rows._integers(1, 2**31, size)]
+    
+    def _variants(self, size: int, kind: str, args: List[str]) -> list:
+        return self.rows._integers(-2**31, 2**31, size)
+    
+    def _hierarchy_ids(self, size: int, kind: str, args: List[str]) -> list:
+        levels = self.rows._integers(1, 100, size * 2)
+        return [f'/{levels[2 * i]}/{levels[2 * i + 1]}/' for i in range(size)]
+    
+    def _enums(self, size: int, kind: str, args: List[str]) -> list:
+        return self.rows._choice(args, size)
+    
+    def _sets(self, size: int, kind: str, args: List[str]) -> list:
+        masks = self.rows._integers(1, 2 ** len(args), size)
+        return [','.join(option for bit, option in enumerate(args) if mask >> bit & 1) for mask in masks]
+    
+    def _inets(self, size: int, kind: str, args: List[str]) -> list:
+        octets = self.rows._integers(0, 256, size * 3)
+        if kind == 'CIDR':
+            return [f'10.{octets[3 * i]}.{octets[3 * i + 1]}.0/24' for i in range(size)]
+        return [f'10.{octets[3 * i]}.{octets[3 * i + 1]}.{octets[3 * i + 2]}' for i in range(size)]
+    
+    def _macaddrs(self, size: int, kind: str, args: List[str]) -> list:
+        length = 8 if kind == 'MACADDR8' else 6
+        return [':'.join(f'{byte:02x}' for byte in self._random_bytes(length)) for _ in range(size)]
+    
+    def _integer_arrays(self, size: int, kind: str, args: List[str]) -> list:
+        values = self.rows._integers(-2**31, 2**31, size * 3)
+        return [values[3 * i:3 * i + 3] for i in range(size)]
+    
+    def _text_arrays(self, size: int, kind: str, args: List[str]) -> list:
+        keys = self.rows._choice(self.rows.samples.sample_generic_keys, size * 3)
+        return [keys[3 * i:3 * i + 3] for i in range(size)]
+    
+    def _coordinates(self, size: int, per_row: int, low: float = -1000, high: float = 1000) -> List[list]:
+        values = self.rows._uniform(low, high, size * per_row, 4)
+        return [values[per_row * i:per_row * (i + 1)] for i in range(size)]
+    
+    def _pg_geometries(self, size: int, kind: str, args: List[str]) -> list:
+        values = []
+        for x, y, dx, dy in self._coordinates(size, 4):
+            dx, dy = abs(dx) + 1, abs(dy) + 1
+            if kind == 'PG POINT':
+                values.append(f'({x},{y})')
+            elif kind == 'LINE':
+                values.append(f'{{{dx},{-dy},{x}}}')
+            elif kind == 'LSEG':
+                values.append(f'[({x},{y}),({x + dx},{y + dy})]')
+            elif kind == 'BOX':
+                values.append(f'(({x + dx},{y + dy}),({x},{y}))')
+            elif kind == 'PATH':
+                values.append(f'[({x},{y}),({x + dx},{y}),({x + dx},{y + dy})]')
+            elif kind == 'PG POLYGON':
+                values.append(f'(({x},{y}),({x + dx},{y}),({x + dx},{y + dy}),({x},{y + dy}))')
+            else:
+                values.append(f'<({x},{y}),{dx}>')
+        return values
+    
+    def _ranges(self, size: int, kind: str, args: List[str]) -> list:
+        starts = self.rows._integers(0, 10**6, size)
+        spans = self.rows._integers(1, 1000, size)
+        if kind in ('INT4RANGE', 'INT8RANGE'):
+            return [f'[{start},{start + span})' for start, span in zip(starts, spans)]
+        if kind == 'NUMRANGE':
+            return [f'[{start / 100},{(start + span) / 100})' for start, span in zip(starts, spans)]
+        if kind == 'DATERANGE':
+            dates = self._dates(size, 'DATE', [])
+            return [f'[{date},{date + datetime.timedelta(days=span)})' for date, span in zip(dates, spans)]
+        
+        values = []
+        for start, span in zip(self._datetimes(size, 'TIMESTAMP', []), spans):
+            end = start + datetime.timedelta(minutes=span)
+            if kind == 'TSTZRANGE':
+                start, end = start.replace(tzinfo=self.TIMEZONE), end.replace(tzinfo=self.TIMEZONE)
+            values.append(f'["{start}","{end}")')
+        return values
+    
+    def _tids(self, size: int, kind: str, args: List[str]) -> list:
+        pages = self.rows._integers(0, 2**31, size)
+        return [f'({page},{item})' for page, item in zip(pages, self.rows._integers(1, 292, size))]
+    
+    def _xids(self, size: int, kind: str, args: List[str]) -> list:
+        return [str(value) for value in self.rows._integers(0, 2**32, size)]
+    
+    def _lsns(self, size: int, kind: str, args: List[str]) -> list:
+        values = self.rows._integers(0, 2**32, size * 2)
+        return [f'{values[2 * i]:X}/{values[2 * i + 1]:X}' for i in range(size)]
+    
+    def _wkt(self, size: int, kind: str, args: List[str]) -> list:
+        """Geometrias em WKT (o placeholder converte no banco)"""
+        if kind == 'GEOGRAPHY':
+            return [f'POINT({lon} {lat})' for lon, lat in
+                    zip(self.rows._uniform(-180, 180, size, 6), self.rows._uniform(-90, 90, size, 6))]
+        values = []
+        for x, y, d in self._coordinates(size, 3):
+            d = abs(d) + 1
+            point = f'{x} {y}'
+            line = f'{x} {y}, {x + d} {y + d}, {x + 2 * d} {y}'
+            polygon = f'(({x} {y}, {x + d} {y}, {x + d} {y + d}, {x} {y + d}, {x} {y}))'
+            if kind in ('GEOMETRY', 'POINT'):
+                values.append(f'POINT({point})')
+            elif kind == 'LINESTRING':
+                values.append(f'LINESTRING({line})')
+            elif kind == 'POLYGON':
+                values.append(f'POLYGON{polygon}')
+            elif kind == 'MULTIPOINT':
+                values.append(f'MULTIPOINT(({point}), ({x + d} {y + d}))')
+            elif kind == 'MULTILINESTRING':
+                values.append(f'MULTILINESTRING(({line}), ({x} {y + d}, {x + d} {y + 2 * d}))')
+            elif kind == 'MULTIPOLYGON':
+                values.append(f'MULTIPOLYGON({polygon})')
+            else:
+                values.append(f'GEOMETRYCOLLECTION(POINT({point}), LINESTRING({line}))')
+        return values
+
+class StatementRegistry:
+    """Comandos SQL das operações, compilados uma única vez por dialeto"""
+    
+    # nome -> (SQL com %s, tipos dos parâmetros no SQL Server, lido em fluxo)
+    STATEMENTS = {
+        'update_cliente': ("UPDATE clientes SET nome = %s, updated_at = {now} WHERE id = %s",
+                           ('NVARCHAR(100)', 'INT'), False),
+        'update_produto': ("UPDATE produtos SET preco = preco * %s, updated_at = {now} WHERE id = %s",
+                           ('FLOAT', 'INT'), False),
+        'update_generic': ("UPDATE generic SET valor = %s, metadata = %s, updated_at = {now} WHERE id = %s",
+                           ('NVARCHAR(MAX)', 'NVARCHAR(MAX)', 'INT'), False),
+        'select_cliente': ("SELECT id, nome, email, created_at, updated_at FROM clientes WHERE id = %s", ('INT',), False),
+        'select_produto': ("SELECT id, nome, preco, created_at, updated_at FROM produtos WHERE id = %s", ('INT',), False),
+        'scan_logs': ("SELECT id, mensagem, created_at FROM logs WHERE created_at >= {since} ORDER BY created_at",
+                      ('INT',), True),
+        'aggregate_pedidos': ("SELECT c.id, c.nome, COUNT(p.id) FROM clientes c LEFT JOIN pedidos p ON c.id = p.cliente_id "
+                              "WHERE c.id BETWEEN %s AND %s GROUP BY c.id, c.nome", ('INT', 'INT'), True),
+    }
+    
+    # Trechos de SQL que mudam entre dialetos
+    DIALECT_FRAGMENTS = {
+        'postgres': {'now': 'CURRENT_TIMESTAMP', 'since': "CURRENT_TIMESTAMP - %s * INTERVAL '1 second'"},
+        'mysql': {'now': 'CURRENT_TIMESTAMP', 'since': 'NOW() - INTERVAL %s SECOND'},
+        'sqlserver': {'now': 'GETDATE()', 'since': 'DATEADD(SECOND, -%s, GETDATE())'},
+    }
+    
+    # Tipos das colunas inseridas pelas operações, para o sp_executesql do SQL Server
+    SQLSERVER_COLUMN_TYPES = {
+        'nome': 'NVARCHAR(100)', 'email': 'NVARCHAR(100)', 'preco': 'DECIMAL(10,2)', 'mensagem': 'NVARCHAR(255)',
+        'tipo': 'NVARCHAR(50)', 'chave': 'NVARCHAR(100)', 'valor': 'NVARCHAR(MAX)', 'metadata': 'NVARCHAR(MAX)',
+        'cliente_id': 'INT', 'data_pedido': 'DATE', 'pedido_id': 'INT', 'produto_id': 'INT', 'quantidade': 'INT',
+    }
+    
+    _registries: Dict[str, 'StatementRegistry'] = {}
+    _registries_lock = threading.Lock()
+    
+    def __init__(self, database_type: str):
+        self.database_type = database_type
+        self._lock = threading.Lock()
+        # Conexão -> nomes já preparados nela (PostgreSQL); some junto com a conexão
+        self._prepared = weakref.WeakKeyDictionary()
+        self._statements = {}
+        for name, (sql, types, streaming) in self.STATEMENTS.items():
+            self._statements[name] = self._compile(name, sql.format(**self.DIALECT_FRAGMENTS[database_type]),
+                                                   types, streaming)
+        self._inserts = {}
+        for table, columns in RowGenerator.TABLE_COLUMNS.items():
+            if table != 'itens_pedido':
+                self.insert(table, columns)
+    
+    @classmethod
+    def for_dialect(cls, database_type: str) -> 'StatementRegistry':
+        """Registro compartilhado do dialeto (compilado uma vez por processo)"""
+        with cls._registries_lock:
+            if database_type not in cls._registries:
+                cls._registries[database_type] = cls(database_type)
+            return cls._registries[database_type]
+    
+    def _compile(self, name: str, sql: str, types: Optional[Sequence[str]], streaming: bool) -> Dict[str, Any]:
+        """Compila o comando para o dialeto: texto a executar e, no PostgreSQL, o PREPARE"""
+        statement = {'name': name, 'sql': sql, 'execute': sql, 'prepare': None, 'streaming': streaming,
+                     'read': sql.lstrip().upper().startswith('SELECT')}
+        params = sql.count('%s')
+        
+        if self.database_type == 'postgres' and not streaming:
+            prepared = f"adm_{name}"
+            statement['prepare'] = f"PREPARE {prepared} AS {_numbered_placeholders(sql)}"
+            statement['execute'] = f"EXECUTE {prepared}" + (f" ({', '.join(['%s'] * params)})" if params else '')
+        elif self.database_type == 'sqlserver' and types and len(types) == params:
+            inner = _numbered_placeholders(sql, '@P').replace("'", "''")
+            declarations = ', '.join(f"@P{i} {sql_type}" for i, sql_type in enumerate(types, start=1))
+            statement['execute'] = f"EXEC sp_executesql N'{inner}', N'{declarations}', " + ', '.join(['%s'] * params)
+        return statement
+    
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self._statements[name]
+    
+    def insert(self, table: str, columns: Sequence[str], id_column: Optional[str] = 'id') -> Dict[str, Any]:
+        """INSERT de uma linha com retorno do ID gerado (RETURNING/OUTPUT INSERTED)"""
+        key = (table, tuple(columns), id_column)
+        statement = self._inserts.get(key)
+        if statement is not None:
+            return statement
+        
+        column_list = ', '.join(columns)
+        placeholders = ', '.join(['%s'] * len(columns))
+        if self.database_type == 'postgres':
+            returning = f" RETURNING {id_column}" if id_column else ''
+            sql = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders}){returning}"
+        elif self.database_type == 'sqlserver':
+            output = f" OUTPUT INSERTED.{id_column}" if id_column else ''
+            sql = f"INSERT INTO {table} ({column_list}){output} VALUES ({placeholders})"
+        else:  # MySQL: o ID vem de lastrowid
+            sql = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+        types = [self.SQLSERVER_COLUMN_TYPES.get(column) for column in columns]
+        
+        with self._lock:
+            statement = self._inserts.get(key)
+            if statement is None:
+                statement = self._compile(f"insert_{table}_{len(self._inserts)}", sql,
+                                          types if all(types) else None, False)
+                self._inserts[key] = statement
+        return statement
+    
+    def execute(self, cursor, connection, statement: Dict[str, Any], params: tuple = None):
+        """Executa o comando no cursor, preparando-o antes na conexão se ainda não foi (PostgreSQL)"""
+        if statement['prepare']:
+            with self._lock:
+                prepared = self._prepared.setdefault(connection, set())
+            if statement['name'] not in prepared:
+                cursor.execute(statement['prepare'])
+                prepared.add(statement['name'])
+        if params:
+            cursor.execute(statement['execute'], params)
+        else:
+            cursor.execute(statement['execute'])
+
+class SchemaBootstrap:
+    """Criação do schema do gerenciador com uma única consulta ao catálogo"""
+    
+    FINGERPRINT_TABLE = 'auto_data_schema'
+    COMPONENT = 'auto-data-manager'
+    
+    # Tabelas das operações, por dialeto, na ordem de criação (as FKs exigem clientes/produtos antes)
+    TABLES = {
+        'postgres': (
+            ('clientes', """
+                CREATE TABLE clientes (
+                    id SERIAL PRIMARY KEY,
+                    nome VARCHAR(100) NOT NULL,
+                    email VARCHAR(100),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """),
+            ('produtos', """
+                CREATE TABLE produtos (
+                    id SERIAL PRIMARY KEY,
+                    nome VARCHAR(100) NOT NULL,
+                    preco DECIMAL(10,2) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """),
+            ('logs', """
+                CREATE TABLE logs (
+                    id SERIAL PRIMARY KEY,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    mensagem VARCHAR(255),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """),
+            ('generic', """
+                CREATE TABLE generic (
+                    id SERIAL PRIMARY KEY,
+                    tipo VARCHAR(50) NOT NULL,
+                    chave VARCHAR(100) NOT NULL,
+                    valor TEXT,
+                    metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """),
+            ('pedidos', """
+                CREATE TABLE pedidos (
+                    id SERIAL PRIMARY KEY,
+                    cliente_id INT,
+                    data_pedido DATE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (cliente_id) REFERENCES clientes(id)
+                )
+            """),
+            ('itens_pedido', """
+                CREATE TABLE itens_pedido (
+                    pedido_id INT,
+                    produto_id INT,
+                    quantidade INT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (pedido_id, produto_id),
+                    FOREIGN KEY (pedido_id) REFERENCES pedidos(id),
+                    FOREIGN KEY (produto_id) REFERENCES produtos(id)
+                )
+            """),
+        ),
+        'mysql': (
+            ('clientes', """
+                CREATE TABLE clientes (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    nome VARCHAR(100) NOT NULL,
+                    email VARCHAR(100),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB
+            """),
+            ('produtos', """
+                CREATE TABLE produtos (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    nome VARCHAR(100) NOT NULL,
+                    preco DECIMAL(10,2) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB
+            """),
+            ('logs', """
+                CREATE TABLE logs (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    mensagem VARCHAR(255),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB
+            """),
+            ('generic', """
+                CREATE TABLE generic (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    tipo VARCHAR(50) NOT NULL,
+                    chave VARCHAR(100) NOT NULL,
+                    valor TEXT,
+                    metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                ) ENGINE=InnoDB
+            """),
+            ('pedidos', """
+                CREATE TABLE pedidos (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    cliente_id INT,
+                    data_pedido DATE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    FOREIGN KEY (cliente_id) REFERENCES clientes(id)
+                ) ENGINE=InnoDB
+            """),
+            ('itens_pedido', """
+                CREATE TABLE itens_pedido (
+                    pedido_id INT,
+                    produto_id INT,
+                    quantidade INT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    PRIMARY KEY (pedido_id, produto_id),
+                    FOREIGN KEY (pedido_id) REFERENCES pedidos(id),
+                    FOREIGN KEY (produto_id) REFERENCES produtos(id)
+                ) ENGINE=InnoDB
+            """),
+        ),
+        'sqlserver': (
+            ('clientes', """
+                CREATE TABLE clientes (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    nome NVARCHAR(100) NOT NULL,
+                    email NVARCHAR(100),
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE()
+                )
+            """),
+            ('produtos', """
+                CREATE TABLE produtos (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    nome NVARCHAR(100) NOT NULL,
+                    preco DECIMAL(10,2) NOT NULL,
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE()
+                )
+            """),
+            ('logs', """
+                CREATE TABLE logs (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    timestamp DATETIME2 DEFAULT GETDATE(),
+                    mensagem NVARCHAR(255),
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE()
+                )
+            """),
+            ('generic', """
+                CREATE TABLE generic (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    tipo NVARCHAR(50) NOT NULL,
+                    chave NVARCHAR(100) NOT NULL,
+                    valor NVARCHAR(MAX),
+                    metadata NVARCHAR(MAX),
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE()
+                )
+            """),
+            ('pedidos', """
+                CREATE TABLE pedidos (
+                    id INT IDENTITY(1,1) PRIMARY KEY,
+                    cliente_id INT,
+                    data_pedido DATE,
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE(),
+                    FOREIGN KEY (cliente_id) REFERENCES clientes(id)
+                )
+            """),
+            ('itens_pedido', """
+                CREATE TABLE itens_pedido (
+                    pedido_id INT,
+                    produto_id INT,
+                    quantidade INT,
+                    created_at DATETIME2 DEFAULT GETDATE(),
+                    updated_at DATETIME2 DEFAULT GETDATE(),
+                    PRIMARY KEY (pedido_id, produto_id),
+                    FOREIGN KEY (pedido_id) REFERENCES pedidos(id),
+                    FOREIGN KEY (produto_id) REFERENCES produtos(id)
+                )
+            """),
+        ),
+    }
+    
+    # Índices das leituras (varredura de logs por data e agregado por cliente), idempotentes
+    INDEXES = {
+        'postgres': (
+            "CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs (created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_pedidos_cliente_id ON pedidos (cliente_id)",
+        ),
+        'mysql': (
+            # pedidos.cliente_id já é indexado pela FK
+            "CREATE INDEX idx_logs_created_at ON logs (created_at)",
+        ),
+        'sqlserver': (
+            "IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'idx_logs_created_at') "
+            "CREATE INDEX idx_logs_created_at ON logs (created_at)",
+            "IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'idx_pedidos_cliente_id') "
+            "CREATE INDEX idx_pedidos_cliente_id ON pedidos (cliente_id)",
+        ),
+    }
+    
+    # Tabela com a impressão digital do schema aplicado
+    FINGERPRINT_DDL = {
+        'postgres': "CREATE TABLE auto_data_schema (componente VARCHAR(50) PRIMARY KEY, "
+                    "fingerprint CHAR(64) NOT NULL, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+        'mysql': "CREATE TABLE auto_data_schema (componente VARCHAR(50) PRIMARY KEY, "
+                 "fingerprint CHAR(64) NOT NULL, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP) ENGINE=InnoDB",
+        'sqlserver': "CREATE TABLE auto_data_schema (componente NVARCHAR(50) PRIMARY KEY, "
+                     "fingerprint CHAR(64) NOT NULL, updated_at DATETIME2 DEFAULT GETDATE())",
+    }
+    
+    # Schema corrente de cada dialeto, para filtrar o catálogo
+    CURRENT_SCHEMA = {'postgres': 'current_schema()', 'mysql': 'DATABASE()', 'sqlserver': 'SCHEMA_NAME()'}
+    
+    _verified = set()
+    _verified_lock = threading.Lock()
+    
+    def __init__(self, manager: 'DataManager'):
+        self.manager = manager
+        self.database_type = manager.database_type
+        # Verificação única por banco (tipo + database, quando a conexão aponta para outro)
+        self.key = (self.database_type, manager.pool.connect_options.get('database'))
+        self.tables = list(self.TABLES[self.database_type])
+        generic_table = self.init_script_table(self.database_type, 'generic_table')
+        if generic_table:
+            self.tables.append(('generic_table', generic_table))
+        self.fingerprint = self._fingerprint()
+    
+    @classmethod
+    def init_script_table(cls, database_type: str, table: str) -> Optional[str]:
+        """CREATE TABLE de ``table`` no script de inicialização do banco (None se não houver)"""
+        path = os.path.join(PROJECT_DIR, 'init', database_type, 'init_script.sql')
+        try:
+            with open(path, encoding='utf-8') as script_file:
+                script = script_file.read()
+        except OSError:
+            logging.warning(f"⚠️ {path} não encontrado: {table} não será criada")
+            return None
+        return cls.extract_create_table(script, table)
+    
+    @staticmethod
+    def extract_create_table(script: str, table: str) -> Optional[str]:
+        """Extrai o comando CREATE TABLE de table de um script SQL"""
+        match = re.search(rf"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?{table}\s*\(", script, re.IGNORECASE)
+        if not match:
+            return None
+        position = match.start()
+        in_string = False
+        while position < len(script):
+            char = script[position]
+            if in_string:
+                in_string = char != "'"
+            elif char == "'":
+                in_string = True
+            elif script.startswith('--', position):
+                position = script.find('\n', position)
+                if position < 0:
+                    return None
+            elif char == ';':
+                return script[match.start():position].strip()
+            position += 1
+        return None
+    
+    def _fingerprint(self) -> str:
+        """SHA-256 do DDL completo do dialeto (tabelas, índices e tabela de controle)"""
+        digest = hashlib.sha256(self.database_type.encode())
+        for name, ddl in self.tables:
+            digest.update(name.encode())
+            digest.update(' '.join(ddl.split()).encode())
+        for statement in self.INDEXES[self.database_type]:
+            digest.update(statement.encode())
+        digest.update(self.FINGERPRINT_DDL[self.database_type].encode())
+        return digest.hexdigest()
+    
+    def _existing_tables(self, cursor) -> set:
+        """Tabelas necessárias que já existem, em uma única consulta ao catálogo"""
+        names = [name for name, _ in self.tables] + [self.FINGERPRINT_TABLE]
+        placeholders = ', '.join(['%s'] * len(names))
+        cursor.execute(
+            f"SELECT table_name FROM information_schema.tables "
+            f"WHERE table_schema = {self.CURRENT_SCHEMA[self.database_type]} AND table_name IN ({placeholders})",
+            tuple(names)
+        )
+        return {row[0].lower() for row in cursor.fetchall()}
+    
+    def _create_indexes(self, cursor):
+        if self.database_type == 'mysql':
+            cursor.execute(
+                "SELECT index_name FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'logs'"
+            )
+            if 'idx_logs_created_at' in {row[0].lower() for row in cursor.fetchall()}:
+                return
+        for statement in self.INDEXES[self.database_type]:
+            cursor.execute(statement)
+    
+    def ensure(self) -> bool:
+        """Garante o schema; devolve False se a verificação ou a criação falhar"""
+        with self._verified_lock:
+            if self.key in self._verified:
+                return True
+        
+        connection = self.manager.connection
+        cursor = connection.cursor()
+        try:
+            existing = self._existing_tables(cursor)
+            missing = [(name, ddl) for name, ddl in self.tables if name not in existing]
+            
+            if not missing and self.FINGERPRINT_TABLE in existing:
+                cursor.execute(f"SELECT fingerprint FROM {self.FINGERPRINT_TABLE} WHERE componente = %s",
+                               (self.COMPONENT,))
+                row = cursor.fetchone()
+                if row and row[0] == self.fingerprint:
+                    connection.commit()
+                    logging.info(f"✅ Schema em dia no {self.database_type.upper()} (impressão {self.fingerprint[:12]})")
+                    self._mark_verified()
+                    return True
+            
+            for name, ddl in missing:
+                cursor.execute(ddl)
+            self._create_indexes(cursor)
+            if self.FINGERPRINT_TABLE not in existing:
+                cursor.execute(self.FINGERPRINT_DDL[self.database_type])
+            cursor.execute(f"DELETE FROM {self.FINGERPRINT_TABLE} WHERE componente = %s", (self.COMPONENT,))
+            cursor.execute(f"INSERT INTO {self.FINGERPRINT_TABLE} (componente, fingerprint) VALUES (%s, %s)",
+                           (self.COMPONENT, self.fingerprint))
+            connection.commit()
+            
+            created = ', '.join(name for name, _ in missing) or 'nenhuma'
+            logging.info(f"✅ Schema aplicado no {self.database_type.upper()}: tabelas criadas: {created} "
+                         f"(impressão {self.fingerprint[:12]})")
+            self._mark_verified()
+            return True
+            
+        except Exception as e:
+            logging.error(f"❌ Erro ao verificar/criar tabelas: {e}")
+            try:
+                connection.rollback()
+            except Exception:
+                pass
+            return False
+        finally:
+            cursor.close()
+    
+    def _mark_verified(self):
+        with self._verified_lock:
+            self._verified.add(self.key)
+
+def bootstrap_schemas(engines: Sequence[str]) -> Dict[str, bool]:
+    """Verifica/cria o schema de vários bancos em paralelo (uma thread por banco)"""
+    def bootstrap(database_type: str) -> bool:
+        manager = DataManager(database_type)
+        if not manager.connect():
+            return False
+        try:
+            return manager.check_tables_exist()
+        finally:
+            manager.disconnect()
+    
+    with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+        return dict(zip(engines, executor.map(bootstrap, engines)))
+
+class DataManager:
+    """Gerenciador automático de dados"""
+    
+    # (operação, tabela) do trace -> (nome no relatório, método que a executa)
+    TRACE_OPERATIONS = {
+        ('insert', 'clientes'): ('INSERT Cliente', 'insert_cliente'),
+        ('update', 'clientes'): ('UPDATE Cliente', 'update_cliente'),
+        ('insert', 'produtos'): ('INSERT Produto', 'insert_produto'),
+        ('update', 'produtos'): ('UPDATE Produto', 'update_produto'),
+        ('insert', 'logs'): ('INSERT Log', 'insert_log'),
+        ('insert', 'pedidos'): ('INSERT Pedido', 'insert_pedido'),
+        ('insert', 'generic'): ('INSERT Generic', 'insert_generic'),
+        ('update', 'generic'): ('UPDATE Generic', 'update_generic'),
+        ('insert', 'generic_table'): ('INSERT Generic Table', 'insert_generic_table'),
+        ('select', 'clientes'): ('SELECT Cliente', 'select_cliente'),
+        ('select', 'produtos'): ('SELECT Produto', 'select_produto'),
+        ('select', 'logs'): ('SCAN Logs', 'scan_logs'),
+        ('select', 'pedidos'): ('AGREGADO Pedidos', 'aggregate_pedidos'),
+    }
+    
+    # Linhas por FETCH ao consumir resultados de leitura
+    FETCH_SIZE = 1000
+    # Janela padrão (segundos) da varredura de logs por created_at
+    LOG_SCAN_WINDOW = 300
+    # Quantidade de clientes consecutivos no agregado clientes x pedidos
+    AGGREGATE_RANGE = 1000
+    
+    def __init__(self, database_type: str = 'mysql', batch_size: int = 1,
+                 id_cache: IdCache = None, pool: ConnectionPool = None,
+                 commit_policy: CommitPolicy = None, metrics: OperationMetrics = None):
+        self.database_type = database_type
+        self.connection = None
+        
+        # Latência e contadores por operação (compartilhados entre workers, se informado)
+        self.metrics = metrics or OperationMetrics()
+        
+        # Controle de transações: escritas pendentes desde o último COMMIT
+        self.commit_policy = commit_policy or CommitPolicy()
+        self.commits = 0
+        self._pending_writes = 0
+        self._pending_since = 0.0
+        # IDs inseridos na transação aberta: só entram no cache após o COMMIT,
+        # para outros workers não referenciarem linhas que ainda não enxergam
+        self._pending_ids: List[Tuple[str, List[int]]] = []
+        
+        # SQL das operações compilado uma vez por dialeto (e preparado por conexão no PostgreSQL)
+        self.statements = StatementRegistry.for_dialect(database_type)
+        
+        # Sem pool compartilhado, o gerenciador usa um pool próprio de uma conexão
+        self.pool = pool or ConnectionPool(database_type, min_size=1, max_size=1)
+        self._owns_pool = pool is None
+        
+        # Quantidade de linhas por operação de INSERT (1 = modo linha a linha)
+        self.batch_size = max(1, batch_size)
+        
+        # IDs existentes por tabela, usados para sortear alvos de UPDATE
+        self.id_cache = id_cache or IdCache()
+        
+        # Nível de log das operações individuais (rebaixado para DEBUG no modo workers)
+        self.operation_log_level = logging.INFO
+        
+        # Gravação de trace (--record): operações e parâmetros, por worker
+        self.recorder: 'TraceRecorder' = None
+        self.worker_id = 0
+        
+        # Dados para simulação
+        self.sample_names = [
+            'Ana Costa', 'Bruno Lima', 'Carlos Pereira', 'Diana Silva', 'Eduardo Santos',
+            'Fernanda Oliveira', 'Gabriel Ferreira', 'Helena Rodrigues', 'Igor Almeida',
+            'Juliana Nascimento'
+        ]
+        
+        self.sample_products = [
+            ('Smartphone Samsung', 1200.00), ('iPhone 15', 5000.00), ('Tablet iPad', 3000.00),
+            ('Notebook Gamer', 4500.00), ('Headset Bluetooth', 250.00), ('Smartwatch', 800.00)
+        ]
+        
+        self.sample_messages = [
+            'Operação automática executada', 'Dados atualizados pelo sistema',
+            'Sincronização de dados realizada', 'Sistema operando normalmente'
+        ]
+        
+        # Dados para tabela generic
+        self.sample_generic_types = [
+            'config', 'settings', 'metadata', 'cache', 'session', 'temp'
+        ]
+        
+        self.sample_generic_keys = [
+            'user_preference', 'system_setting', 'app_config', 'session_data',
+            'cache_entry', 'temp_storage', 'metadata_info', 'sync_status'
+        ]
+        
+        self.sample_generic_values = [
+            'enabled', 'disabled', 'active', 'inactive', 'pending', 'completed',
+            'processing', 'error', 'success', 'waiting', 'approved', 'rejected'
+        ]
+        
+        # Gerador de lotes de linhas (modo --batch-size e carga em massa)
+        self.generator = RowGenerator(self, database_type)
+        # Bytes por valor nas colunas BLOB/BYTEA/IMAGE da generic_table
+        self.blob_size = GenericTableGenerator.DEFAULT_BLOB_SIZE
+        
+        # Controle de timer para operações a cada 30 segundos
+        self.last_generic_operation = time.time()
+    
+    def _apply_autocommit(self):
+        """No MySQL, deixa o autocommit do servidor ligado apenas na política por comando"""
+        if self.database_type == 'mysql':
+            self.connection.autocommit(self.commit_policy.mode == 'statement')
+    
+    def connect(self) -> bool:
+        """Obtém uma conexão do pool"""
+        try:
+            self.connection = self.pool.acquire()
+            self._apply_autocommit()
+            logging.info(f"✅ Conectado ao {self.database_type.upper()}")
+            return True
+            
+        except Exception as e:
+            logging.error(f"❌ Erro ao conectar com {self.database_type}: {e}")
+            return False
+    
+    def reconnect(self) -> bool:
+        """Substitui a conexão atual por uma nova"""
+        try:
+            if self._pending_writes:
+                logging.warning(f"⚠️ {self._pending_writes} escrita(s) não confirmada(s) perdida(s) na reconexão")
+                self._pending_writes = 0
+            self._pending_ids.clear()
+            self.connection = self.pool.replace(self.connection)
+            self._apply_autocommit()
+            logging.info(f"🔁 Reconectado ao {self.database_type.upper()}")
+            return True
+        except Exception as e:
+            logging.error(f"❌ Erro ao reconectar com {self.database_type}: {e}")
+            return False
+    
+    def disconnect(self):
+        """Devolve a conexão ao pool (e fecha o pool, se for próprio)"""
+        if self.connection:
+            try:
+                self.commit()
+            except Exception as e:
+                logging.error(f"❌ Erro ao confirmar escritas pendentes: {e}")
+            self.pool.release(self.connection)
+            self.connection = None
+            logging.info(f"🔌 Desconectado do {self.database_type.upper()}")
+        if self._owns_pool:
+            self.pool.close()
+    
+    def commit(self):
+        """Confirma a transação aberta (se houver escritas pendentes)"""
+        if not self._pending_writes:
+            return
+        # MySQL na política por comando: o autocommit do servidor já confirmou
+        if not (self.database_type == 'mysql' and self.commit_policy.mode == 'statement'):
+            self.connection.commit()
+        self.commits += 1
+        self._pending_writes = 0
+        for table, ids in self._pending_ids:
+            self.id_cache.add(table, ids)
+        self._pending_ids.clear()
+    
+    def end_cycle(self):
+        """Fim de um ciclo de operações: confirma a transação na política 'cycle'"""
+        self._record('end_cycle')
+        if self.commit_policy.mode == 'cycle':
+            self.commit()
+    
+    def _record(self, operation: str, table: str = None, **params):
+        """Registra a operação no trace em gravação (se houver)"""
+        if self.recorder is not None:
+            self.recorder.record(self.worker_id, operation, table, params)
+    
+    def _track_ids(self, table: str, ids: List[int]):
+        """Registra IDs inseridos na transação corrente (publicados no cache no COMMIT)"""
+        if ids:
+            self._pending_ids.append((table, ids))
+    
+    def _after_write(self):
+        """Registra uma escrita e faz COMMIT conforme a política"""
+        if not self._pending_writes:
+            self._pending_since = time.monotonic()
+        self._pending_writes += 1
+        if self.commit_policy.should_commit(self._pending_writes, self._pending_since):
+            self.commit()
+    
+    def _end_read(self):
+        """Encerra a transação aberta por uma leitura quando não há escritas pendentes"""
+        if self._pending_writes:
+            return
+        if not (self.database_type == 'mysql' and self.commit_policy.mode == 'statement'):
+            self.connection.commit()
+    
+    def _streaming_cursor(self, chunk_size: int = None):
+        """Cursor que lê o resultado em blocos no servidor, sem trazê-lo inteiro para a memória"""
+        if self.database_type == 'postgres':
+            cursor = self.connection.cursor(name=f"adm_{os.urandom(4).hex()}")
+            cursor.itersize = chunk_size or self.FETCH_SIZE
+            return cursor
+        if self.database_type == 'mysql':
+            return self.connection.cursor(pymysql.cursors.SSCursor)
+        return self.connection.cursor()
+    
+    def _execute(self, work, error_message: str = "❌ Erro ao executar query", write: bool = True,
+                 streaming: bool = False) -> Dict[str, Any]:
+        """Executa work(cursor) na transação corrente e aplica a política de commit"""
+        for attempt in range(2):
+            try:
+                cursor = self._streaming_cursor() if streaming else self.connection.cursor()
+                result = work(cursor)
+                cursor.close()
+                if write:
+                    self._after_write()
+                else:
+                    self._end_read()
+                return result
+                
+            except Exception as e:
+                if attempt == 0 and not self.pool.ping(self.connection):
+                    logging.warning(f"⚠️ Conexão com {self.database_type} perdida: {e}")
+                    if self.reconnect():
+                        continue
+                logging.error(f"{error_message}: {e}")
+                if self._pending_writes:
+                    logging.warning(f"⚠️ Rollback descartou {self._pending_writes} escrita(s) pendente(s)")
+                    self._pending_writes = 0
+                self._pending_ids.clear()
+                try:
+                    self.connection.rollback()
+                except:
+                    pass
+                return {'success': False, 'error': str(e)}
+    
+    def execute_query(self, query: str, params: tuple = None) -> Dict[str, Any]:
+        """Executa uma query no banco de dados"""
+        def work(cursor):
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            return {
+                'success': True,
+                'rowcount': cursor.rowcount if hasattr(cursor, 'rowcount') else 0
+            }
+        
+        return self._execute(work)
+    
+    @staticmethod
+    def _fetch_chunks(cursor, chunk_size: int) -> Iterable[List[Tuple]]:
+        """Produz o resultado pendente no cursor em listas de até ``chunk_size`` linhas"""
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    
+    def execute_select(self, query: str, params: tuple = None, streaming: bool = False) -> Dict[str, Any]:
+        """Executa uma consulta e consome o resultado em blocos de FETCH_SIZE linhas"""
+        def work(cursor):
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            rowcount = sum(len(rows) for rows in self._fetch_chunks(cursor, self.FETCH_SIZE))
+            return {'success': True, 'rowcount': rowcount}
+        
+        return self._execute(work, "❌ Erro ao executar consulta", write=False, streaming=streaming)
+    
+    def execute_statement(self, name: str, params: tuple = None) -> Dict[str, Any]:
+        """Executa um comando do registro (StatementRegistry) e devolve result['rowcount']"""
+        statement = self.statements[name]
+        
+        def work(cursor):
+            self.statements.execute(cursor, self.connection, statement, params)
+            if statement['read']:
+                rowcount = sum(len(rows) for rows in self._fetch_chunks(cursor, self.FETCH_SIZE))
+            else:
+                rowcount = cursor.rowcount
+            return {'success': True, 'rowcount': rowcount}
+        
+        if statement['read']:
+            return self._execute(work, "❌ Erro ao executar consulta", write=False, streaming=statement['streaming'])
+        return self._execute(work)
+    
+    def stream_query(self, query: str, params: tuple = None, chunk_size: int = None) -> Iterable[List[Tuple]]:
+        """Executa uma consulta e produz o resultado em blocos de chunk_size linhas"""
+        chunk_size = chunk_size or self.FETCH_SIZE
+        cursor = self._streaming_cursor(chunk_size)
+        failed = False
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            yield from self._fetch_chunks(cursor, chunk_size)
+        except Exception:
+            failed = True
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            if self._pending_writes:
+                logging.warning(f"⚠️ Rollback descartou {self._pending_writes} escrita(s) pendente(s)")
+                self._pending_writes = 0
+            self._pending_ids.clear()
+            self.connection.rollback()
+            raise
+        finally:
+            # Também ao fechar o gerador antes do fim (break no consumidor)
+            if not failed:
+                cursor.close()
+                self._end_read()
+    
+    def _insert_row(self, cursor, table: str, columns: Sequence[str], row: Tuple, id_column: str) -> int:
+        """Insere uma linha no cursor (comando do registro) e devolve o ID gerado"""
+        self.statements.execute(cursor, self.connection, self.statements.insert(table, columns, id_column), row)
+        if self.database_type == 'mysql':
+            return cursor.lastrowid
+        return cursor.fetchone()[0] if id_column else None
+    
+    def execute_insert(self, table: str, columns: Sequence[str], row: Tuple,
+                       id_column: str = 'id') -> Dict[str, Any]:
+        """Insere uma linha e devolve o ID gerado em result['ids']"""
+        def work(cursor):
+            ids = [self._insert_row(cursor, table, columns, row, id_column)]
+            self._track_ids(table, ids)
+            return {'success': True, 'rowcount': len(ids), 'ids': ids}
+        
+        return self._execute(work)
+    
+    def _insert_multi_values(self, cursor, table: str, columns: Sequence[str], rows: List[Tuple],
+                             chunk_size: int, id_column: Optional[str],
+                             placeholders: Sequence[str] = None, suffix: str = '') -> List[int]:
+        """Insere as linhas em blocos de INSERT ... VALUES (...), (...) e devolve os IDs gerados"""
+        column_list = ', '.join(columns)
+        row_placeholder = '(' + ', '.join(placeholders or ['%s'] * len(columns)) + ')'
+        output = f" OUTPUT INSERTED.{id_column}" if id_column and self.database_type == 'sqlserver' else ''
+        ids = []
+        
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            query = f"INSERT INTO {table} ({column_list}){output} VALUES " + ', '.join([row_placeholder] * len(chunk))
+            query += suffix
+            cursor.execute(query, tuple(value for row in chunk for value in row))
+            
+            if not id_column:
+                continue
+            if self.database_type == 'sqlserver':
+                ids.extend(fetched[0] for fetched in cursor.fetchall())
+            else:
+                # MySQL: lastrowid é o ID da primeira linha do comando e, para
+                # INSERTs simples, o InnoDB aloca o bloco de IDs de forma contígua
+                ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(chunk)))
+        
+        return ids
+    
+    def _insert_rows(self, cursor, table: str, columns: Sequence[str], rows: List[Tuple],
+                     id_column: Optional[str], placeholders: Sequence[str] = None,
+                     max_rows: int = None) -> List[int]:
+        """Insere as linhas no cursor pelo caminho multi-linha do dialeto e devolve os IDs gerados"""
+        max_rows = max_rows or len(rows)
+        if self.database_type == 'postgres':
+            column_list = ', '.join(columns)
+            returning = f" RETURNING {id_column}" if id_column else ''
+            fetched = psycopg2.extras.execute_values(
+                cursor,
+                f"INSERT INTO {table} ({column_list}) VALUES %s{returning}",
+                rows,
+                template='(' + ', '.join(placeholders) + ')' if placeholders else None,
+                page_size=min(len(rows), max_rows),
+                fetch=bool(id_column)
+            )
+            return [row[0] for row in fetched] if id_column else []
+        if self.database_type == 'sqlserver':
+            chunk_size = min(
+                SQLSERVER_MAX_ROWS_PER_INSERT,
+                (SQLSERVER_MAX_PARAMS_PER_STATEMENT - 1) // len(columns),
+                max_rows
+            )
+            return self._insert_multi_values(cursor, table, columns, rows, chunk_size, id_column, placeholders)
+        # MySQL
+        return self._insert_multi_values(cursor, table, columns, rows, min(MYSQL_MAX_ROWS_PER_INSERT, max_rows),
+                                         id_column, placeholders)
+    
+    def execute_batch(self, table: str, columns: Sequence[str], rows: List[Tuple],
+                      id_column: Optional[str] = 'id', placeholders: Sequence[str] = None,
+                      max_rows: int = None) -> Dict[str, Any]:
+        """Insere várias linhas em uma única operação, com um único commit"""
+        if not rows:
+            return {'success': True, 'rowcount': 0, 'ids': []}
+        
+        def work(cursor):
+            ids = self._insert_rows(cursor, table, columns, rows, id_column, placeholders, max_rows)
+            self._track_ids(table, ids)
+            return {'success': True, 'rowcount': len(rows), 'ids': ids}
+        
+        return self._execute(work, f"❌ Erro ao inserir lote em {table}")
+    
+    def upsert_rows(self, cursor, table: str, columns: Sequence[str], rows: List[Tuple],
+                    key_columns: Sequence[str]):
+        """Insere ou atualiza as linhas (pela chave key_columns) no cursor, sem confirmar"""
+        if not rows:
+            return
+        updates = [column for column in columns if column not in key_columns]
+        column_list = ', '.join(columns)
+        
+        if self.database_type == 'postgres':
+            action = ('DO UPDATE SET ' + ', '.join(f"{column} = EXCLUDED.{column}" for column in updates)
+                      if updates else 'DO NOTHING')
+            psycopg2.extras.execute_values(
+                cursor,
+                f"INSERT INTO {table} ({column_list}) VALUES %s ON CONFLICT ({', '.join(key_columns)}) {action}",
+                rows,
+                page_size=len(rows)
+            )
+            return
+        
+        if self.database_type == 'mysql':
+            assignments = updates or key_columns[:1]
+            self._insert_multi_values(
+                cursor, table, columns, rows, MYSQL_MAX_ROWS_PER_INSERT, None,
+                suffix=' ON DUPLICATE KEY UPDATE ' + ', '.join(f"{column} = VALUES({column})"
+                                                              for column in assignments)
+            )
+            return
+        
+        # SQL Server: a expressão (chave + 0) não herda o IDENTITY na tabela temporária
+        staging = f"#upsert_{table}"
+        select_list = ', '.join(f"{column} + 0 AS {column}" if column in key_columns else column
+                                for column in columns)
+        cursor.execute(f"IF OBJECT_ID('tempdb..{staging}') IS NULL "
+                       f"SELECT TOP 0 {select_list} INTO {staging} FROM {table}")
+        cursor.execute(f"TRUNCATE TABLE {staging}")
+        chunk_size = min(SQLSERVER_MAX_ROWS_PER_INSERT, SQLSERVER_MAX_PARAMS_PER_STATEMENT // len(columns))
+        self._insert_multi_values(cursor, staging, columns, rows, chunk_size, None)
+        
+        identity = f"IF OBJECTPROPERTY(OBJECT_ID('{table}'), 'TableHasIdentity') = 1 SET IDENTITY_INSERT {table}"
+        matched = (' WHEN MATCHED THEN UPDATE SET ' + ', '.join(f"{column} = origem.{column}" for column in updates)
+                   if updates else '')
+        cursor.execute(
+            f"{identity} ON; "
+            f"MERGE INTO {table} AS alvo USING {staging} AS origem "
+            f"ON {' AND '.join(f'alvo.{column} = origem.{column}' for column in key_columns)}{matched} "
+            f"WHEN NOT MATCHED THEN INSERT ({column_list}) "
+            f"VALUES ({', '.join(f'origem.{column}' for column in columns)}); "
+            f"{identity} OFF;"
+        )
+    
+    def scan_ids(self, table: str, id_column: str = 'id', start_after: int = 0,
+                 page_size: int = 10000) -> array:
+        """Lê os IDs da tabela maiores que ``start_after`` por varredura keyset (sem OFFSET)"""
+        if self.database_type == 'sqlserver':
+            query = f"SELECT TOP ({page_size}) {id_column} FROM {table} WHERE {id_column} > %s ORDER BY {id_column}"
+            params = lambda last_id: (last_id,)
+        else:
+            query = f"SELECT {id_column} FROM {table} WHERE {id_column} > %s ORDER BY {id_column} LIMIT %s"
+            params = lambda last_id: (last_id, page_size)
+        
+        ids = array('q')
+        last_id = start_after
+        cursor = self.connection.cursor()
+        try:
+            while True:
+                cursor.execute(query, params(last_id))
+                page = [row[0] for row in cursor.fetchall()]
+                ids.extend(page)
+                if len(page) < page_size:
+                    break
+                last_id = page[-1]
+        finally:
+            cursor.close()
+            # Encerrar a transação de leitura aberta pela varredura (sem
+            # antecipar o COMMIT de escritas pendentes)
+            if not self._pending_writes:
+                try:
+                    self.connection.commit()
+                except Exception:
+                    pass
+        return ids
+    
+    def load_ids(self, table: str, id_column: str = 'id', page_size: int = 10000) -> int:
+        """Carrega todos os IDs da tabela no cache"""
+        ids = self.scan_ids(table, id_column, page_size=page_size)
+        self.id_cache.replace(table, ids)
+        logging.info(f"🗂️  Cache de IDs de {table} carregado: {len(ids)} IDs")
+        return len(ids)
+    
+    def max_id(self, table: str, id_column: str = 'id') -> int:
+        """Maior ID atual da tabela (0 se vazia)"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT MAX({id_column}) FROM {table}")
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+            if not self._pending_writes:
+                self.connection.commit()
+        return (row[0] or 0) if row else 0
+    
+    # Bytes ocupados por uma tabela (dados, índices e LOB/TOAST)
+    TABLE_SIZE_QUERIES = {
+        'postgres': "SELECT pg_total_relation_size(%s)",
+        'mysql': "SELECT data_length + index_length FROM information_schema.tables "
+                 "WHERE table_schema = DATABASE() AND table_name = %s",
+        'sqlserver': "SELECT SUM(a.total_pages) * 8192 FROM sys.partitions p "
+                     "JOIN sys.allocation_units a ON a.container_id = p.partition_id "
+                     "WHERE p.object_id = OBJECT_ID(%s)",
+    }
+    
+    def table_size(self, table: str) -> Dict[str, int]:
+        """Linhas e bytes ocupados pela tabela (no MySQL atualiza as estatísticas antes)"""
+        cursor = self.connection.cursor()
+        try:
+            if self.database_type == 'mysql':
+                cursor.execute(f"ANALYZE TABLE {table}")
+                cursor.fetchall()
+            cursor.execute(self.TABLE_SIZE_QUERIES[self.database_type], (table,))
+            size = cursor.fetchone()[0] or 0
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            rows = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+            if not self._pending_writes:
+                self.connection.commit()
+        return {'rows': rows, 'bytes': int(size)}
+    
+    def bulk_load(self, table: str, columns: Sequence[str], rows: Iterable[Tuple],
+                  chunk_rows: int = 50000) -> int:
+        """Carrega um fluxo de linhas pelo caminho de carga em massa do banco"""
+        if self.database_type == 'postgres':
+            return self._copy_postgres(table, columns, rows)
+        elif self.database_type == 'mysql':
+            return self._load_data_mysql(table, columns, rows, chunk_rows)
+        return self._bulk_copy_sqlserver(table, columns, rows, chunk_rows)
+    
+    def _copy_postgres(self, table: str, columns: Sequence[str], rows: Iterable[Tuple]) -> int:
+        stream = CsvStream(rows)
+        cursor = self.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", stream)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return stream.rows
+    
+    def _load_data_mysql(self, table: str, columns: Sequence[str], rows: Iterable[Tuple],
+                         chunk_rows: int) -> int:
+        query = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            f"LINES TERMINATED BY '\\n' ({', '.join(columns)})"
+        )
+        total = 0
+        iterator = iter(rows)
+        cursor = self.connection.cursor()
+        try:
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_rows))
+                if not chunk:
+                    break
+                with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='', encoding='utf-8',
+                                                 delete=False) as chunk_file:
+                    csv.writer(chunk_file, lineterminator='\n').writerows(chunk)
+                try:
+                    cursor.execute(query, (chunk_file.name,))
+                    self.connection.commit()
+                finally:
+                    os.unlink(chunk_file.name)
+                total += len(chunk)
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        return total
+    
+    def _bulk_copy_sqlserver(self, table: str, columns: Sequence[str], rows: Iterable[Tuple],
+                             chunk_rows: int) -> int:
+        # O bulk copy do pymssql identifica as colunas pela posição (1-based) na tabela
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT name, column_id FROM sys.columns WHERE object_id = OBJECT_ID(%s)", (table,))
+        positions = {name.lower(): column_id for name, column_id in cursor.fetchall()}
+        cursor.close()
+        column_ids = [positions[column.lower()] for column in columns]
+        
+        counter = itertools.count(1)
+        counted = (row for row, _ in zip(rows, counter))
+        self.connection.bulk_copy(table, counted, column_ids=column_ids, batch_size=chunk_rows,
+                                  tablock=True, check_constraints=True)
+        return next(counter) - 1
+    
+    def execute_order(self, pedidos: List[Tuple], itens: List[List[Tuple[int, int]]]) -> Dict[str, Any]:
+        """Insere pedidos e seus itens em uma única transação"""
+        # MySQL com autocommit (política por comando): abre a transação explicitamente
+        explicit = self.database_type == 'mysql' and self.commit_policy.mode == 'statement'
+        
+        def work(cursor):
+            if explicit:
+                self.connection.begin()
+            if len(pedidos) == 1:
+                pedido_ids = [self._insert_row(cursor, 'pedidos', ('cliente_id', 'data_pedido'), pedidos[0], 'id')]
+            else:
+                pedido_ids = self._insert_rows(cursor, 'pedidos', ('cliente_id', 'data_pedido'), pedidos, 'id')
+            item_rows = [(pedido_id, produto_id, quantidade)
+                         for pedido_id, order_items in zip(pedido_ids, itens)
+                         for produto_id, quantidade in order_items]
+            self._insert_rows(cursor, 'itens_pedido', ('pedido_id', 'produto_id', 'quantidade'), item_rows, None)
+            if explicit:
+                self.connection.commit()
+            self._track_ids('pedidos', pedido_ids)
+            return {'success': True, 'rowcount': len(pedido_ids) + len(item_rows),
+                    'ids': pedido_ids, 'items': len(item_rows)}
+        
+        return self._execute(work, "❌ Erro ao inserir pedido")
+    
+    @timed_operation('id_lookup')
+    def get_random_existing_ids(self, table: str, count: int, distinct: bool = False,
+                                id_column: str = 'id') -> List[int]:
+        """Obtém ``count`` IDs existentes de uma tabela (via cache em memória)"""
+        try:
+            if self.id_cache.needs_refresh(table):
+                self.load_ids(table, id_column)
+            return self.id_cache.sample_many(table, count, distinct)
+        except Exception as e:
+            logging.error(f"❌ Erro ao buscar IDs aleatórios: {e}")
+            if not self.pool.ping(self.connection):
+                self.reconnect()
+            return []
+    
+    @timed_operation('id_lookup')
+    def get_random_existing_id(self, table: str, id_column: str = 'id') -> int:
+        """Obtém um ID aleatório existente de uma tabela (via cache em memória)"""
+        try:
+            if self.id_cache.needs_refresh(table):
+                self.load_ids(table, id_column)
+            return self.id_cache.sample(table)
+        except Exception as e:
+            logging.error(f"❌ Erro ao buscar ID aleatório: {e}")
+            if not self.pool.ping(self.connection):
+                self.reconnect()
+            return None
+    
+    def check_tables_exist(self) -> bool:
+        """Verifica as tabelas no catálogo e cria apenas as que faltam (veja ``SchemaBootstrap``)"""
+        return SchemaBootstrap(self).ensure()
+    
+    def build_cliente_row(self) -> Tuple[str, str]:
+        """Gera os valores (nome, email) de um cliente"""
+        nome = random.choice(self.sample_names)
+        # Sufixo de 48 bits do sistema (fora da semente): evita colisões com o UNIQUE(email)
+        email = f"{nome.lower().replace(' ', '.')}_{os.urandom(6).hex()}@email.com"
+        return (nome, email)
+    
+    @timed_operation('insert', 'clientes')
+    def insert_cliente(self, rows: List[Tuple] = None) -> bool:
+        """Insere um novo cliente (ou um lote, se batch_size > 1)"""
+        if rows is None:
+            rows = self.generator.batch('clientes', self.batch_size) if self.batch_size > 1 else [self.build_cliente_row()]
+        self._record('insert', 'clientes', rows=rows)
+        if len(rows) > 1:
+            result = self.execute_batch('clientes', ('nome', 'email'), rows)
+            if result['success']:
+                logging.log(self.operation_log_level, f"➕ Lote de clientes inserido: {result['rowcount']} linhas")
+                return True
+            return False
+        
+        nome, email = rows[0]
+        result = self.execute_insert('clientes', ('nome', 'email'), (nome, email))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"➕ Cliente inserido: {nome} ({email})")
+            return True
+        return False
+    
+    @timed_operation('update', 'clientes')
+    def update_cliente(self, cliente_id: int = None, novo_nome: str = None) -> bool:
+        """Atualiza um cliente existente"""
+        if cliente_id is None:
+            cliente_id = self.get_random_existing_id('clientes')
+            if not cliente_id:
+                return False
+            novo_nome = random.choice(self.sample_names) + " (Atualizado)"
+        self._record('update', 'clientes', cliente_id=cliente_id, novo_nome=novo_nome)
+        
+        result = self.execute_statement('update_cliente', (novo_nome, cliente_id))
+        
+        if result['success'] and result['rowcount'] > 0:
+            logging.log(self.operation_log_level, f"🔄 Cliente atualizado: ID {cliente_id} -> {novo_nome}")
+            return True
+        if result['success']:
+            self.id_cache.discard('clientes', cliente_id)
+        return False
+    
+    def build_produto_row(self) -> Tuple[str, float]:
+        """Gera os valores (nome, preco) de um produto"""
+        nome, preco_base = random.choice(self.sample_products)
+        preco = round(preco_base * random.uniform(0.8, 1.2), 2)
+        return (nome, preco)
+    
+    @timed_operation('insert', 'produtos')
+    def insert_produto(self, rows: List[Tuple] = None) -> bool:
+        """Insere um novo produto (ou um lote, se batch_size > 1)"""
+        if rows is None:
+            rows = self.generator.batch('produtos', self.batch_size) if self.batch_size > 1 else [self.build_produto_row()]
+        self._record('insert', 'produtos', rows=rows)
+        if len(rows) > 1:
+            result = self.execute_batch('produtos', ('nome', 'preco'), rows)
+            if result['success']:
+                logging.log(self.operation_log_level, f"➕ Lote de produtos inserido: {result['rowcount']} linhas")
+                return True
+            return False
+        
+        nome, preco = rows[0]
+        result = self.execute_insert('produtos', ('nome', 'preco'), (nome, preco))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"➕ Produto inserido: {nome} (R$ {preco})")
+            return True
+        return False
+    
+    @timed_operation('update', 'produtos')
+    def update_produto(self, produto_id: int = None, variacao: float = None) -> bool:
+        """Atualiza um produto existente"""
+        if produto_id is None:
+            produto_id = self.get_random_existing_id('produtos')
+            if not produto_id:
+                return False
+            variacao = random.uniform(0.9, 1.15)
+        self._record('update', 'produtos', produto_id=produto_id, variacao=variacao)
+        
+        result = self.execute_statement('update_produto', (variacao, produto_id))
+        
+        if result['success'] and result['rowcount'] > 0:
+            logging.log(self.operation_log_level, f"🔄 Produto atualizado: ID {produto_id} (preço ajustado em {(variacao-1)*100:.1f}%)")
+            return True
+        if result['success']:
+            self.id_cache.discard('produtos', produto_id)
+        return False
+    
+    def build_log_row(self) -> Tuple[str]:
+        """Gera os valores (mensagem,) de uma entrada de log"""
+        return (random.choice(self.sample_messages),)
+    
+    @timed_operation('insert', 'logs')
+    def insert_log(self, rows: List[Tuple] = None) -> bool:
+        """Insere uma entrada no log (ou um lote, se batch_size > 1)"""
+        if rows is None:
+            rows = self.generator.batch('logs', self.batch_size) if self.batch_size > 1 else [self.build_log_row()]
+        self._record('insert', 'logs', rows=rows)
+        if len(rows) > 1:
+            result = self.execute_batch('logs', ('mensagem',), rows)
+            if result['success']:
+                logging.log(self.operation_log_level, f"📝 Lote de logs inserido: {result['rowcount']} linhas")
+                return True
+            return False
+        
+        mensagem, = rows[0]
+        result = self.execute_insert('logs', ('mensagem',), (mensagem,))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"📝 Log inserido: {mensagem}")
+            return True
+        return False
+    
+    def build_generic_row(self) -> Tuple[str, str, str, str]:
+        """Gera os valores (tipo, chave, valor, metadata) de um registro generic"""
+        tipo = random.choice(self.sample_generic_types)
+        chave = random.choice(self.sample_generic_keys)
+        valor = random.choice(self.sample_generic_values)
+        
+        # Gerar metadata JSON-like
+        metadata = f'{{"timestamp": "{datetime.datetime.now().isoformat()}", "source": "auto-system", "version": "{random.randint(1, 10)}.{random.randint(0, 9)}"}}'
+        return (tipo, chave, valor, metadata)
+    
+    @timed_operation('insert', 'generic')
+    def insert_generic(self, rows: List[Tuple] = None) -> bool:
+        """Insere um novo registro na tabela generic (ou um lote, se batch_size > 1)"""
+        if rows is None:
+            rows = self.generator.batch('generic', self.batch_size) if self.batch_size > 1 else [self.build_generic_row()]
+        self._record('insert', 'generic', rows=rows)
+        if len(rows) > 1:
+            result = self.execute_batch('generic', ('tipo', 'chave', 'valor', 'metadata'), rows)
+            if result['success']:
+                logging.log(self.operation_log_level, f"🔧 Lote generic inserido: {result['rowcount']} linhas")
+                return True
+            return False
+        
+        tipo, chave, valor, metadata = rows[0]
+        result = self.execute_insert('generic', ('tipo', 'chave', 'valor', 'metadata'),
+                                     (tipo, chave, valor, metadata))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"🔧 Generic inserido: {tipo} -> {chave} = {valor}")
+            return True
+        return False
+    
+    @timed_operation('update', 'generic')
+    def update_generic(self, generic_id: int = None, novo_valor: str = None, novo_metadata: str = None) -> bool:
+        """Atualiza um registro existente na tabela generic"""
+        if generic_id is None:
+            generic_id = self.get_random_existing_id('generic')
+            if not generic_id:
+                return False
+            novo_valor = random.choice(self.sample_generic_values)
+            novo_metadata = f'{{"timestamp": "{datetime.datetime.now().isoformat()}", "source": "auto-update", "operation": "scheduled_update"}}'
+        self._record('update', 'generic', generic_id=generic_id, novo_valor=novo_valor, novo_metadata=novo_metadata)
+        
+        result = self.execute_statement('update_generic', (novo_valor, novo_metadata, generic_id))
+        
+        if result['success'] and result['rowcount'] > 0:
+            logging.log(self.operation_log_level, f"🔧 Generic atualizado: ID {generic_id} -> {novo_valor}")
+            return True
+        if result['success']:
+            self.id_cache.discard('generic', generic_id)
+        return False
+    
+    @timed_operation('insert', 'generic_table')
+    def insert_generic_table(self, count: int = None, blob_size: int = None) -> bool:
+        """Insere count linhas largas na generic_table (padrão: batch_size), com todos os tipos de coluna"""
+        generator = self.generator.generic_table
+        generator.blob_size = blob_size if blob_size is not None else self.blob_size
+        count = count or self.batch_size
+        self._record('insert', 'generic_table', count=count, blob_size=generator.blob_size)
+        
+        result = self.execute_batch('generic_table', generator.columns, generator.batch(count), id_column=None,
+                                    **generator.insert_options())
+        if result['success']:
+            logging.log(self.operation_log_level, f"🧱 generic_table: {result['rowcount']} linhas inseridas "
+                                                  f"({len(generator.columns)} colunas)")
+            return True
+        return False
+    
+    def build_itens_pedido(self, max_items: int = 5) -> List[Tuple[int, int]]:
+        """Gera os pares (produto_id, quantidade) de um pedido, com produtos distintos do cache"""
+        produto_ids = self.get_random_existing_ids('produtos', random.randint(1, max_items), distinct=True)
+        return [(produto_id, random.randint(1, 10)) for produto_id in produto_ids]
+    
+    @timed_operation('insert', 'pedidos')
+    def insert_pedido(self, cliente_ids: List[int] = None, itens: List[List[Tuple[int, int]]] = None) -> bool:
+        """Cria um pedido com 1-5 itens (ou um lote de pedidos, se batch_size > 1) em uma transação"""
+        if cliente_ids is None:
+            cliente_ids = self.get_random_existing_ids('clientes', self.batch_size)
+            if not cliente_ids:
+                return False
+            itens = [self.build_itens_pedido() for _ in cliente_ids]
+            if not all(itens):
+                return False
+        self._record('insert', 'pedidos', cliente_ids=cliente_ids, itens=itens)
+        
+        hoje = datetime.date.today()
+        pedidos = [(cliente_id, hoje) for cliente_id in cliente_ids]
+        result = self.execute_order(pedidos, itens)
+        if not result['success']:
+            return False
+        if len(pedidos) > 1:
+            logging.log(self.operation_log_level, f"🛒 Lote de pedidos inserido: {len(pedidos)} pedidos, {result['items']} itens")
+        else:
+            logging.log(self.operation_log_level, f"🛒 Pedido inserido: ID {result['ids'][0]} (cliente {cliente_ids[0]}, {result['items']} itens)")
+        return True
+    
+    @timed_operation('select', 'clientes')
+    def select_cliente(self, cliente_id: int = None) -> bool:
+        """Consulta um cliente pela chave primária"""
+        if cliente_id is None:
+            cliente_id = self.get_random_existing_id('clientes')
+            if not cliente_id:
+                return False
+        self._record('select', 'clientes', cliente_id=cliente_id)
+        
+        result = self.execute_statement('select_cliente', (cliente_id,))
+        
+        if result['success'] and result['rowcount'] > 0:
+            logging.log(self.operation_log_level, f"🔎 Cliente consultado: ID {cliente_id}")
+            return True
+        if result['success']:
+            self.id_cache.discard('clientes', cliente_id)
+        return False
+    
+    @timed_operation('select', 'produtos')
+    def select_produto(self, produto_id: int = None) -> bool:
+        """Consulta um produto pela chave primária"""
+        if produto_id is None:
+            produto_id = self.get_random_existing_id('produtos')
+            if not produto_id:
+                return False
+        self._record('select', 'produtos', produto_id=produto_id)
+        
+        result = self.execute_statement('select_produto', (produto_id,))
+        
+        if result['success'] and result['rowcount'] > 0:
+            logging.log(self.operation_log_level, f"🔎 Produto consultado: ID {produto_id}")
+            return True
+        if result['success']:
+            self.id_cache.discard('produtos', produto_id)
+        return False
+    
+    @timed_operation('select', 'logs')
+    def scan_logs(self, janela: int = None) -> bool:
+        """Varre os logs criados nos últimos janela segundos (faixa de created_at)"""
+        if janela is None:
+            janela = self.LOG_SCAN_WINDOW
+        self._record('select', 'logs', janela=janela)
+        
+        result = self.execute_statement('scan_logs', (janela,))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"🔎 Logs dos últimos {janela}s: {result['rowcount']} linhas")
+            return True
+        return False
+    
+    @timed_operation('select', 'pedidos')
+    def aggregate_pedidos(self, cliente_id: int = None, faixa: int = None) -> bool:
+        """Agregado clientes x pedidos (pedidos por cliente) em uma faixa de IDs de clientes"""
+        if cliente_id is None:
+            cliente_id = self.get_random_existing_id('clientes')
+            if not cliente_id:
+                return False
+        if faixa is None:
+            faixa = self.AGGREGATE_RANGE
+        self._record('select', 'pedidos', cliente_id=cliente_id, faixa=faixa)
+        
+        result = self.execute_statement('aggregate_pedidos', (cliente_id, cliente_id + faixa - 1))
+        
+        if result['success']:
+            logging.log(self.operation_log_level, f"📊 Pedidos por cliente a partir do ID {cliente_id}: {result['rowcount']} clientes")
+            return True
+        return False
+    
+    def should_execute_generic_operations(self) -> bool:
+        """Verifica se deve executar operações na tabela generic (a cada 30 segundos)"""
+        current_time = time.time()
+        if current_time - self.last_generic_operation >= 30:
+            self.last_generic_operation = current_time
+            return True
+        return False
+    
+    def execute_generic_operations_cycle(self):
+        """Executa operações específicas na tabela generic"""
+        logging.info("⏰ Executando ciclo especial da tabela GENERIC (30s)")
+        
+        operations = [
+            ('INSERT Generic', self.insert_generic),
+            ('UPDATE Generic', self.update_generic)
+        ]
+        
+        # Executar 1-2 operações na tabela generic
+        num_operations = random.randint(1, 2)
+        selected_operations = random.sample(operations, num_operations)
+        
+        success_count = 0
+        for operation_name, operation_func in selected_operations:
+            try:
+                if operation_func():
+                    success_count += 1
+                time.sleep(0.5)  # Pequena pausa entre operações
+            except Exception as e:
+                logging.error(f"❌ Erro na operação {operation_name}: {e}")
+        
+        self.end_cycle()
+        logging.info(f"🔧 Ciclo GENERIC concluído: {success_count}/{len(selected_operations)} operações executadas")
+    
+    def get_operations(self) -> List[Tuple[str, Any]]:
+        """Lista de operações (nome, função) do mix padrão"""
+        return [
+            ('INSERT Cliente', self.insert_cliente),
+            ('UPDATE Cliente', self.update_cliente),
+            ('INSERT Produto', self.insert_produto),
+            ('UPDATE Produto', self.update_produto),
+            ('INSERT Log', self.insert_log),
+            ('INSERT Pedido', self.insert_pedido),
+            ('INSERT Generic', self.insert_generic),
+            ('UPDATE Generic', self.update_generic)
+        ]
+    
+    def execute_operations_cycle(self):
+        """Executa um ciclo completo de operações"""
         # Verificar se deve executar operações da tabela generic (a cada 30 segundos)
         if self.should_execute_generic_operations():
             self.execute_generic_operations_cycle()
         
-        operations = [
-            ('INSERT Cliente', self.insert_cliente),
-            ('UPDATE Cliente', self.update_cliente),
-            ('INSERT Produto', self.insert_produto),
-            ('UPDATE Produto', self.update_produto),
-            ('INSERT Log', self.insert_log),
-            ('INSERT Generic', self.insert_generic),
-            ('UPDATE Generic', self.update_generic)
-        ]
+        operations = self.get_operations()
+        
+        # Executar 2-4 operações aleatórias por ciclo (incluindo generic ocasionalmente)
+        num_operations = random.randint(2, 4)
+        selected_operations = random.sample(operations, num_operations)
+        
+        success_count = 0
+        for operation_name, operation_func in selected_operations:
+            try:
+                if operation_func():
+                    success_count += 1
+                time.sleep(1)  # Pequena pausa entre operações
+            except Exception as e:
+                logging.error(f"❌ Erro na operação {operation_name}: {e}")
+        
+        self.end_cycle()
+        logging.info(f"✅ Ciclo concluído: {success_count}/{len(selected_operations)} operações executadas com sucesso")
+    
+    def run_demo(self, duration_seconds: int = 20, metrics_interval: float = 60):
+        """Executa uma demonstração por tempo limitado"""
+        logging.info(f"🚀 Iniciando demonstração do gerenciamento automático ({self.database_type.upper()})")
+        logging.info(f"⏰ Duração: {duration_seconds} segundos")
+        
+        # Verificar/criar tabelas para todos os bancos
+        if not self.check_tables_exist():
+            logging.error("❌ Falha ao verificar/criar tabelas")
+            return
+        
+        start_time = time.time()
+        last_metrics = start_time
+        cycles = 0
+        
+        while time.time() - start_time < duration_seconds:
+            try:
+                cycles += 1
+                logging.info(f"🔄 Executando ciclo {cycles}")
+                self.execute_operations_cycle()
+                
+                if metrics_interval and time.time() - last_metrics >= metrics_interval:
+                    self.metrics.log_interval()
+                    last_metrics = time.time()
+                
+                # Aguardar próximo ciclo (máximo 8 segundos)
+                wait_time = min(8, duration_seconds - (time.time() - start_time))
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                    
+            except Exception as e:
+                logging.error(f"❌ Erro no ciclo {cycles}: {e}")
+                time.sleep(2)
+        
+        logging.info(f"🎉 Demonstração concluída! Executados {cycles} ciclos em {duration_seconds} segundos")
+        self.metrics.log_report(time.time() - start_time)
+
+class RateLimiter:
+    """Limitador de taxa (operações por segundo) compartilhado entre workers"""
+    
+    def __init__(self, ops_per_second: float = 0):
+        self.interval = 1.0 / ops_per_second if ops_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+    
+    def reserve(self) -> float:
+        """Reserva o próximo slot e devolve quantos segundos faltam para ele"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        return slot - time.monotonic()
+    
+    def acquire(self, stop_event: threading.Event = None):
+        """Bloqueia até o próximo slot disponível"""
+        delay = self.reserve()
+        if delay > 0:
+            if stop_event is not None:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+
+class WorkerStats:
+    """Contadores de sucesso/erro por operação, seguros entre threads"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.operations: Dict[str, List[int]] = {}
+        self.commits = 0
+    
+    def add_commits(self, commits: int):
+        with self._lock:
+            self.commits += commits
+    
+    def record(self, operation_name: str, success: bool):
+        with self._lock:
+            counters = self.operations.setdefault(operation_name, [0, 0])
+            counters[0 if success else 1] += 1
+    
+    def merge(self, operations: Dict[str, List[int]]):
+        with self._lock:
+            for operation_name, (ok, failed) in operations.items():
+                counters = self.operations.setdefault(operation_name, [0, 0])
+                counters[0] += ok
+                counters[1] += failed
+    
+    def snapshot(self) -> Dict[str, List[int]]:
+        with self._lock:
+            return {name: list(counters) for name, counters in self.operations.items()}
+    
+    def total(self) -> int:
+        with self._lock:
+            return sum(ok + failed for ok, failed in self.operations.values())
+
+def run_worker(worker_id: int, database_type: str, stop_event, limiter: RateLimiter,
+               stats: WorkerStats, batch_size: int = 1, id_cache: IdCache = None,
+               progress=None, pool: ConnectionPool = None, commit_policy: CommitPolicy = None,
+               metrics: OperationMetrics = None, recorder: TraceRecorder = None):
+    """Loop de um worker: conexão própria, mix padrão de operações até stop_event"""
+    manager = DataManager(database_type, batch_size=batch_size, id_cache=id_cache, pool=pool,
+                          commit_policy=commit_policy, metrics=metrics)
+    manager.operation_log_level = logging.DEBUG
+    manager.recorder = recorder
+    manager.worker_id = worker_id
+    
+    if not manager.connect():
+        logging.error(f"❌ Worker {worker_id}: falha ao conectar")
+        return
+    
+    operations = manager.get_operations()
+    cycle_remaining = random.randint(2, 4)
+    try:
+        while not stop_event.is_set():
+            limiter.acquire(stop_event)
+            if stop_event.is_set():
+                break
+            operation_name, operation_func = random.choice(operations)
+            try:
+                success = bool(operation_func())
+            except Exception as e:
+                logging.error(f"❌ Worker {worker_id}: erro na operação {operation_name}: {e}")
+                success = False
+            stats.record(operation_name, success)
+            if progress is not None:
+                with progress.get_lock():
+                    progress.value += 1
+            
+            cycle_remaining -= 1
+            if cycle_remaining == 0:
+                manager.end_cycle()
+                cycle_remaining = random.randint(2, 4)
+    finally:
+        manager.disconnect()
+        stats.add_commits(manager.commits)
+
+def _process_worker(worker_id: int, database_type: str, stop_event, ops_per_second: float,
+                    batch_size: int, id_refresh: float, progress, results, commit_policy: str):
+    """Ponto de entrada de um worker no modo processo"""
+    stats = WorkerStats()
+    metrics = OperationMetrics()
+    run_worker(worker_id, database_type, stop_event, RateLimiter(ops_per_second), stats,
+               batch_size, IdCache(id_refresh), progress, commit_policy=CommitPolicy.parse(commit_policy),
+               metrics=metrics)
+    results.put((stats.snapshot(), stats.commits, metrics.snapshot()))
+
+class LoadEngine:
+    """Motor de carga com vários workers concorrentes (threads ou processos)"""
+    
+    def __init__(self, database_type: str, workers: int = 4, target_ops: float = 0,
+                 mode: str = 'thread', batch_size: int = 1, id_refresh: float = 300,
+                 report_interval: float = 5, commit_policy: CommitPolicy = None,
+                 metrics_interval: float = 30, recorder: TraceRecorder = None):
+        self.database_type = database_type
+        self.recorder = recorder
+        self.commit_policy = commit_policy or CommitPolicy()
+        self.workers = max(1, workers)
+        self.target_ops = target_ops
+        self.mode = mode
+        self.batch_size = batch_size
+        self.id_refresh = id_refresh
+        self.report_interval = report_interval
+        self.metrics_interval = metrics_interval
+        self.stats = WorkerStats()
+        self.metrics = OperationMetrics()
+        self.pool: ConnectionPool = None
+        self._last_metrics = 0.0
+    
+    def _log_metrics_interval(self):
+        """Resumo periódico de latências, a cada ``metrics_interval`` segundos"""
+        if not self.metrics_interval or self.mode == 'process':
+            return
+        now = time.monotonic()
+        if now - self._last_metrics >= self.metrics_interval:
+            self.metrics.log_interval()
+            self._last_metrics = now
+    
+    def _prepare_schema(self) -> bool:
+        """Verifica/cria as tabelas uma única vez antes de iniciar os workers"""
+        manager = DataManager(self.database_type)
+        if not manager.connect():
+            return False
+        try:
+            return manager.check_tables_exist()
+        finally:
+            manager.disconnect()
+    
+    def _wait(self, duration_seconds: float, stop_event, total_ops) -> float:
+        """Aguarda o fim da execução registrando o progresso periodicamente"""
+        start_time = time.monotonic()
+        last_report, last_total = start_time, 0
+        self._last_metrics = start_time
+        try:
+            while True:
+                elapsed = time.monotonic() - start_time
+                if elapsed >= duration_seconds:
+                    break
+                time.sleep(min(self.report_interval, duration_seconds - elapsed))
+                now, current = time.monotonic(), total_ops()
+                rate = (current - last_total) / (now - last_report) if now > last_report else 0.0
+                logging.info(f"📈 {self.database_type.upper()}: {current} operações ({rate:.1f} ops/s)")
+                last_report, last_total = now, current
+                self._log_metrics_interval()
+        finally:
+            stop_event.set()
+        return time.monotonic() - start_time
+    
+    def run(self, duration_seconds: float) -> Dict[str, Any]:
+        """Executa a carga por ``duration_seconds`` e devolve o resumo"""
+        logging.info(
+            f"🚀 Iniciando carga em {self.database_type.upper()}: {self.workers} workers ({self.mode}), "
+            f"taxa alvo {self.target_ops or 'ilimitada'} ops/s"
+        )
+        if not self._prepare_schema():
+            logging.error("❌ Falha ao verificar/criar tabelas")
+            return {}
+        
+        if self.mode == 'process':
+            stop_event = multiprocessing.Event()
+            progress = multiprocessing.Value('q', 0)
+            results = multiprocessing.Queue()
+            workers = [
+                multiprocessing.Process(
+                    target=_process_worker,
+                    args=(i, self.database_type, stop_event, self.target_ops / self.workers,
+                          self.batch_size, self.id_refresh, progress, results, str(self.commit_policy))
+                )
+                for i in range(self.workers)
+            ]
+            total_ops = lambda: progress.value
+        else:
+            stop_event = threading.Event()
+            limiter = RateLimiter(self.target_ops)
+            id_cache = IdCache(self.id_refresh)
+            self.pool = ConnectionPool(self.database_type, min_size=self.workers, max_size=self.workers)
+            workers = [
+                threading.Thread(
+                    target=run_worker,
+                    args=(i, self.database_type, stop_event, limiter, self.stats,
+                          self.batch_size, id_cache, None, self.pool, self.commit_policy, self.metrics,
+                          self.recorder),
+                    daemon=True
+                )
+                for i in range(self.workers)
+            ]
+            total_ops = self.stats.total
+        
+        for worker in workers:
+            worker.start()
+        
+        elapsed = self._wait(duration_seconds, stop_event, total_ops)
+        
+        if self.mode == 'process':
+            for _ in workers:
+                try:
+                    operations, commits, metrics = results.get(timeout=30)
+                    self.stats.merge(operations)
+                    self.stats.add_commits(commits)
+                    self.metrics.merge(metrics)
+                except Exception:
+                    logging.warning("⚠️ Resultado de um worker não recebido")
+        for worker in workers:
+            worker.join()
+        if self.pool is not None:
+            self.pool.close()
+        
+        return self.report(elapsed)
+    
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Registra e devolve o resumo da execução"""
+        operations = self.stats.snapshot()
+        ok_total = sum(ok for ok, _ in operations.values())
+        failed_total = sum(failed for _, failed in operations.values())
+        throughput = (ok_total + failed_total) / elapsed if elapsed > 0 else 0.0
+        
+        logging.info(f"🎉 Carga concluída em {self.database_type.upper()}: {ok_total + failed_total} operações "
+                     f"em {elapsed:.1f}s ({throughput:.1f} ops/s, {failed_total} falhas)")
+        if self.stats.commits:
+            logging.info(f"💾 Commits ({self.commit_policy}): {self.stats.commits} "
+                         f"({(ok_total + failed_total) / self.stats.commits:.1f} operações por commit)")
+        for operation_name, (ok, failed) in sorted(operations.items()):
+            logging.info(f"   {operation_name:<16} ok={ok:<8} falhas={failed}")
+        if self.pool is not None and self.pool.reconnects:
+            logging.info(f"🔁 Reconexões no pool: {self.pool.reconnects}")
+        self.metrics.log_report(elapsed)
+        
+        return {
+            'database': self.database_type,
+            'elapsed_seconds': elapsed,
+            'operations': operations,
+            'ok': ok_total,
+            'failed': failed_total,
+            'commits': self.stats.commits,
+            'commit_policy': str(self.commit_policy),
+            'ops_per_second': throughput,
+            'latency': self.metrics.summary()
+        }
+
+def compare_commit_policies(database_type: str, policies: List[str], duration_seconds: float,
+                            workers: int = 1, **engine_options) -> List[Dict[str, Any]]:
+    """Executa a mesma carga com cada política de commit e compara a vazão"""
+    reports = []
+    for spec in policies:
+        engine = LoadEngine(database_type, workers=workers, commit_policy=CommitPolicy.parse(spec),
+                            **engine_options)
+        report = engine.run(duration_seconds)
+        if report:
+            reports.append(report)
+    
+    if not reports:
+        return reports
+    
+    baseline = reports[0]['ops_per_second'] or 1.0
+    logging.info(f"📊 Comparação de políticas de commit ({database_type.upper()}, {workers} workers):")
+    logging.info(f"   {'política':<14} {'ops/s':>10} {'commits':>9} {'ops/commit':>11} {'vs. ' + reports[0]['commit_policy']:>14}")
+    for report in reports:
+        ops = report['ok'] + report['failed']
+        per_commit = ops / report['commits'] if report['commits'] else float('nan')
+        logging.info(f"   {report['commit_policy']:<14} {report['ops_per_second']:>10.1f} {report['commits']:>9} "
+                     f"{per_commit:>11.1f} {report['ops_per_second'] / baseline:>13.2f}x")
+    return reports
+
+class TraceReplayer(LoadEngine):
+    """Reexecuta um trace gravado com --record contra qualquer banco"""
+    
+    QUEUE_SIZE = 1000
+    
+    def __init__(self, database_type: str, path: str, speed: float = 1.0, commit_policy: CommitPolicy = None,
+                 report_interval: float = 5, metrics_interval: float = 30):
+        self.path = path
+        self.header = TraceRecorder.read_header(path)
+        super().__init__(database_type, workers=self.header.get('workers', 1), mode='replay',
+                         batch_size=self.header.get('batch_size', 1), report_interval=report_interval,
+                         commit_policy=commit_policy or CommitPolicy.parse(self.header.get('commit_policy', 'statement')),
+                         metrics_interval=metrics_interval)
+        self.speed = speed
+        self._replay_tag = os.urandom(3).hex()
+        self._id_cache = IdCache()
+    
+    def _params(self, operation: str, table: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Converte os parâmetros do JSON (listas) de volta para tuplas"""
+        params = dict(params)
+        if 'rows' in params:
+            rows = [tuple(row) for row in params['rows']]
+            if table == 'clientes':
+                rows = [(nome, email.replace('@', f".r{self._replay_tag}@", 1)) for nome, email in rows]
+            params['rows'] = rows
+        if 'itens' in params:
+            params['itens'] = [[tuple(item) for item in order_items] for order_items in params['itens']]
+        return params
+    
+    def _replay_worker(self, worker_id: int, events: 'queue.Queue', start_time: float, stop_event: threading.Event):
+        manager = DataManager(self.database_type, batch_size=self.batch_size, id_cache=self._id_cache,
+                              pool=self.pool, commit_policy=self.commit_policy, metrics=self.metrics)
+        manager.operation_log_level = logging.DEBUG
+        manager.worker_id = worker_id
+        connected = manager.connect()
+        if not connected:
+            logging.error(f"❌ Worker {worker_id}: falha ao conectar")
+        try:
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+                if not connected or stop_event.is_set():
+                    continue
+                if self.speed:
+                    delay = start_time + event['t'] / self.speed - time.monotonic()
+                    if delay > 0 and stop_event.wait(delay):
+                        continue
+                
+                if event['op'] == 'end_cycle':
+                    manager.end_cycle()
+                    continue
+                operation_name, method = DataManager.TRACE_OPERATIONS[(event['op'], event.get('table'))]
+                try:
+                    success = bool(getattr(manager, method)(**self._params(event['op'], event.get('table'),
+                                                                          event.get('params', {}))))
+                except Exception as e:
+                    logging.error(f"❌ Worker {worker_id}: erro na operação {operation_name}: {e}")
+                    success = False
+                self.stats.record(operation_name, success)
+        finally:
+            if connected:
+                manager.disconnect()
+            self.stats.add_commits(manager.commits)
+    
+    def run(self, duration_seconds: float = None) -> Dict[str, Any]:
+        """Reexecuta o trace inteiro (ou até ``duration_seconds``) e devolve o resumo"""
+        speed = f"{self.speed:g}x" if self.speed else 'máxima'
+        logging.info(f"⏯️ Reexecutando {self.path} em {self.database_type.upper()} "
+                     f"(gravado em {self.header.get('engine', '?')}, {self.workers} workers, velocidade {speed})")
+        if not self._prepare_schema():
+            logging.error("❌ Falha ao verificar/criar tabelas")
+            return {}
+        
+        self.pool = ConnectionPool(self.database_type, min_size=1, max_size=self.workers)
+        stop_event = threading.Event()
+        queues: Dict[int, queue.Queue] = {}
+        threads = []
+        events = TraceRecorder.read_events(self.path)
+        
+        start_time = time.monotonic()
+        last_report, last_total = start_time, 0
+        self._last_metrics = start_time
+        try:
+            for event in events:
+                worker_id = event.get('w', 0)
+                if worker_id not in queues:
+                    queues[worker_id] = queue.Queue(self.QUEUE_SIZE)
+                    thread = threading.Thread(target=self._replay_worker,
+                                              args=(worker_id, queues[worker_id], start_time, stop_event),
+                                              daemon=True)
+                    thread.start()
+                    threads.append(thread)
+                queues[worker_id].put(event)
+                
+                now = time.monotonic()
+                if duration_seconds and now - start_time >= duration_seconds:
+                    break
+                if now - last_report >= self.report_interval:
+                    current = self.stats.total()
+                    logging.info(f"📈 {self.database_type.upper()} (replay): {current} operações "
+                                 f"({(current - last_total) / (now - last_report):.1f} ops/s)")
+                    last_report, last_total = now, current
+                    self._log_metrics_interval()
+        except KeyboardInterrupt:
+            stop_event.set()
+        finally:
+            for events_queue in queues.values():
+                events_queue.put(None)
+            for thread in threads:
+                thread.join()
+            self.pool.close()
+        
+        return self.report(time.monotonic() - start_time)
+
+def replay_main(argv: List[str]):
+    """Comando replay: reexecuta um trace gravado com --record"""
+    parser = argparse.ArgumentParser(
+        prog='auto-data-manager.py replay',
+        description='Reexecuta um trace de carga (JSONL, opcionalmente .gz) contra um banco'
+    )
+    parser.add_argument('trace', help='Arquivo gravado com --record')
+    parser.add_argument('database_type', choices=['mysql', 'postgres', 'sqlserver'])
+    parser.add_argument('--speed', default='1',
+                        help="Velocidade: 1 (tempo original), N (N vezes mais rápido) ou max (padrão: 1)")
+    parser.add_argument('--commit-policy', default=None,
+                        help='Política de COMMIT (padrão: a do trace)')
+    parser.add_argument('--duration', type=float, default=None,
+                        help='Interrompe a leitura do trace após N segundos')
+    parser.add_argument('--metrics-interval', type=float, default=30,
+                        help='Intervalo em segundos do resumo de latência por operação (padrão: 30, 0 desliga)')
+    args = parser.parse_args(argv)
+    
+    try:
+        speed = 0.0 if args.speed == 'max' else float(args.speed)
+        if speed < 0:
+            raise ValueError
+    except ValueError:
+        parser.error(f"Velocidade inválida: {args.speed}")
+    try:
+        commit_policy = CommitPolicy.parse(args.commit_policy) if args.commit_policy else None
+        replayer = TraceReplayer(args.database_type, args.trace, speed, commit_policy,
+                                 metrics_interval=args.metrics_interval)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    
+    if not replayer.run(args.duration):
+        sys.exit(1)
+
+class WorkloadProfile:
+    """Perfil declarativo de carga (arquivo TOML ou YAML)"""
+    
+    ARRIVALS = ('poisson', 'uniform')
+    
+    def __init__(self, data: Dict[str, Any], source: str = '<perfil>'):
+        self.source = source
+        self.name = data.get('name', os.path.splitext(os.path.basename(source))[0])
+        self.workers = int(data.get('workers', 4))
+        self.batch_size = int(data.get('batch_size', 1))
+        self.batch_sizes = {name: int(size) for name, size in data.get('batch_sizes', {}).items()}
+        self.commit_policy = CommitPolicy.parse(str(data.get('commit_policy', 'statement')))
+        self.arrival = data.get('arrival', 'poisson')
+        self.read_ratio = data.get('read_ratio')
+        self.weights = {name: float(weight) for name, weight in data.get('operations', {}).items() if weight}
+        self.blob_size = int(data.get('blob_size', GenericTableGenerator.DEFAULT_BLOB_SIZE))
+        
+        phases = data.get('phases') or [{'name': 'steady', 'duration': data.get('duration', 60),
+                                          'rate': data.get('rate', 100)}]
+        self.phases = []
+        for index, phase in enumerate(phases):
+            rate = phase.get('rate', 0)
+            start_rate, end_rate = (rate.get('from', 0), rate.get('to', 0)) if isinstance(rate, dict) else (rate, rate)
+            self.phases.append({'name': phase.get('name', f'fase {index + 1}'), 'duration': float(phase['duration']),
+                                'from': float(start_rate), 'to': float(end_rate)})
+        self.duration = sum(phase['duration'] for phase in self.phases)
+        self._validate()
         
-        # Executar 2-4 operações aleatórias por ciclo (incluindo generic ocasionalmente)
-        num_operations = random.randint(2, 4)
-        selected_operations = random.sample(operations, num_operations)
+        # Pesos efetivos: com read_ratio, leituras e escritas são normalizadas separadamente
+        reads = {name: weight for name, weight in self.weights.items() if self.kind(name) == 'read'}
+        writes = {name: weight for name, weight in self.weights.items() if self.kind(name) == 'write'}
+        if self.read_ratio is not None:
+            effective = {name: weight / sum(reads.values()) * self.read_ratio for name, weight in reads.items()}
+            effective.update({name: weight / sum(writes.values()) * (1 - self.read_ratio)
+                              for name, weight in writes.items()})
+        else:
+            effective = dict(self.weights)
+        self.operations = [name for name in effective if effective[name] > 0]
+        self.cumulative_weights = list(itertools.accumulate(effective[name] for name in self.operations))
+    
+    @staticmethod
+    def operation_catalog() -> Dict[str, Tuple[str, str, str]]:
+        """Operações disponíveis: método -> (nome no relatório, operação, tabela)"""
+        return {method: (name, operation, table)
+                for (operation, table), (name, method) in DataManager.TRACE_OPERATIONS.items()}
+    
+    @classmethod
+    def kind(cls, name: str) -> str:
+        return 'read' if cls.operation_catalog()[name][1] == 'select' else 'write'
+    
+    def _validate(self):
+        catalog = self.operation_catalog()
+        unknown = (set(self.weights) | set(self.batch_sizes)) - set(catalog)
+        if unknown:
+            raise ValueError(f"Operações desconhecidas no perfil: {', '.join(sorted(unknown))} "
+                             f"(disponíveis: {', '.join(sorted(catalog))})")
+        if not self.weights or any(weight < 0 for weight in self.weights.values()):
+            raise ValueError("O perfil precisa de [operations] com pesos positivos")
+        if self.arrival not in self.ARRIVALS:
+            raise ValueError(f"arrival deve ser um de: {', '.join(self.ARRIVALS)}")
+        if self.workers < 1 or self.batch_size < 1 or any(size < 1 for size in self.batch_sizes.values()):
+            raise ValueError("workers e tamanhos de lote devem ser >= 1")
+        if self.blob_size < 0:
+            raise ValueError("blob_size deve ser >= 0")
+        if any(phase['duration'] <= 0 or phase['from'] < 0 or phase['to'] < 0 for phase in self.phases):
+            raise ValueError("Cada fase precisa de duration > 0 e taxas >= 0")
+        if self.read_ratio is not None:
+            self.read_ratio = float(self.read_ratio)
+            if not 0 <= self.read_ratio <= 1:
+                raise ValueError("read_ratio deve estar entre 0 e 1")
+            kinds = {self.kind(name) for name in self.weights}
+            if self.read_ratio > 0 and 'read' not in kinds:
+                raise ValueError("read_ratio > 0, mas o perfil não tem operações de leitura")
+            if self.read_ratio < 1 and 'write' not in kinds:
+                raise ValueError("read_ratio < 1, mas o perfil não tem operações de escrita")
+    
+    @classmethod
+    def load(cls, path: str) -> 'WorkloadProfile':
+        """Lê um perfil .toml ou .yaml/.yml"""
+        if path.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise ValueError("Perfis YAML precisam do PyYAML: pip install pyyaml")
+            with open(path, encoding='utf-8') as profile_file:
+                data = yaml.safe_load(profile_file) or {}
+        else:
+            if tomllib is None:
+                raise ValueError("Perfis TOML precisam de Python 3.11+ ou do pacote tomli")
+            with open(path, 'rb') as profile_file:
+                data = tomllib.load(profile_file)
+        return cls(data, path)
+    
+    def phase_at(self, elapsed: float) -> Tuple[int, float]:
+        """Índice da fase em ``elapsed`` segundos e a taxa alvo (ops/s) nesse instante"""
+        offset = elapsed
+        for index, phase in enumerate(self.phases):
+            if offset < phase['duration']:
+                progress = offset / phase['duration']
+                return index, phase['from'] + (phase['to'] - phase['from']) * progress
+            offset -= phase['duration']
+        return len(self.phases), 0.0
+    
+    def choose(self, rng: random.Random) -> str:
+        return rng.choices(self.operations, cum_weights=self.cumulative_weights)[0]
+
+class ProfileRunner(LoadEngine):
+    """Executa um WorkloadProfile com modelo de chegadas em malha aberta"""
+    
+    # Chegadas aguardando worker (por worker); acima disso o despachante espera
+    BACKLOG_PER_WORKER = 1000
+    
+    def __init__(self, database_type: str, profile: WorkloadProfile, id_refresh: float = 300,
+                 report_interval: float = 5, metrics_interval: float = 30):
+        super().__init__(database_type, workers=profile.workers, mode='profile', batch_size=profile.batch_size,
+                         id_refresh=id_refresh, report_interval=report_interval,
+                         commit_policy=profile.commit_policy, metrics_interval=metrics_interval)
+        self.profile = profile
+        self.catalog = WorkloadProfile.operation_catalog()
+        self.response_metrics = OperationMetrics()
+        self.arrivals = 0
+        self.dropped = 0
+    
+    def _profile_worker(self, worker_id: int, arrivals: 'queue.Queue', id_cache: IdCache):
+        manager = DataManager(self.database_type, batch_size=self.batch_size, id_cache=id_cache, pool=self.pool,
+                              commit_policy=self.commit_policy, metrics=self.metrics)
+        manager.operation_log_level = logging.DEBUG
+        manager.worker_id = worker_id
+        manager.blob_size = self.profile.blob_size
+        connected = manager.connect()
+        if not connected:
+            logging.error(f"❌ Worker {worker_id}: falha ao conectar")
+        try:
+            while True:
+                arrival = arrivals.get()
+                if arrival is None:
+                    break
+                intended, method = arrival
+                operation_name, operation, table = self.catalog[method]
+                success = False
+                if connected:
+                    manager.batch_size = self.profile.batch_sizes.get(method, self.batch_size)
+                    try:
+                        success = bool(getattr(manager, method)())
+                        manager.end_cycle()
+                    except Exception as e:
+                        logging.error(f"❌ Worker {worker_id}: erro na operação {operation_name}: {e}")
+                self.response_metrics.record(self.database_type, table, operation,
+                                             time.monotonic() - intended, success)
+                self.stats.record(operation_name, success)
+        finally:
+            if connected:
+                manager.disconnect()
+            self.stats.add_commits(manager.commits)
+    
+    def _record_missed(self, intended: float, method: str, deadline: float):
+        """Chegada que não coube na fila até o fim do perfil: erro, com a espera já decorrida"""
+        _, operation, table = self.catalog[method]
+        self.dropped += 1
+        self.response_metrics.record(self.database_type, table, operation,
+                                     max(time.monotonic(), deadline) - intended, False)
+    
+    def run(self, duration_seconds: float = None) -> Dict[str, Any]:
+        """Executa todas as fases do perfil (``duration_seconds`` é ignorado) e devolve o resumo"""
+        profile = self.profile
+        logging.info(f"🚀 Perfil '{profile.name}' em {self.database_type.upper()}: {len(profile.phases)} fase(s), "
+                     f"{profile.duration:.0f}s, {self.workers} workers, chegadas {profile.arrival}")
+        if not self._prepare_schema():
+            logging.error("❌ Falha ao verificar/criar tabelas")
+            return {}
         
-        success_count = 0
-        for operation_name, operation_func in selected_operations:
+        self.pool = ConnectionPool(self.database_type, min_size=self.workers, max_size=self.workers)
+        id_cache = IdCache(self.id_refresh)
+        arrivals = queue.Queue(self.BACKLOG_PER_WORKER * self.workers)
+        threads = [threading.Thread(target=self._profile_worker, args=(i, arrivals, id_cache), daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        
+        rng = random.Random(random.getrandbits(64))
+        start_time = time.monotonic()
+        deadline = start_time + profile.duration
+        last_report, last_total = start_time, 0
+        self._last_metrics = start_time
+        current_phase = -1
+        next_arrival = 0.0
+        try:
+            while True:
+                phase, rate = profile.phase_at(next_arrival)
+                if phase >= len(profile.phases):
+                    break
+                if phase != current_phase:
+                    current_phase = phase
+                    info = profile.phases[phase]
+                    logging.info(f"▶️ Fase '{info['name']}': {info['duration']:.0f}s, "
+                                 f"{info['from']:g}→{info['to']:g} ops/s")
+                if rate <= 0:
+                    # Taxa zero: avança o relógio planejado em passos curtos até a taxa subir
+                    next_arrival += 0.01
+                    continue
+                
+                delay = start_time + next_arrival - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                intended, method = start_time + next_arrival, profile.choose(rng)
+                self.arrivals += 1
+                if self.dropped:
+                    # Fim do perfil com a fila cheia: o resto do plano já está atrasado
+                    self._record_missed(intended, method, deadline)
+                else:
+                    try:
+                        arrivals.put((intended, method), timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Full:
+                        self._record_missed(intended, method, deadline)
+                next_arrival += rng.expovariate(rate) if profile.arrival == 'poisson' else 1.0 / rate
+                
+                now = time.monotonic()
+                if now - last_report >= self.report_interval:
+                    current = self.stats.total()
+                    logging.info(f"📈 {self.database_type.upper()} ({profile.phases[phase]['name']}, "
+                                 f"alvo {rate:.0f} ops/s): {current} operações "
+                                 f"({(current - last_total) / (now - last_report):.1f} ops/s, "
+                                 f"fila {arrivals.qsize()})")
+                    last_report, last_total = now, current
+                    self._log_metrics_interval()
+        except KeyboardInterrupt:
+            logging.info("⏹️ Perfil interrompido; aguardando operações em andamento")
+        finally:
+            for _ in threads:
+                arrivals.put(None)
+            for thread in threads:
+                thread.join()
+            self.pool.close()
+        
+        report = self.report(time.monotonic() - start_time)
+        self.response_metrics.log_report(report['elapsed_seconds'], "Tempo de resposta desde a chegada planejada")
+        overall = LatencyHistogram()
+        for histogram, _, _ in self.response_metrics.snapshot().values():
+            overall.merge(histogram)
+        dropped_ratio = self.dropped / self.arrivals if self.arrivals else 0.0
+        logging.info(f"🎯 Tempo de resposta geral: p50={overall.percentile(0.50):.2f}ms "
+                     f"p95={overall.percentile(0.95):.2f}ms p99={overall.percentile(0.99):.2f}ms | "
+                     f"não atendidas: {self.dropped}/{self.arrivals} ({dropped_ratio:.1%})")
+        if self.dropped:
+            logging.warning(f"⚠️ {self.dropped} chegada(s) não couberam na fila até o fim do perfil (banco abaixo "
+                            f"da taxa alvo); contadas como erro com latência mínima (fim − chegada planejada), "
+                            f"incluídas nos percentis acima")
+        report.update({'profile': profile.name, 'arrivals': self.arrivals, 'dropped': self.dropped,
+                       'dropped_ratio': dropped_ratio, 'response_latency': self.response_metrics.summary(),
+                       'response_latency_overall': overall.summary()})
+        return report
+
+def _numbered_placeholders(query: str, prefix: str = '$') -> str:
+    """Converte placeholders %s para o formato $1, $2, ... (asyncpg/PREPARE) ou @P1, @P2, ... (sp_executesql)"""
+    parts = query.split('%s')
+    return parts[0] + ''.join(f"{prefix}{i}{part}" for i, part in enumerate(parts[1:], start=1))
+
+class AsyncpgBackend:
+    """Backend assíncrono para PostgreSQL (asyncpg)"""
+    
+    MAX_PARAMS = 32767
+    
+    def __init__(self, pool):
+        self.pool = pool
+    
+    @classmethod
+    async def open(cls, pool_size: int) -> 'AsyncpgBackend':
+        pool = await asyncpg.create_pool(min_size=1, max_size=pool_size, **DatabaseConfig.POSTGRES)
+        return cls(pool)
+    
+    async def insert(self, table: str, columns: Sequence[str], rows: List[Tuple]) -> Dict[str, Any]:
+        column_list = ', '.join(columns)
+        chunk_size = self.MAX_PARAMS // len(columns)
+        ids = []
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    for start in range(0, len(rows), chunk_size):
+                        chunk = rows[start:start + chunk_size]
+                        row_placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+                        query = _numbered_placeholders(
+                            f"INSERT INTO {table} ({column_list}) VALUES "
+                            + ', '.join([row_placeholder] * len(chunk)) + " RETURNING id"
+                        )
+                        records = await conn.fetch(query, *(value for row in chunk for value in row))
+                        ids.extend(record[0] for record in records)
+            return {'success': True, 'rowcount': len(rows), 'ids': ids}
+        except Exception as e:
+            logging.error(f"❌ Erro ao inserir lote em {table}: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    async def execute(self, query: str, params: tuple) -> Dict[str, Any]:
+        try:
+            status = await self.pool.execute(_numbered_placeholders(query), *params)
+            return {'success': True, 'rowcount': int(status.split()[-1])}
+        except Exception as e:
+            logging.error(f"❌ Erro ao executar query: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    async def close(self):
+        await self.pool.close()
+
+class AiomysqlBackend:
+    """Backend assíncrono para MySQL (aiomysql)"""
+    
+    def __init__(self, pool):
+        self.pool = pool
+    
+    @classmethod
+    async def open(cls, pool_size: int) -> 'AiomysqlBackend':
+        config = DatabaseConfig.MYSQL
+        pool = await aiomysql.create_pool(
+            host=config['host'], port=config['port'], user=config['user'],
+            password=config['password'], db=config['database'], charset=config['charset'],
+            autocommit=False, minsize=1, maxsize=pool_size
+        )
+        return cls(pool)
+    
+    async def insert(self, table: str, columns: Sequence[str], rows: List[Tuple]) -> Dict[str, Any]:
+        column_list = ', '.join(columns)
+        row_placeholder = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        ids = []
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    for start in range(0, len(rows), MYSQL_MAX_ROWS_PER_INSERT):
+                        chunk = rows[start:start + MYSQL_MAX_ROWS_PER_INSERT]
+                        query = f"INSERT INTO {table} ({column_list}) VALUES " + ', '.join([row_placeholder] * len(chunk))
+                        await cursor.execute(query, tuple(value for row in chunk for value in row))
+                        ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(chunk)))
+                await conn.commit()
+            return {'success': True, 'rowcount': len(rows), 'ids': ids}
+        except Exception as e:
+            logging.error(f"❌ Erro ao inserir lote em {table}: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    async def execute(self, query: str, params: tuple) -> Dict[str, Any]:
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    rowcount = cursor.rowcount
+                await conn.commit()
+            return {'success': True, 'rowcount': rowcount}
+        except Exception as e:
+            logging.error(f"❌ Erro ao executar query: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    async def close(self):
+        self.pool.close()
+        await self.pool.wait_closed()
+
+class ExecutorBackend:
+    """Adaptador assíncrono sobre os drivers bloqueantes (pool de threads)"""
+    
+    def __init__(self, database_type: str, pool_size: int):
+        self.database_type = database_type
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix=f"{database_type}-io")
+        self.pool = ConnectionPool(database_type, min_size=1, max_size=pool_size)
+        self._local = threading.local()
+        self._managers: List[DataManager] = []
+        self._managers_lock = threading.Lock()
+    
+    @classmethod
+    async def open(cls, database_type: str, pool_size: int) -> 'ExecutorBackend':
+        return cls(database_type, pool_size)
+    
+    def _manager(self) -> DataManager:
+        manager = getattr(self._local, 'manager', None)
+        if manager is None:
+            manager = DataManager(self.database_type, pool=self.pool)
+            manager.operation_log_level = logging.DEBUG
+            if not manager.connect():
+                raise ConnectionError(f"Falha ao conectar ao {self.database_type}")
+            self._local.manager = manager
+            with self._managers_lock:
+                self._managers.append(manager)
+        return manager
+    
+    async def _call(self, func) -> Dict[str, Any]:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+        except Exception as e:
+            logging.error(f"❌ Erro no executor: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    async def insert(self, table: str, columns: Sequence[str], rows: List[Tuple]) -> Dict[str, Any]:
+        return await self._call(lambda: self._manager().execute_batch(table, columns, rows))
+    
+    async def execute(self, query: str, params: tuple) -> Dict[str, Any]:
+        return await self._call(lambda: self._manager().execute_query(query, params))
+    
+    async def close(self):
+        self.executor.shutdown(wait=True)
+        for manager in self._managers:
+            manager.disconnect()
+        self.pool.close()
+
+class AsyncLoadEngine(LoadEngine):
+    """Motor de carga asyncio: milhares de operações em voo em um único processo"""
+    
+    def __init__(self, database_type: str, concurrency: int = 100, target_ops: float = 0,
+                 batch_size: int = 1, pool_size: int = 20, id_refresh: float = 300,
+                 report_interval: float = 5, metrics_interval: float = 30):
+        super().__init__(database_type, workers=concurrency, target_ops=target_ops, mode='async',
+                         batch_size=batch_size, id_refresh=id_refresh, report_interval=report_interval,
+                         metrics_interval=metrics_interval)
+        self.pool_size = pool_size
+        self.id_cache = IdCache(id_refresh)
+        self.rows = DataManager(database_type)
+        self._loader: DataManager = None
+        self._refresh_executor: ThreadPoolExecutor = None
+        self._refreshing = set()
+    
+    async def _open_backend(self):
+        if self.database_type == 'postgres' and asyncpg is not None:
+            return await AsyncpgBackend.open(self.pool_size)
+        if self.database_type == 'mysql' and aiomysql is not None:
+            return await AiomysqlBackend.open(self.pool_size)
+        if self.database_type != 'sqlserver':
+            logging.warning(f"⚠️ Driver asyncio para {self.database_type} não instalado; usando pool de threads")
+        return await ExecutorBackend.open(self.database_type, self.pool_size)
+    
+    def _sample_id(self, table: str) -> Optional[int]:
+        """Sorteia um ID do cache, agendando a recarga em segundo plano se expirou"""
+        if self.id_cache.needs_refresh(table) and table not in self._refreshing:
+            self._refreshing.add(table)
+            # Uma thread só: a conexão do carregador não pode ser usada por duas recargas ao mesmo tempo
+            future = asyncio.get_running_loop().run_in_executor(self._refresh_executor, self._loader.load_ids, table)
+            future.add_done_callback(lambda done: self._refresh_done(table, done))
+        return self.id_cache.sample(table)
+    
+    def _refresh_done(self, table: str, future: asyncio.Future):
+        """Libera a tabela para nova recarga (executado no loop de eventos)"""
+        self._refreshing.discard(table)
+        if not future.cancelled() and future.exception() is not None:
+            logging.warning(f"⚠️ Falha ao recarregar IDs de {table}: {future.exception()}")
+    
+    async def _insert(self, backend, table: str, columns: Sequence[str], build_row) -> bool:
+        rows = [build_row() for _ in range(self.batch_size)]
+        start = time.perf_counter()
+        result = await backend.insert(table, columns, rows)
+        self.metrics.record(self.database_type, table, 'insert', time.perf_counter() - start, result['success'])
+        if result['success']:
+            self.id_cache.add(table, result['ids'])
+        return result['success']
+    
+    async def _update(self, backend, table: str, query: str, values: tuple) -> bool:
+        target_id = self._sample_id(table)
+        if target_id is None:
+            return False
+        start = time.perf_counter()
+        result = await backend.execute(query, values + (target_id,))
+        success = result['success'] and result['rowcount'] > 0
+        self.metrics.record(self.database_type, table, 'update', time.perf_counter() - start, success)
+        if success:
+            return True
+        if result['success']:
+            self.id_cache.discard(table, target_id)
+        return False
+    
+    def get_operations(self, backend) -> List[Tuple[str, Any]]:
+        """Mix padrão de operações, na forma de fábricas de corrotinas"""
+        rows = self.rows
+        now = 'GETDATE()' if self.database_type == 'sqlserver' else 'CURRENT_TIMESTAMP'
+        
+        def generic_update_values():
+            metadata = f'{{"timestamp": "{datetime.datetime.now().isoformat()}", "source": "auto-update", "operation": "scheduled_update"}}'
+            return (random.choice(rows.sample_generic_values), metadata)
+        
+        return [
+            ('INSERT Cliente', lambda: self._insert(backend, 'clientes', ('nome', 'email'), rows.build_cliente_row)),
+            ('UPDATE Cliente', lambda: self._update(
+                backend, 'clientes', f"UPDATE clientes SET nome = %s, updated_at = {now} WHERE id = %s",
+                (random.choice(rows.sample_names) + " (Atualizado)",))),
+            ('INSERT Produto', lambda: self._insert(backend, 'produtos', ('nome', 'preco'), rows.build_produto_row)),
+            ('UPDATE Produto', lambda: self._update(
+                backend, 'produtos', f"UPDATE produtos SET preco = preco * %s, updated_at = {now} WHERE id = %s",
+                (random.uniform(0.9, 1.15),))),
+            ('INSERT Log', lambda: self._insert(backend, 'logs', ('mensagem',), rows.build_log_row)),
+            ('INSERT Generic', lambda: self._insert(
+                backend, 'generic', ('tipo', 'chave', 'valor', 'metadata'), rows.build_generic_row)),
+            ('UPDATE Generic', lambda: self._update(
+                backend, 'generic', f"UPDATE generic SET valor = %s, metadata = %s, updated_at = {now} WHERE id = %s",
+                generic_update_values()))
+        ]
+    
+    async def _worker(self, operations, limiter: RateLimiter, stop_event: asyncio.Event):
+        while not stop_event.is_set():
+            delay = limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                if stop_event.is_set():
+                    break
+            operation_name, operation = random.choice(operations)
             try:
-                if operation_func():
-                    success_count += 1
-                time.sleep(1)  # Pequena pausa entre operações
+                success = await operation()
             except Exception as e:
                 logging.error(f"❌ Erro na operação {operation_name}: {e}")
-        
-        logging.info(f"✅ Ciclo concluído: {success_count}/{len(selected_operations)} operações executadas com sucesso")
+                success = False
+            self.stats.record(operation_name, success)
     
-    def run_demo(self, duration_seconds: int = 20):
-        """Executa uma demonstração por tempo limitado"""
-        logging.info(f"🚀 Iniciando demonstração do gerenciamento automático ({self.database_type.upper()})")
-        logging.info(f"⏰ Duração: {duration_seconds} segundos")
+    async def _run(self, duration_seconds: float) -> Dict[str, Any]:
+        self._loader = DataManager(self.database_type, id_cache=self.id_cache)
+        if not self._loader.connect():
+            return {}
+        for table in ('clientes', 'produtos', 'generic'):
+            self._loader.load_ids(table)
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.database_type}-ids")
         
-        # Verificar/criar tabelas para todos os bancos
-        if not self.check_tables_exist():
+        backend = await self._open_backend()
+        stop_event = asyncio.Event()
+        operations = self.get_operations(backend)
+        limiter = RateLimiter(self.target_ops)
+        tasks = [asyncio.create_task(self._worker(operations, limiter, stop_event))
+                 for _ in range(self.workers)]
+        
+        start_time = time.monotonic()
+        last_report, last_total = start_time, 0
+        self._last_metrics = start_time
+        try:
+            while True:
+                elapsed = time.monotonic() - start_time
+                if elapsed >= duration_seconds:
+                    break
+                await asyncio.sleep(min(self.report_interval, duration_seconds - elapsed))
+                now, current = time.monotonic(), self.stats.total()
+                rate = (current - last_total) / (now - last_report) if now > last_report else 0.0
+                logging.info(f"📈 {self.database_type.upper()} (async): {current} operações ({rate:.1f} ops/s)")
+                last_report, last_total = now, current
+                self._log_metrics_interval()
+        finally:
+            stop_event.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await backend.close()
+            self._refresh_executor.shutdown(wait=True)
+            self._loader.disconnect()
+        
+        return self.report(time.monotonic() - start_time)
+    
+    def run(self, duration_seconds: float) -> Dict[str, Any]:
+        logging.info(
+            f"🚀 Iniciando carga assíncrona em {self.database_type.upper()}: {self.workers} operações em voo, "
+            f"pool de {self.pool_size} conexões, taxa alvo {self.target_ops or 'ilimitada'} ops/s"
+        )
+        if not self._prepare_schema():
             logging.error("❌ Falha ao verificar/criar tabelas")
-            return
+            return {}
+        return asyncio.run(self._run(duration_seconds))
+
+class MetricsServer:
+    """Endpoint HTTP /metrics no formato texto do Prometheus"""
+    
+    # Limites (em segundos) dos buckets do histograma exportado
+    LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    ROW_COUNT_TABLES = ('clientes', 'produtos', 'pedidos', 'itens_pedido', 'logs', 'generic')
+    
+    def __init__(self, port: int, host: str = '0.0.0.0', row_count_interval: float = 60):
+        self.port = port
+        self.host = host
+        self.row_count_interval = row_count_interval
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Tuple[OperationMetrics, Any]] = {}
+        self._row_counts: Dict[str, Dict[str, int]] = {}
+        self._stop_event = threading.Event()
+        # Acorda a contagem ao registrar um banco, sem esperar o intervalo
+        self._recount = threading.Event()
+        self._server: ThreadingHTTPServer = None
+    
+    def register(self, database_type: str, metrics: OperationMetrics, pool=None):
+        """Exporta as métricas de um banco; ``pool`` é um ConnectionPool ou uma função que o devolve"""
+        with self._lock:
+            self._sources[database_type] = (metrics, pool)
+        self._recount.set()
+    
+    def start(self):
+        server = self
         
-        start_time = time.time()
-        cycles = 0
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = server.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                # Sem log de acesso: uma linha por coleta poluiria o log da carga
+                pass
         
-        while time.time() - start_time < duration_seconds:
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True).start()
+        self._stop_event.clear()
+        threading.Thread(target=self._count_rows_loop, name='metrics-row-counts', daemon=True).start()
+        logging.info(f"📡 Métricas Prometheus em http://{self.host}:{self.port}/metrics")
+    
+    def stop(self):
+        self._stop_event.set()
+        self._recount.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def _count_rows_loop(self):
+        """Recontagem periódica das linhas de cada banco registrado, fora das coletas"""
+        while not self._stop_event.is_set():
+            with self._lock:
+                database_types = sorted(self._sources)
+            for database_type in database_types:
+                if self._stop_event.is_set():
+                    return
+                try:
+                    counts = self._table_rows(database_type)
+                except Exception as e:
+                    logging.warning(f"⚠️ Contagem de linhas para /metrics falhou ({database_type}): {e}")
+                    continue
+                with self._lock:
+                    self._row_counts[database_type] = counts
+            self._recount.wait(self.row_count_interval)
+            self._recount.clear()
+    
+    def _table_rows(self, database_type: str) -> Dict[str, int]:
+        """Linhas por tabela, em uma conexão própria"""
+        manager = DataManager(database_type)
+        counts = {}
+        if manager.connect():
             try:
-                cycles += 1
-                logging.info(f"🔄 Executando ciclo {cycles}")
-                self.execute_operations_cycle()
+                cursor = manager.connection.cursor()
+                for table in self.ROW_COUNT_TABLES:
+                    try:
+                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                        counts[table] = cursor.fetchone()[0]
+                    except Exception:
+                        manager.connection.rollback()
+                cursor.close()
+                manager.connection.rollback()
+            finally:
+                manager.disconnect()
+        return counts
+    
+    @staticmethod
+    def _labels(**labels) -> str:
+        return '{' + ','.join(f'{name}="{value}"' for name, value in labels.items()) + '}'
+    
+    def render(self) -> str:
+        """Monta o texto de exposição com as métricas de todos os bancos registrados"""
+        with self._lock:
+            sources = dict(self._sources)
+            lines = [
+                '# HELP auto_data_operations_total Operações executadas por banco, tabela, operação e status.',
+                '# TYPE auto_data_operations_total counter',
+            ]
+            latency = [
+                '# HELP auto_data_operation_latency_seconds Latência das operações.',
+                '# TYPE auto_data_operation_latency_seconds histogram',
+            ]
+            pool_lines = [
+                '# HELP auto_data_pool_connections Conexões do pool por estado.',
+                '# TYPE auto_data_pool_connections gauge',
+            ]
+            pool_max = [
+                '# HELP auto_data_pool_max_connections Tamanho máximo do pool.',
+                '# TYPE auto_data_pool_max_connections gauge',
+            ]
+            reconnects = [
+                '# HELP auto_data_pool_reconnects_total Conexões substituídas pelo pool.',
+                '# TYPE auto_data_pool_reconnects_total counter',
+            ]
+            rows = [
+                '# HELP auto_data_table_rows Linhas por tabela (COUNT(*) periódico).',
+                '# TYPE auto_data_table_rows gauge',
+            ]
+            
+            for database_type, (metrics, pool) in sorted(sources.items()):
+                for (engine, table, operation), (histogram, ok, errors) in sorted(metrics.snapshot().items()):
+                    for status, value in (('ok', ok), ('error', errors)):
+                        labels = self._labels(engine=engine, table=table, operation=operation, status=status)
+                        lines.append(f"auto_data_operations_total{labels} {value}")
+                    for bound in self.LATENCY_BUCKETS:
+                        labels = self._labels(engine=engine, table=table, operation=operation, le=bound)
+                        latency.append(f"auto_data_operation_latency_seconds_bucket{labels} "
+                                       f"{histogram.count_at_or_below(int(bound * 1_000_000))}")
+                    labels = self._labels(engine=engine, table=table, operation=operation, le='+Inf')
+                    latency.append(f"auto_data_operation_latency_seconds_bucket{labels} {histogram.count}")
+                    labels = self._labels(engine=engine, table=table, operation=operation)
+                    latency.append(f"auto_data_operation_latency_seconds_sum{labels} {histogram.total_us / 1_000_000}")
+                    latency.append(f"auto_data_operation_latency_seconds_count{labels} {histogram.count}")
                 
-                # Aguardar próximo ciclo (máximo 8 segundos)
-                wait_time = min(8, duration_seconds - (time.time() - start_time))
-                if wait_time > 0:
-                    time.sleep(wait_time)
-                    
-            except Exception as e:
-                logging.error(f"❌ Erro no ciclo {cycles}: {e}")
-                time.sleep(2)
+                pool = pool() if callable(pool) else pool
+                if pool is not None:
+                    stats = pool.stats()
+                    for state in ('idle', 'in_use'):
+                        pool_lines.append(f"auto_data_pool_connections{self._labels(engine=database_type, state=state)} "
+                                          f"{stats[state]}")
+                    pool_max.append(f"auto_data_pool_max_connections{self._labels(engine=database_type)} "
+                                    f"{stats['max_size']}")
+                    reconnects.append(f"auto_data_pool_reconnects_total{self._labels(engine=database_type)} "
+                                      f"{stats['reconnects']}")
+                
+                for table, count in sorted(self._row_counts.get(database_type, {}).items()):
+                    rows.append(f"auto_data_table_rows{self._labels(engine=database_type, table=table)} {count}")
         
-        logging.info(f"🎉 Demonstração concluída! Executados {cycles} ciclos em {duration_seconds} segundos")
+        return '\n'.join(lines + latency + pool_lines + pool_max + reconnects + rows) + '\n'
+
+def _engine_process(database_type: str, duration_seconds: float, use_async: bool, seed: Optional[int],
+                    metrics_port: int, engine_options: Dict[str, Any], results):
+    """Ponto de entrada de um banco no modo multi-banco (um processo por banco)"""
+    if seed is not None:
+        random.seed(seed)
+    engine_class = AsyncLoadEngine if use_async else LoadEngine
+    engine = engine_class(database_type, **engine_options)
+    
+    metrics_server = None
+    if metrics_port:
+        metrics_server = MetricsServer(metrics_port)
+        metrics_server.register(database_type, engine.metrics, lambda: engine.pool)
+        metrics_server.start()
+    
+    report = {}
+    try:
+        report = engine.run(duration_seconds)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
+        results.put((database_type, report))
+
+class MultiEngineRunner:
+    """Executa a mesma carga em vários bancos ao mesmo tempo e compara os resultados"""
+    
+    def __init__(self, engines: Sequence[str], seed: int = None, use_async: bool = False,
+                 metrics_port: int = 0, **engine_options):
+        self.engines = list(engines)
+        self.seed = seed
+        self.use_async = use_async
+        self.metrics_port = metrics_port
+        self.engine_options = engine_options
+    
+    def run(self, duration_seconds: float) -> Dict[str, Dict[str, Any]]:
+        """Inicia todos os bancos, aguarda o fim e devolve os relatórios por banco"""
+        logging.info(f"🚀 Carga simultânea em {', '.join(engine.upper() for engine in self.engines)} "
+                     f"({duration_seconds}s, semente {self.seed if self.seed is not None else 'aleatória'})")
+        # Schema de todos os bancos em paralelo, antes da carga: as cargas começam juntas
+        ready = bootstrap_schemas(self.engines)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=_engine_process,
+                args=(database_type, duration_seconds, self.use_async, self.seed,
+                      self.metrics_port + i if self.metrics_port else 0, self.engine_options, results),
+                name=f'engine-{database_type}'
+            )
+            for i, database_type in enumerate(self.engines) if ready[database_type]
+        ]
+        for process in processes:
+            process.start()
+        
+        reports = {}
+        for _ in processes:
+            try:
+                database_type, report = results.get(timeout=duration_seconds + 300)
+                reports[database_type] = report
+            except Exception:
+                logging.warning("⚠️ Relatório de um banco não recebido")
+        for process in processes:
+            process.join()
+        
+        self.report(reports, duration_seconds)
+        return reports
+    
+    def report(self, reports: Dict[str, Dict[str, Any]], duration_seconds: float):
+        """Registra a tabela comparativa lado a lado (vazão, falhas e latências por operação)"""
+        engines = [engine for engine in self.engines if reports.get(engine)]
+        for engine in self.engines:
+            if not reports.get(engine):
+                logging.error(f"❌ {engine.upper()}: sem resultados (falha ao conectar ou preparar o schema)")
+        if not engines:
+            return
+        
+        def row(label: str, values: List[str]):
+            logging.info(f"   {label:<28}" + ''.join(f"{value:>14}" for value in values))
+        
+        logging.info(f"📊 Comparativo entre bancos ({duration_seconds}s, "
+                     f"{self.engine_options.get('workers', self.engine_options.get('concurrency', '?'))} "
+                     f"workers por banco):")
+        row('métrica', engines)
+        row('ops/s', [f"{reports[engine]['ops_per_second']:.1f}" for engine in engines])
+        row('operações', [str(reports[engine]['ok'] + reports[engine]['failed']) for engine in engines])
+        row('falhas', [str(reports[engine]['failed']) for engine in engines])
+        row('commits', [str(reports[engine].get('commits', 0)) for engine in engines])
+        
+        # Latências por tabela/operação, sem o prefixo do banco no rótulo
+        latencies = {
+            engine: {label.split('/', 1)[1]: stats for label, stats in reports[engine].get('latency', {}).items()}
+            for engine in engines
+        }
+        labels = sorted(set().union(*(latency.keys() for latency in latencies.values())))
+        for label in labels:
+            for percentile in ('p50', 'p99'):
+                values = []
+                for engine in engines:
+                    stats = latencies[engine].get(label)
+                    values.append(f"{stats[percentile + '_ms']:.2f}" if stats and stats.get('count') else '-')
+                row(f"{label} {percentile} (ms)", values)
+
+class Seeder:
+    """Carga em massa de dados sintéticos (comando seed)"""
+    
+    TABLES = ('clientes', 'produtos', 'pedidos', 'itens_pedido', 'logs', 'generic_table')
+    
+    def __init__(self, database_type: str, rows: int, tables: Sequence[str] = None,
+                 chunk_rows: int = 50000, items_per_order: int = 3,
+                 blob_size: int = GenericTableGenerator.DEFAULT_BLOB_SIZE):
+        self.database_type = database_type
+        self.rows = rows
+        self.tables = [table for table in self.TABLES if not tables or table in tables]
+        self.chunk_rows = chunk_rows
+        self.items_per_order = items_per_order
+        self.blob_size = blob_size
+        
+        connect_options = {}
+        if database_type == 'mysql':
+            connect_options = {'local_infile': True, 'read_timeout': 600, 'write_timeout': 600}
+        self.manager = DataManager(database_type, pool=ConnectionPool(
+            database_type, min_size=1, max_size=1, connect_options=connect_options))
+        self._pedidos_start = 0
+        self._insert_fallback = False
+    
+    def row_count(self, table: str) -> int:
+        """Quantidade de linhas a gerar por tabela, proporcional a ``rows``"""
+        if table == 'produtos':
+            return max(1, self.rows // 10)
+        if table == 'itens_pedido':
+            return self.rows * self.items_per_order
+        return self.rows
+    
+    def _required_ids(self, table: str) -> array:
+        ids = self.manager.scan_ids(table)
+        if not ids:
+            raise RuntimeError(f"Tabela {table} vazia: não há IDs para as chaves estrangeiras")
+        return ids
+    
+    def _source(self, table: str) -> Tuple[Sequence[str], Iterable[Tuple]]:
+        """Colunas e fluxo de linhas de cada tabela"""
+        generator = self.manager.generator
+        columns = generator.columns(table)
+        if table == 'generic_table':
+            generator.generic_table.blob_size = self.blob_size
+            return columns, generator.rows(generator.batches(table, self.row_count(table), self._chunk_rows(table)))
+        if table == 'itens_pedido':
+            # Itens apenas para pedidos criados nesta execução (evita colisão na PK composta)
+            pedido_ids = self.manager.scan_ids('pedidos', start_after=self._pedidos_start)
+            batches = generator.itens_pedido_batches(pedido_ids, self._required_ids('produtos'),
+                                                     self.items_per_order, self.chunk_rows)
+            return columns, generator.rows(batches)
+        
+        refs = {}
+        if table == 'pedidos':
+            self._pedidos_start = self.manager.max_id('pedidos')
+            refs['cliente_ids'] = self._required_ids('clientes')
+        batches = generator.batches(table, self.row_count(table), self.chunk_rows, **refs)
+        return columns, generator.rows(batches)
+    
+    def _chunk_rows(self, table: str) -> int:
+        """Linhas por bloco; as linhas largas de generic_table respeitam o tamanho máximo do INSERT"""
+        if table == 'generic_table':
+            return min(self.chunk_rows, self.manager.generator.generic_table.insert_options()['max_rows'])
+        return self.chunk_rows
+    
+    def _check_local_infile(self):
+        """No MySQL, verifica se o servidor aceita LOAD DATA LOCAL INFILE"""
+        if self.database_type != 'mysql':
+            return
+        cursor = self.manager.connection.cursor()
+        cursor.execute("SELECT @@GLOBAL.local_infile")
+        enabled = cursor.fetchone()[0]
+        cursor.close()
+        if not enabled:
+            logging.warning("⚠️ local_infile desabilitado no servidor MySQL; usando INSERT em lote "
+                            "(habilite com local_infile=1 em init/mysql/my.cnf)")
+            self._insert_fallback = True
+    
+    def _load(self, table: str, columns: Sequence[str], rows: Iterable[Tuple]) -> int:
+        # generic_table tem tipos sem representação no COPY/LOAD DATA/BCP
+        # (geometrias, busca textual): vai por INSERT multi-linha com conversões
+        wide = table == 'generic_table'
+        if not self._insert_fallback and not wide:
+            return self.manager.bulk_load(table, columns, rows, self.chunk_rows)
+        
+        options = self.manager.generator.generic_table.insert_options() if wide else {}
+        total = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, self._chunk_rows(table)))
+            if not chunk:
+                return total
+            result = self.manager.execute_batch(table, columns, chunk, id_column=None, **options)
+            if not result['success']:
+                raise RuntimeError(result['error'])
+            self.manager.commit()
+            total += len(chunk)
+    
+    def run(self) -> Dict[str, Dict[str, float]]:
+        """Executa a carga de todas as tabelas selecionadas, em ordem de dependência"""
+        if not self.manager.connect():
+            return {}
+        
+        summary = {}
+        try:
+            self._check_local_infile()
+            for table in self.tables:
+                columns, rows = self._source(table)
+                logging.info(f"🌱 Carregando {table} ({self.database_type.upper()})...")
+                size_before = self.manager.table_size(table)['bytes']
+                start_time = time.monotonic()
+                loaded = self._load(table, columns, rows)
+                elapsed = time.monotonic() - start_time
+                rate = loaded / elapsed if elapsed > 0 else 0.0
+                # Armazenamento: crescimento da tabela (dados, índices e LOB/TOAST) por linha carregada
+                size = self.manager.table_size(table)
+                row_bytes = max(0, size['bytes'] - size_before) / loaded if loaded else 0.0
+                summary[table] = {'rows': loaded, 'seconds': elapsed, 'rows_per_second': rate,
+                                  'table_bytes': size['bytes'], 'bytes_per_row': row_bytes}
+                logging.info(f"✅ {table}: {loaded} linhas em {elapsed:.1f}s ({rate:,.0f} linhas/s, "
+                             f"{rate * row_bytes / 1024 / 1024:,.1f} MB/s)")
+                logging.info(f"💽 {table}: {row_bytes:,.0f} bytes/linha carregada, "
+                             f"{size['bytes'] / 1024 / 1024:,.1f} MB no total ({size['rows']} linhas)")
+        except Exception as e:
+            logging.error(f"❌ Erro no seed de {self.database_type}: {e}")
+        finally:
+            self.manager.disconnect()
+        
+        total_rows = sum(item['rows'] for item in summary.values())
+        total_seconds = sum(item['seconds'] for item in summary.values())
+        logging.info(f"🎉 Seed concluído: {total_rows} linhas em {total_seconds:.1f}s")
+        return summary
+
+def seed_main(argv: List[str]):
+    """Comando seed: carga em massa de dados sintéticos"""
+    parser = argparse.ArgumentParser(
+        prog='auto-data-manager.py seed',
+        description='Carga em massa (COPY / LOAD DATA LOCAL INFILE / bulk copy) de dados sintéticos'
+    )
+    parser.add_argument('database_type', choices=['mysql', 'postgres', 'sqlserver'])
+    parser.add_argument('--rows', type=int, default=1_000_000,
+                        help='Linhas base: clientes, pedidos, logs e generic_table; produtos = rows/10 (padrão: 1000000)')
+    parser.add_argument('--tables', default=','.join(Seeder.TABLES),
+                        help='Tabelas a carregar, separadas por vírgula (padrão: todas)')
+    parser.add_argument('--chunk-rows', type=int, default=50000,
+                        help='Linhas por bloco de carga (padrão: 50000)')
+    parser.add_argument('--items-per-order', type=int, default=3,
+                        help='Itens por pedido em itens_pedido (padrão: 3)')
+    parser.add_argument('--blob-size', type=int, default=GenericTableGenerator.DEFAULT_BLOB_SIZE,
+                        help='Bytes por valor nas colunas BLOB/BYTEA/IMAGE de generic_table '
+                             f'(padrão: {GenericTableGenerator.DEFAULT_BLOB_SIZE})')
+    args = parser.parse_args(argv)
+    
+    tables = [table.strip() for table in args.tables.split(',') if table.strip()]
+    unknown = set(tables) - set(Seeder.TABLES)
+    if unknown:
+        parser.error(f"Tabelas desconhecidas: {', '.join(sorted(unknown))}")
+    
+    if args.blob_size < 0:
+        parser.error("--blob-size deve ser >= 0")
+    
+    seeder = Seeder(args.database_type, args.rows, tables, args.chunk_rows, args.items_per_order, args.blob_size)
+    if not seeder.run():
+        sys.exit(1)
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """Resumo de latências (em segundos) em milissegundos: média, p50, p95, p99 e máximo"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    
+    def percentile(fraction: float) -> float:
+        # Nearest-rank: o menor valor com pelo menos ``fraction`` das amostras abaixo dele
+        index = min(len(ordered), max(1, math.ceil(fraction * len(ordered)))) - 1
+        return ordered[index] * 1000
+    
+    return {
+        'mean_ms': sum(ordered) / len(ordered) * 1000,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'max_ms': ordered[-1] * 1000,
+    }
+
+class Benchmark:
+    """Benchmark de consultas reutilizando as conexões do DataManager (comando benchmark)"""
+    
+    # Consultas por nome; ``%s`` recebe um ID existente sorteado do cache
+    QUERIES = {
+        'count_clientes': "SELECT COUNT(*) FROM clientes",
+        'point_select_cliente': "SELECT id, nome, email FROM clientes WHERE id = %s",
+        'join_clientes_pedidos': (
+            "SELECT c.nome, COUNT(p.id) FROM clientes c LEFT JOIN pedidos p ON c.id = p.cliente_id "
+            "GROUP BY c.id, c.nome"
+        ),
+    }
+    
+    # Consultas com uma linha por cliente: lidas em blocos por cursor do lado do servidor
+    STREAMING_QUERIES = {'join_clientes_pedidos'}
+    
+    def __init__(self, database_type: str, queries: Sequence[str] = None, iterations: int = 200,
+                 warmup: int = 20, max_seconds: float = 30):
+        self.database_type = database_type
+        self.queries = list(queries or self.QUERIES)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.max_seconds = max_seconds
+        self.manager = DataManager(database_type)
+    
+    def _params(self, query: str) -> Optional[tuple]:
+        if '%s' not in query:
+            return None
+        return (self.manager.get_random_existing_id('clientes'),)
+    
+    def _run_once(self, cursor, name: str) -> float:
+        query = self.QUERIES[name]
+        params = self._params(query)
+        start = time.perf_counter()
+        if name in self.STREAMING_QUERIES:
+            for _ in self.manager.stream_query(query, params):
+                pass
+        else:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            cursor.fetchall()
+        return time.perf_counter() - start
+    
+    def measure(self, name: str) -> Dict[str, Any]:
+        """Mede uma consulta e devolve iterações, vazão (consultas/s) e latências"""
+        cursor = self.manager.connection.cursor()
+        try:
+            for _ in range(self.warmup):
+                self._run_once(cursor, name)
+            
+            samples = []
+            start = time.perf_counter()
+            while len(samples) < self.iterations and time.perf_counter() - start < self.max_seconds:
+                samples.append(self._run_once(cursor, name))
+            elapsed = time.perf_counter() - start
+        finally:
+            cursor.close()
+            # Encerra a transação de leitura aberta (PostgreSQL/SQL Server)
+            self.manager.connection.rollback()
+        
+        result = {'iterations': len(samples), 'seconds': elapsed,
+                  'queries_per_second': len(samples) / elapsed if elapsed > 0 else 0.0}
+        result.update(latency_summary(samples))
+        return result
+    
+    def run(self) -> Dict[str, Any]:
+        """Executa todas as consultas selecionadas e devolve os resultados por consulta"""
+        if not self.manager.connect():
+            return {'success': False, 'error': f'Falha ao conectar com {self.database_type}'}
+        
+        results = {'success': True, 'queries': {}}
+        try:
+            for name in self.queries:
+                logging.info(f"🏁 {self.database_type.upper()}: {name} "
+                             f"({self.warmup} aquecimento + até {self.iterations} medições)")
+                try:
+                    results['queries'][name] = self.measure(name)
+                except Exception as e:
+                    logging.error(f"❌ Erro no benchmark de {name} ({self.database_type}): {e}")
+                    results['queries'][name] = {'error': str(e)}
+        finally:
+            self.manager.disconnect()
+        return results
+
+def log_benchmark_results(report: Dict[str, Any], baseline: Dict[str, Any] = None):
+    """Imprime a tabela de resultados, com variação de p50/p95 em relação a um baseline"""
+    logging.info("📈 Resultados do benchmark (latências em ms):")
+    logging.info(f"   {'banco':<10} {'consulta':<24} {'iter':>6} {'q/s':>9} {'p50':>9} {'p95':>9} "
+                 f"{'p99':>9} {'max':>9}")
+    for database_type, result in report['results'].items():
+        if not result.get('success'):
+            logging.info(f"   {database_type:<10} ❌ {result.get('error')}")
+            continue
+        for name, stats in result['queries'].items():
+            if 'error' in stats or not stats['iterations']:
+                logging.info(f"   {database_type:<10} {name:<24} ❌ {stats.get('error', 'sem medições')}")
+                continue
+            line = (f"   {database_type:<10} {name:<24} {stats['iterations']:>6} "
+                    f"{stats['queries_per_second']:>9.1f} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+                    f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}")
+            previous = (baseline or {}).get('results', {}).get(database_type, {}).get('queries', {}).get(name)
+            if previous and previous.get('p50_ms') and previous.get('p95_ms'):
+                line += (f"  Δp50 {(stats['p50_ms'] / previous['p50_ms'] - 1) * 100:+.1f}%"
+                         f"  Δp95 {(stats['p95_ms'] / previous['p95_ms'] - 1) * 100:+.1f}%")
+            logging.info(line)
+
+def benchmark_main(argv: List[str]):
+    """Comando benchmark: latência e vazão de consultas por banco, com saída JSON"""
+    parser = argparse.ArgumentParser(
+        prog='auto-data-manager.py benchmark',
+        description='Benchmark de consultas com aquecimento, percentis de latência e saída JSON'
+    )
+    parser.add_argument('databases', nargs='+', choices=['mysql', 'postgres', 'sqlserver', 'all'],
+                        help='Bancos a medir (all = os três)')
+    parser.add_argument('--queries', default=','.join(Benchmark.QUERIES),
+                        help=f"Consultas separadas por vírgula (padrão: {','.join(Benchmark.QUERIES)})")
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='Medições por consulta (padrão: 200)')
+    parser.add_argument('--warmup', type=int, default=20,
+                        help='Execuções de aquecimento, sem medição (padrão: 20)')
+    parser.add_argument('--max-seconds', type=float, default=30,
+                        help='Tempo máximo de medição por consulta (padrão: 30)')
+    parser.add_argument('--output', default=None,
+                        help='Arquivo JSON de resultados (padrão: metrics/benchmark/benchmark-<data>.json)')
+    parser.add_argument('--baseline', default=None,
+                        help='JSON de uma execução anterior para comparar p50/p95')
+    args = parser.parse_args(argv)
+    
+    queries = [name.strip() for name in args.queries.split(',') if name.strip()]
+    unknown = set(queries) - set(Benchmark.QUERIES)
+    if unknown:
+        parser.error(f"Consultas desconhecidas: {', '.join(sorted(unknown))}")
+    databases = ['mysql', 'postgres', 'sqlserver'] if 'all' in args.databases else list(dict.fromkeys(args.databases))
+    
+    started_at = datetime.datetime.now()
+    report = {
+        'timestamp': started_at.isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'iterations': args.iterations,
+        'warmup': args.warmup,
+        'results': {},
+    }
+    for database_type in databases:
+        report['results'][database_type] = Benchmark(
+            database_type, queries, args.iterations, args.warmup, args.max_seconds).run()
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    log_benchmark_results(report, baseline)
+    
+    output = args.output or os.path.join(
+        PROJECT_DIR, 'metrics', 'benchmark', f"benchmark-{started_at:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as output_file:
+        json.dump(report, output_file, indent=2)
+    logging.info(f"💾 Resultados salvos em {output}")
+    
+    if not any(result.get('success') for result in report['results'].values()):
+        sys.exit(1)
+
+# Subcomandos de main(); sem subcomando, executa a carga contínua
+COMMANDS = {
+    'seed': seed_main,
+    'benchmark': benchmark_main,
+    'replay': replay_main,
+}
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(
+        description='Sistema de Gerenciamento Automático - MULTI BANCO'
+    )
+    parser.add_argument('database_type', nargs='?', default='sqlserver',
+                        choices=['mysql', 'postgres', 'sqlserver', 'all'],
+                        help='Banco de dados alvo, ou all para os três em paralelo (padrão: sqlserver)')
+    parser.add_argument('duration', nargs='?', type=int, default=20,
+                        help='Duração da execução em segundos (padrão: 20)')
+    parser.add_argument('--engines', default=None,
+                        help="Bancos em paralelo, separados por vírgula (ex.: all 60 --engines mysql,postgres)")
+    parser.add_argument('--profile', default=None, metavar='ARQUIVO',
+                        help='Perfil de carga TOML/YAML (pesos, fases e taxas; ignora duration e --workers)')
+    parser.add_argument('--record', default=None, metavar='ARQUIVO',
+                        help='Grava o trace da carga em JSONL (.gz para compactar), para o comando replay')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Semente do random (mesmo mix de operações entre execuções e bancos)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Linhas por operação de INSERT (padrão: 1, linha a linha)')
+    parser.add_argument('--id-refresh', type=float, default=300,
+                        help='Intervalo em segundos para recarregar o cache de IDs (padrão: 300)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Número de workers concorrentes (padrão: 0, modo demonstração)')
+    parser.add_argument('--worker-mode', choices=['thread', 'process'], default='thread',
+                        help='Executar workers como threads ou processos (padrão: thread)')
+    parser.add_argument('--metrics-port', type=int, default=0,
+                        help='Porta do endpoint Prometheus /metrics (padrão: 0, desligado)')
+    parser.add_argument('--metrics-interval', type=float, default=30,
+                        help='Intervalo em segundos do resumo de latência por operação (padrão: 30, 0 desliga)')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Taxa alvo total em operações por segundo (padrão: 0, sem limite)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Usar o motor asyncio (asyncpg/aiomysql, pool de threads no SQL Server)')
+    parser.add_argument('--concurrency', type=int, default=100,
+                        help='Operações simultâneas em voo no modo --async (padrão: 100)')
+    parser.add_argument('--pool-size', type=int, default=20,
+                        help='Conexões no pool do modo --async (padrão: 20)')
+    parser.add_argument('--commit-policy', default='statement',
+                        help="Política de COMMIT: statement, count:N, interval:MS ou cycle (padrão: statement)")
+    parser.add_argument('--compare-commit-policies', nargs='?', const='statement,count:10,count:100,interval:100,cycle',
+                        metavar='POLÍTICAS',
+                        help='Executa a carga com cada política (separadas por vírgula) e compara a vazão')
+    args = parser.parse_args(argv)
+    try:
+        CommitPolicy.parse(args.commit_policy)
+        for spec in (args.compare_commit_policies or '').split(','):
+            if spec:
+                CommitPolicy.parse(spec)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.database_type == 'all' and not args.engines:
+        args.engines = 'all'
+    if args.engines:
+        engines = ['mysql', 'postgres', 'sqlserver'] if args.engines == 'all' else [
+            engine.strip() for engine in args.engines.split(',') if engine.strip()]
+        unknown = set(engines) - {'mysql', 'postgres', 'sqlserver'}
+        if unknown:
+            parser.error(f"Bancos desconhecidos em --engines: {', '.join(sorted(unknown))}")
+        args.engines = list(dict.fromkeys(engines))
+    if args.profile and (args.engines or args.use_async or args.compare_commit_policies or args.record):
+        parser.error("--profile não combina com --engines, --async, --compare-commit-policies ou --record")
+    if args.record and (args.engines or args.use_async or args.worker_mode == 'process' or args.compare_commit_policies):
+        parser.error("--record funciona apenas no modo demonstração e com workers em threads")
+    return args
 
 def main():
     """Função principal"""
     
-    # Verificar argumentos
-    database_type = sys.argv[1] if len(sys.argv) > 1 else 'sqlserver'
-    duration = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](sys.argv[2:])
+        return
     
-    if database_type not in ['mysql', 'postgres', 'sqlserver']:
-        print("❌ Tipo de banco inválido. Use: mysql, postgres ou sqlserver")
-        sys.exit(1)
+    # Verificar argumentos
+    args = parse_args()
+    database_type = args.database_type
+    duration = args.duration
     
     print(f"""
 🗄️  Sistema de Gerenciamento Automático - MULTI BANCO
 =========================================================
-🎯 Banco: {database_type.upper()}
+🎯 Banco: {', '.join(args.engines).upper() if args.engines else database_type.upper()}
 ⏰ Duração: {duration} segundos
 📊 Operações: INSERT e UPDATE automáticos
+📦 Lote: {args.batch_size} linha(s) por INSERT
 🔧 Drivers: pymysql, psycopg2, pymssql
 📋 Tabelas: clientes, produtos, logs, generic
 ⏰ Generic: Operações automáticas a cada 30 segundos
@@ -607,16 +4466,103 @@ def main():
 =========================================================
     """)
     
+    if args.seed is not None:
+        random.seed(args.seed)
+    
+    if args.engines:
+        if args.use_async:
+            engine_options = dict(concurrency=args.concurrency, pool_size=args.pool_size)
+        else:
+            engine_options = dict(workers=max(1, args.workers), mode=args.worker_mode,
+                                  commit_policy=CommitPolicy.parse(args.commit_policy))
+        runner = MultiEngineRunner(args.engines, seed=args.seed, use_async=args.use_async,
+                                   metrics_port=args.metrics_port, target_ops=args.rate,
+                                   batch_size=args.batch_size, id_refresh=args.id_refresh,
+                                   metrics_interval=args.metrics_interval, **engine_options)
+        try:
+            runner.run(duration)
+        except KeyboardInterrupt:
+            print("\n⏹️  Carga interrompida pelo usuário")
+        return
+    
+    if args.compare_commit_policies:
+        compare_commit_policies(database_type, args.compare_commit_policies.split(','), duration,
+                                workers=max(1, args.workers), mode=args.worker_mode, target_ops=args.rate,
+                                batch_size=args.batch_size, id_refresh=args.id_refresh)
+        return
+    
+    profile = None
+    if args.profile:
+        try:
+            profile = WorkloadProfile.load(args.profile)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Perfil inválido: {e}")
+            sys.exit(1)
+    
+    metrics_server = MetricsServer(args.metrics_port) if args.metrics_port else None
+    if metrics_server is not None:
+        metrics_server.start()
+    
+    if profile is not None:
+        runner = ProfileRunner(database_type, profile, id_refresh=args.id_refresh,
+                               metrics_interval=args.metrics_interval)
+        if metrics_server is not None:
+            metrics_server.register(database_type, runner.metrics, lambda: runner.pool)
+        try:
+            runner.run()
+        finally:
+            if metrics_server is not None:
+                metrics_server.stop()
+        return
+    
+    recorder = None
+    if args.record:
+        recorder = TraceRecorder(args.record, engine=database_type, workers=max(1, args.workers),
+                                 batch_size=args.batch_size, commit_policy=args.commit_policy, seed=args.seed)
+    
+    if args.use_async or args.workers > 0:
+        if args.use_async:
+            engine = AsyncLoadEngine(database_type, concurrency=args.concurrency, target_ops=args.rate,
+                                     batch_size=args.batch_size, pool_size=args.pool_size,
+                                     id_refresh=args.id_refresh, metrics_interval=args.metrics_interval)
+        else:
+            engine = LoadEngine(database_type, workers=args.workers, target_ops=args.rate,
+                                mode=args.worker_mode, batch_size=args.batch_size,
+                                id_refresh=args.id_refresh, metrics_interval=args.metrics_interval,
+                                commit_policy=CommitPolicy.parse(args.commit_policy), recorder=recorder)
+        if metrics_server is not None:
+            metrics_server.register(database_type, engine.metrics, lambda: engine.pool)
+        try:
+            engine.run(duration)
+        except KeyboardInterrupt:
+            print("\n⏹️  Carga interrompida pelo usuário")
+        finally:
+            if metrics_server is not None:
+                metrics_server.stop()
+            if recorder is not None:
+                recorder.close()
+        return
+    
     # Criar e iniciar o gerenciador
-    manager = DataManager(database_type)
+    manager = DataManager(database_type, batch_size=args.batch_size,
+                          id_cache=IdCache(args.id_refresh),
+                          commit_policy=CommitPolicy.parse(args.commit_policy))
+    manager.recorder = recorder
+    
+    if metrics_server is not None:
+        metrics_server.register(database_type, manager.metrics, manager.pool)
     
     if manager.connect():
         try:
-            manager.run_demo(duration)
+            manager.run_demo(duration, args.metrics_interval)
         except KeyboardInterrupt:
             print("\n⏹️  Demo interrompida pelo usuário")
         finally:
             manager.disconnect()
+            if metrics_server is not None:
+                metrics_server.stop()
+            if recorder is not None:
+                recorder.close()
     else:
         print("❌ Falha ao conectar ao banco!")
         sys.exit(1)
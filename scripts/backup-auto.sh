@@ -1,7 +1,7 @@
 #!/bin/bash
 
 # Script de backup automatizado para bancos de dados
-# Suporta backup incremental, compressão e rotação automática
+# Faz o backup dos bancos em paralelo, com compressão em stream e rotação automática
 
 set -e
 
@@ -19,6 +19,12 @@ BACKUP_DIR="${PROJECT_DIR}/backups"
 LOG_FILE="${BACKUP_DIR}/backup.log"
 RETENTION_DAYS=30
 COMPRESSION_LEVEL=6
+PARALLEL_JOBS=$(nproc 2>/dev/null || echo 2)
+PER_TABLE_MODE=false
+DEDUP_MODE=false
+DEDUP_DIR="${BACKUP_DIR}/dedup"
+STORE_SCRIPT="${SCRIPT_DIR}/backup-store.py"
+METRICS_FILE="${BACKUP_DIR}/logs/backup_metrics.csv"
 
 # Função de logging
 log_message() {
@@ -53,107 +59,302 @@ check_disk_space() {
     log_message "INFO" "Disk space check passed: ${available_space}GB available"
 }
 
+# Função para escolher o compressor (multi-thread quando disponível)
+detect_compressor() {
+    if command -v zstd &>/dev/null; then
+        COMPRESSOR="zstd"
+        COMPRESSED_EXT="zst"
+    elif command -v pigz &>/dev/null; then
+        COMPRESSOR="pigz"
+        COMPRESSED_EXT="gz"
+    else
+        COMPRESSOR="gzip"
+        COMPRESSED_EXT="gz"
+        log_message "WARN" "zstd/pigz not found, falling back to single-threaded gzip"
+    fi
+    log_message "INFO" "Compressor: ${COMPRESSOR} (level ${COMPRESSION_LEVEL}, ${PARALLEL_JOBS} jobs)"
+}
+
+# Comprime stdin para stdout enquanto o dump é gerado
+compress_stream() {
+    local threads=${1:-$PARALLEL_JOBS}
+    
+    case $COMPRESSOR in
+        zstd) zstd -q -T"$threads" -"$COMPRESSION_LEVEL" ;;
+        pigz) pigz -p "$threads" -"$COMPRESSION_LEVEL" ;;
+        *) gzip -"$COMPRESSION_LEVEL" ;;
+    esac
+}
+
+# Destino de um backup: em backups/<banco>, ou um snapshot do repositório deduplicado (--dedup)
+backup_target() {
+    local engine_dir=$1
+    local name=$2
+    
+    if [ "$DEDUP_MODE" = true ]; then
+        echo "${DEDUP_DIR}/snapshots/${name}"
+    else
+        echo "${BACKUP_DIR}/${engine_dir}/${name}"
+    fi
+}
+
+# Grava o dump lido do stdin em <destino>.<ext> comprimido ou, no modo --dedup,
+# como arquivo do snapshot (diretório do destino), gravando só os blocos novos
+store_stream() {
+    local destination=$1
+    local threads=${2:-$PARALLEL_JOBS}
+    
+    if [ "$DEDUP_MODE" = true ]; then
+        python3 "$STORE_SCRIPT" --repo "$DEDUP_DIR" --level "$COMPRESSION_LEVEL" --jobs "$threads" \
+            put "$(basename "$(dirname "$destination")")" - --name "$(basename "$destination")" 2>>"$LOG_FILE"
+    else
+        compress_stream "$threads" > "${destination}.${COMPRESSED_EXT}"
+    fi
+}
+
+# Fecha o snapshot deduplicado de um backup bem-sucedido (sem commit ele não é restaurável)
+commit_snapshot() {
+    local backup_path=$1
+    
+    [ "$DEDUP_MODE" = true ] || return 0
+    python3 "$STORE_SCRIPT" --repo "$DEDUP_DIR" commit "$(basename "$backup_path")" 2>>"$LOG_FILE"
+}
+
+# Função para registrar duração, tamanhos e vazão de um backup
+record_backup_metrics() {
+    local engine=$1
+    local start=$2
+    local db_bytes=${3:-0}
+    local backup_path=$4
+    local status=$5
+    local end=$(date +%s.%N)
+    local backup_bytes
+    if [ -f "${backup_path}/snapshot.json" ]; then
+        # Snapshot deduplicado: conta só os blocos gravados nesta execução
+        backup_bytes=$(sed -n 's/.*"stored_bytes": \([0-9]*\).*/\1/p' "${backup_path}/snapshot.json")
+    else
+        backup_bytes=$(du -sb "$backup_path" 2>/dev/null | cut -f1)
+    fi
+    backup_bytes=${backup_bytes:-0}
+    
+    local seconds=$(awk -v s="$start" -v e="$end" 'BEGIN { printf "%.1f", e - s }')
+    local rate=$(awk -v b="$db_bytes" -v s="$seconds" 'BEGIN { printf "%.1f", (s > 0 ? b / 1048576 / s : 0) }')
+    local db_mb=$(awk -v b="$db_bytes" 'BEGIN { printf "%.1f", b / 1048576 }')
+    local backup_mb=$(awk -v b="$backup_bytes" 'BEGIN { printf "%.1f", b / 1048576 }')
+    
+    echo "$(date '+%Y-%m-%d %H:%M:%S'),${engine},${seconds},${db_bytes},${backup_bytes},${status}" >> "$METRICS_FILE"
+    [ -n "$RUN_STATS" ] && echo "${engine} ${seconds} ${db_mb} ${backup_mb} ${rate} ${status}" >> "$RUN_STATS"
+    
+    if [ "$status" = "ok" ]; then
+        log_message "INFO" "${engine} backup completed: ${backup_path} (${seconds}s, database ${db_mb}MB, backup ${backup_mb}MB, ${rate}MB/s)"
+        echo -e "${GREEN}✅ ${engine}: ${seconds}s, ${rate} MB/s (banco ${db_mb}MB → backup ${backup_mb}MB)${NC}"
+    else
+        log_message "ERROR" "${engine} backup failed after ${seconds}s"
+        echo -e "${RED}❌ Backup do ${engine} falhou (${seconds}s)${NC}"
+    fi
+}
+
+# Executa um cliente do MySQL no container (senha via ambiente, fora da linha de comando)
+mysql_exec() {
+    local program=$1
+    shift
+    docker exec -e MYSQL_PWD="${DB_PASSWORD}" mysql_db "$program" -u"${DB_USER}" "$@"
+}
+
+# Opções extras do mysqldump no modo --dedup: uma linha por registro e sem data
+# no rodapé, para que só as linhas alteradas gerem blocos novos
+mysql_dedup_options() {
+    if [ "$DEDUP_MODE" = true ]; then
+        echo "--skip-extended-insert --skip-dump-date"
+    fi
+}
+
+# Dump dos dados de uma tabela do MySQL, comprimido em stream (--per-table, usado pelo xargs)
+dump_mysql_table() {
+    local table=$1
+    local backup_path=$2
+    set -o pipefail
+    
+    mysql_exec mysqldump \
+        --single-transaction \
+        --no-create-info \
+        --skip-triggers \
+        --hex-blob \
+        $(mysql_dedup_options) \
+        "${DB_NAME}" "$table" 2>>"$LOG_FILE" | store_stream "${backup_path}/${table}.sql" 1
+}
+
 # Função para backup do MySQL
 backup_mysql() {
+    local -
+    set -o pipefail
     local timestamp=$(date '+%Y%m%d_%H%M%S')
-    local backup_file="${BACKUP_DIR}/mysql/mysql_backup_${timestamp}.sql"
-    local compressed_file="${backup_file}.gz"
+    local start=$(date +%s.%N)
+    local backup_path=$(backup_target mysql "mysql_backup_${timestamp}")
+    local status="ok"
     
     echo -e "${BLUE}🔄 Fazendo backup do MySQL...${NC}"
     
-    if ! docker exec mysql_db mysqldump \
-        -u$(grep '^DB_USER' .env | cut -d '=' -f2) \
-        -p$(grep '^DB_PASSWORD' .env | cut -d '=' -f2) \
-        --single-transaction \
-        --routines \
-        --triggers \
-        --events \
-        --hex-blob \
-        --add-drop-database \
-        --databases $(grep '^DB_NAME' .env | cut -d '=' -f2) > "$backup_file" 2>/dev/null; then
+    local db_bytes=$(mysql_exec mysql -N -B -e \
+        "SELECT COALESCE(SUM(data_length + index_length), 0) FROM information_schema.tables WHERE table_schema = '${DB_NAME}'" \
+        2>/dev/null)
+    
+    if [ "$PER_TABLE_MODE" = false ]; then
+        # Padrão: um único dump no mesmo snapshot (FKs consistentes entre as
+        # tabelas), comprimido com todas as threads
+        local destination="${backup_path}/${DB_NAME}.sql"
+        if [ "$DEDUP_MODE" = false ]; then
+            destination="${backup_path}.sql"
+            backup_path="${destination}.${COMPRESSED_EXT}"
+        fi
+        mysql_exec mysqldump \
+            --single-transaction \
+            --routines \
+            --triggers \
+            --events \
+            --hex-blob \
+            --add-drop-database \
+            $(mysql_dedup_options) \
+            --databases "${DB_NAME}" 2>>"$LOG_FILE" | store_stream "$destination" || status="failed"
+    else
+        # --per-table: esquema (com rotinas, triggers e eventos) e um dump de dados
+        # por tabela, PARALLEL_JOBS tabelas ao mesmo tempo, das maiores para as
+        # menores. Cada dump tem o seu próprio snapshot: com escritas durante o
+        # backup, pedidos/itens_pedido/clientes podem ficar de momentos diferentes
+        log_message "WARN" "MySQL per-table dumps do not share a snapshot (FK-consistent only without concurrent writes)"
+        mkdir -p "$backup_path"
         
-        log_message "ERROR" "MySQL backup failed"
-        echo -e "${RED}❌ Backup do MySQL falhou${NC}"
-        return 1
+        mysql_exec mysqldump \
+            --no-data \
+            --routines \
+            --triggers \
+            --events \
+            --add-drop-database \
+            --databases "${DB_NAME}" 2>>"$LOG_FILE" | store_stream "${backup_path}/00_schema.sql" 1 || status="failed"
+        
+        local tables
+        if ! tables=$(mysql_exec mysql -N -B -e \
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE' ORDER BY data_length DESC" \
+            "${DB_NAME}" 2>>"$LOG_FILE"); then
+            status="failed"
+        fi
+        
+        export -f dump_mysql_table mysql_exec mysql_dedup_options store_stream compress_stream
+        export COMPRESSOR COMPRESSED_EXT COMPRESSION_LEVEL LOG_FILE DB_USER DB_PASSWORD DB_NAME
+        export DEDUP_MODE DEDUP_DIR STORE_SCRIPT
+        if [ -n "$tables" ] && ! printf '%s\n' "$tables" | \
+            xargs -P "$PARALLEL_JOBS" -I{} bash -c 'dump_mysql_table "$1" "$2"' _ {} "$backup_path"; then
+            status="failed"
+        fi
     fi
     
-    # Comprimir backup
-    gzip -"$COMPRESSION_LEVEL" "$backup_file"
-    
-    local file_size=$(du -h "$compressed_file" | cut -f1)
-    log_message "INFO" "MySQL backup completed: ${compressed_file} (${file_size})"
-    echo -e "${GREEN}✅ MySQL backup: ${file_size}${NC}"
+    if [ "$status" = "ok" ] && ! commit_snapshot "$backup_path"; then
+        status="failed"
+    fi
     
-    return 0
+    record_backup_metrics "MySQL" "$start" "$db_bytes" "$backup_path" "$status"
+    [ "$status" = "ok" ]
 }
 
 # Função para backup do PostgreSQL
 backup_postgres() {
     local timestamp=$(date '+%Y%m%d_%H%M%S')
-    local backup_file="${BACKUP_DIR}/postgres/postgres_backup_${timestamp}.sql"
-    local compressed_file="${backup_file}.gz"
+    local start=$(date +%s.%N)
+    local -
+    set -o pipefail
+    local backup_path=$(backup_target postgres "postgres_backup_${timestamp}")
+    local container_path="/tmp/postgres_backup_${timestamp}"
+    local status="ok"
     
     echo -e "${BLUE}🔄 Fazendo backup do PostgreSQL...${NC}"
     
+    local db_bytes=$(docker exec postgres_db psql -U "${POSTGRES_USER}" -d "${POSTGRES_DB}" -tAc \
+        "SELECT pg_database_size(current_database())" 2>/dev/null)
+    
+    # Formato diretório: PARALLEL_JOBS workers no mesmo snapshot, cada um
+    # gravando as suas tabelas já comprimidas (um arquivo por tabela). No modo
+    # --dedup o dump sai sem compressão e o diretório vai como tar para o snapshot
+    local compress_level=$COMPRESSION_LEVEL
+    [ "$DEDUP_MODE" = true ] && compress_level=0
     if ! docker exec postgres_db pg_dump \
-        -U $(grep '^POSTGRES_USER' .env | cut -d '=' -f2) \
-        --verbose \
-        --clean \
-        --if-exists \
-        --create \
-        --format=plain \
-        $(grep '^POSTGRES_DB' .env | cut -d '=' -f2) > "$backup_file" 2>/dev/null; then
-        
-        log_message "ERROR" "PostgreSQL backup failed"
-        echo -e "${RED}❌ Backup do PostgreSQL falhou${NC}"
-        return 1
+        -U "${POSTGRES_USER}" \
+        --format=directory \
+        --jobs="$PARALLEL_JOBS" \
+        --compress="$compress_level" \
+        --file="$container_path" \
+        "${POSTGRES_DB}" 2>>"$LOG_FILE"; then
+        status="failed"
+    elif [ "$DEDUP_MODE" = true ]; then
+        docker cp "postgres_db:${container_path}" - 2>>"$LOG_FILE" | \
+            store_stream "${backup_path}/${POSTGRES_DB}.tar" || status="failed"
+    elif ! docker cp "postgres_db:${container_path}" "$backup_path" >/dev/null 2>>"$LOG_FILE"; then
+        status="failed"
     fi
+    docker exec postgres_db rm -rf "$container_path" 2>/dev/null || true
     
-    # Comprimir backup
-    gzip -"$COMPRESSION_LEVEL" "$backup_file"
-    
-    local file_size=$(du -h "$compressed_file" | cut -f1)
-    log_message "INFO" "PostgreSQL backup completed: ${compressed_file} (${file_size})"
-    echo -e "${GREEN}✅ PostgreSQL backup: ${file_size}${NC}"
+    if [ "$status" = "ok" ] && ! commit_snapshot "$backup_path"; then
+        status="failed"
+    fi
     
-    return 0
+    record_backup_metrics "PostgreSQL" "$start" "$db_bytes" "$backup_path" "$status"
+    [ "$status" = "ok" ]
 }
 
 # Função para backup do SQL Server
 backup_sqlserver() {
+    local -
+    set -o pipefail
     local timestamp=$(date '+%Y%m%d_%H%M%S')
-    local backup_file="${BACKUP_DIR}/sqlserver/sqlserver_backup_${timestamp}.bak"
-    local export_file="${BACKUP_DIR}/sqlserver/sqlserver_export_${timestamp}.sql"
-    local compressed_file="${export_file}.gz"
+    local start=$(date +%s.%N)
+    local database="${SQLSERVER_DB:-${DB_NAME}}"
+    local container_dir="/var/opt/mssql/backup"
+    local backup_path=$(backup_target sqlserver "sqlserver_backup_${timestamp}")
+    local status="ok"
+    local sqlcmd=(docker exec sqlserver_db /opt/mssql-tools18/bin/sqlcmd -S localhost -U SA -P "${SA_PASSWORD}" -C -b)
     
     echo -e "${BLUE}🔄 Fazendo backup do SQL Server...${NC}"
     
-    # Backup nativo do SQL Server (arquivo .bak)
-    if ! docker exec sqlserver_db /opt/mssql-tools18/bin/sqlcmd \
-        -S localhost -U SA -P "$(grep '^SA_PASSWORD' .env | cut -d '=' -f2)" -C \
-        -Q "BACKUP DATABASE [master] TO DISK = '/tmp/backup.bak' WITH FORMAT, INIT;" &>/dev/null; then
-        
-        log_message "WARN" "SQL Server native backup failed, trying export"
+    local db_bytes=$("${sqlcmd[@]}" -h -1 -W -Q \
+        "SET NOCOUNT ON; SELECT CAST(SUM(CAST(size AS BIGINT)) * 8192 AS BIGINT) FROM sys.master_files WHERE database_id = DB_ID('${database}') AND type = 0" \
+        2>/dev/null | head -1)
+    
+    # Backup nativo dividido em arquivos (um writer por arquivo); o Express não
+    # comprime backups, então cada arquivo é comprimido ao sair do container.
+    # No modo --dedup vai um arquivo só: a divisão das páginas entre os arquivos
+    # muda a cada execução e impediria o reaproveitamento dos blocos
+    local stripes=$(( PARALLEL_JOBS < 4 ? PARALLEL_JOBS : 4 ))
+    [ "$DEDUP_MODE" = true ] && stripes=1
+    local disks=""
+    local stripe
+    for stripe in $(seq 1 "$stripes"); do
+        disks+="${disks:+, }DISK = N'${container_dir}/sqlserver_backup_${timestamp}_${stripe}.bak'"
+    done
+    
+    docker exec sqlserver_db mkdir -p "$container_dir" 2>/dev/null || true
+    if "${sqlcmd[@]}" -Q "BACKUP DATABASE [${database}] TO ${disks} WITH FORMAT, INIT, COPY_ONLY, CHECKSUM" >>"$LOG_FILE" 2>&1; then
+        mkdir -p "$backup_path"
+        local pids=()
+        for stripe in $(seq 1 "$stripes"); do
+            docker exec sqlserver_db cat "${container_dir}/sqlserver_backup_${timestamp}_${stripe}.bak" | \
+                store_stream "${backup_path}/${database}_${stripe}.bak" \
+                $(( PARALLEL_JOBS / stripes > 0 ? PARALLEL_JOBS / stripes : 1 )) &
+            pids+=($!)
+        done
+        local pid
+        for pid in "${pids[@]}"; do
+            wait "$pid" || status="failed"
+        done
     else
-        # Copiar backup do container
-        docker cp sqlserver_db:/tmp/backup.bak "$backup_file"
-        gzip -"$COMPRESSION_LEVEL" "$backup_file"
-        local file_size=$(du -h "${backup_file}.gz" | cut -f1)
-        echo -e "${GREEN}✅ SQL Server backup: ${file_size}${NC}"
+        status="failed"
     fi
+    docker exec sqlserver_db bash -c "rm -f ${container_dir}/sqlserver_backup_${timestamp}_*.bak" 2>/dev/null || true
     
-    # Export as SQL (fallback)
-    if docker exec sqlserver_db /opt/mssql-tools18/bin/sqlcmd \
-        -S localhost -U SA -P "$(grep '^SA_PASSWORD' .env | cut -d '=' -f2)" -C \
-        -Q "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE='BASE TABLE';" > "$export_file" 2>/dev/null; then
-        
-        gzip -"$COMPRESSION_LEVEL" "$export_file"
-        local export_size=$(du -h "$compressed_file" | cut -f1)
-        log_message "INFO" "SQL Server export completed: ${compressed_file} (${export_size})"
-        echo -e "${GREEN}✅ SQL Server export: ${export_size}${NC}"
+    if [ "$status" = "ok" ] && ! commit_snapshot "$backup_path"; then
+        status="failed"
     fi
     
-    return 0
+    record_backup_metrics "SQLServer" "$start" "$db_bytes" "$backup_path" "$status"
+    [ "$status" = "ok" ]
 }
 
 # Função para limpar backups antigos
@@ -162,16 +363,21 @@ cleanup_old_backups() {
     
     local removed_count=0
     
-    # Buscar e remover arquivos antigos
-    find "${BACKUP_DIR}" -name "*.gz" -type f -mtime +${RETENTION_DAYS} -exec rm {} \; -exec bash -c 'echo "Removido: $1"' _ {} \; | while read line; do
-        if [[ $line == "Removido:"* ]]; then
-            ((removed_count++))
-            log_message "INFO" "$line"
-        fi
-    done
+    # Buscar e remover backups antigos (arquivos comprimidos e diretórios de dump)
+    while read -r path; do
+        rm -rf "$path"
+        removed_count=$((removed_count + 1))
+        log_message "INFO" "Removido: $path"
+    done < <(find "${BACKUP_DIR}"/{mysql,postgres,sqlserver} -mindepth 1 -maxdepth 1 \
+        \( -name "*.gz" -o -name "*.zst" -o -type d -name "*_backup_*" \) -mtime +${RETENTION_DAYS} 2>/dev/null)
     
     # Mover backups muito antigos para arquivo
-    find "${BACKUP_DIR}" -name "*.gz" -type f -mtime +$((RETENTION_DAYS * 2)) -exec mv {} "${BACKUP_DIR}/archive/" \; 2>/dev/null || true
+    find "${BACKUP_DIR}" -path "$DEDUP_DIR" -prune -o \( -name "*.gz" -o -name "*.zst" \) -type f -mtime +$((RETENTION_DAYS * 2)) -exec mv {} "${BACKUP_DIR}/archive/" \; 2>/dev/null || true
+    
+    # Snapshots deduplicados: remove os antigos e os blocos que ficaram sem referência
+    if [ -d "${DEDUP_DIR}/snapshots" ]; then
+        python3 "$STORE_SCRIPT" --repo "$DEDUP_DIR" prune --keep-days "$RETENTION_DAYS" 2>&1 | tee -a "$LOG_FILE"
+    fi
     
     log_message "INFO" "Cleanup completed: ${removed_count} files removed"
     echo -e "${GREEN}✅ Limpeza concluída${NC}"
@@ -188,9 +394,9 @@ generate_backup_report() {
     
     # Estatísticas de backups
     echo "📊 ESTATÍSTICAS:" >> "$report_file"
-    echo "MySQL backups: $(find "${BACKUP_DIR}/mysql" -name "*.gz" | wc -l)" >> "$report_file"
-    echo "PostgreSQL backups: $(find "${BACKUP_DIR}/postgres" -name "*.gz" | wc -l)" >> "$report_file"
-    echo "SQL Server backups: $(find "${BACKUP_DIR}/sqlserver" -name "*.gz" | wc -l)" >> "$report_file"
+    echo "MySQL backups: $(find "${BACKUP_DIR}/mysql" -mindepth 1 -maxdepth 1 -name "mysql_backup_*" | wc -l)" >> "$report_file"
+    echo "PostgreSQL backups: $(find "${BACKUP_DIR}/postgres" -mindepth 1 -maxdepth 1 -name "postgres_backup_*" | wc -l)" >> "$report_file"
+    echo "SQL Server backups: $(find "${BACKUP_DIR}/sqlserver" -mindepth 1 -maxdepth 1 -name "sqlserver_backup_*" | wc -l)" >> "$report_file"
     echo "" >> "$report_file"
     
     # Tamanho total
@@ -200,30 +406,69 @@ generate_backup_report() {
     
     # Backups mais recentes
     echo "📅 BACKUPS MAIS RECENTES:" >> "$report_file"
-    find "${BACKUP_DIR}" -name "*.gz" -type f -printf "%T@ %p\n" | sort -nr | head -5 | while read timestamp filepath; do
+    find "${BACKUP_DIR}"/{mysql,postgres,sqlserver} -mindepth 1 -maxdepth 1 -name "*_backup_*" -printf "%T@ %p\n" | sort -nr | head -5 | while read timestamp filepath; do
         local date_str=$(date -d "@$timestamp" '+%Y-%m-%d %H:%M')
-        local size=$(du -h "$filepath" | cut -f1)
+        local size=$(du -sh "$filepath" | cut -f1)
         echo "  $date_str - $(basename "$filepath") ($size)" >> "$report_file"
     done
     
+    # Snapshots deduplicados
+    if [ -d "${DEDUP_DIR}/snapshots" ]; then
+        echo "" >> "$report_file"
+        echo "🧩 SNAPSHOTS DEDUPLICADOS:" >> "$report_file"
+        python3 "$STORE_SCRIPT" --repo "$DEDUP_DIR" list >> "$report_file" 2>/dev/null || true
+    fi
+    
+    # Duração e vazão das últimas execuções
+    if [ -f "$METRICS_FILE" ]; then
+        echo "" >> "$report_file"
+        echo "⏱️  ÚLTIMAS EXECUÇÕES:" >> "$report_file"
+        tail -n +2 "$METRICS_FILE" | tail -9 | awk -F, '{
+            rate = ($3 > 0 ? $4 / 1048576 / $3 : 0)
+            printf "  %s - %-10s %7.1fs %8.1f MB/s  %8.1f MB -> %8.1f MB  (%s)\n", $1, $2, $3, rate, $4 / 1048576, $5 / 1048576, $6
+        }' >> "$report_file"
+    fi
+    
     echo -e "${GREEN}📋 Relatório salvo em: $report_file${NC}"
     log_message "INFO" "Backup report generated: $report_file"
 }
 
 # Função para verificar integridade dos backups
 verify_backup_integrity() {
+    local -
+    set -o pipefail
     echo -e "${BLUE}🔍 Verificando integridade dos backups...${NC}"
     
     local corrupt_files=0
     
-    # Verificar arquivos comprimidos
-    find "${BACKUP_DIR}" -name "*.gz" -type f | while read file; do
-        if ! gzip -t "$file" 2>/dev/null; then
+    # Verificar arquivos comprimidos (inclusive os de dentro dos diretórios de dump)
+    while read -r file; do
+        local valid=true
+        case $file in
+            *.zst) zstd -q -t "$file" 2>/dev/null || valid=false ;;
+            *) gzip -t "$file" 2>/dev/null || valid=false ;;
+        esac
+        if [ "$valid" = false ]; then
             echo -e "${RED}❌ Arquivo corrompido: $(basename "$file")${NC}"
             log_message "ERROR" "Corrupt backup file: $file"
-            ((corrupt_files++))
+            corrupt_files=$((corrupt_files + 1))
         fi
-    done
+    done < <(find "${BACKUP_DIR}" -path "$DEDUP_DIR" -prune -o \( -name "*.gz" -o -name "*.zst" \) -type f -print)
+    
+    # Dumps em formato diretório do PostgreSQL precisam do índice (toc.dat)
+    while read -r dir; do
+        if [ ! -f "${dir}/toc.dat" ]; then
+            echo -e "${RED}❌ Dump incompleto: $(basename "$dir")${NC}"
+            log_message "ERROR" "Missing toc.dat in backup directory: $dir"
+            corrupt_files=$((corrupt_files + 1))
+        fi
+    done < <(find "${BACKUP_DIR}/postgres" -mindepth 1 -maxdepth 1 -type d -name "postgres_backup_*" 2>/dev/null)
+    
+    # Snapshots deduplicados: lê cada bloco referenciado e confere o SHA-256
+    if [ -d "${DEDUP_DIR}/snapshots" ] && ! python3 "$STORE_SCRIPT" --repo "$DEDUP_DIR" verify 2>&1 | tee -a "$LOG_FILE"; then
+        echo -e "${RED}❌ Repositório deduplicado com blocos ausentes ou corrompidos${NC}"
+        corrupt_files=$((corrupt_files + 1))
+    fi
     
     if [ $corrupt_files -eq 0 ]; then
         echo -e "${GREEN}✅ Todos os backups estão íntegros${NC}"
@@ -267,6 +512,9 @@ show_help() {
     echo "  --postgres        Backup apenas PostgreSQL"
     echo "  --sqlserver       Backup apenas SQL Server"
     echo "  --all             Backup de todos os bancos (padrão)"
+    echo "  --jobs N          Workers por banco (padrão: nº de CPUs)"
+    echo "  --per-table       MySQL com um dump por tabela em paralelo (sem snapshot comum entre elas)"
+    echo "  --dedup           Grava snapshots deduplicados em backups/dedup (só blocos novos)"
     echo "  --cleanup         Limpa backups antigos"
     echo "  --verify          Verifica integridade dos backups"
     echo "  --report          Gera relatório de backups"
@@ -276,6 +524,8 @@ show_help() {
     echo "Exemplos:"
     echo "  $0 --all          # Backup completo"
     echo "  $0 --mysql        # Apenas MySQL"
+    echo "  $0 --all --jobs 4 # Bancos em paralelo, 4 workers em cada"
+    echo "  $0 --all --dedup  # Snapshots incrementais (scripts/backup-store.py list/restore)"
     echo "  $0 --cleanup      # Limpar backups antigos"
 }
 
@@ -332,6 +582,20 @@ main() {
             --cron)
                 cron_mode=true
                 ;;
+            --jobs)
+                PARALLEL_JOBS=$2
+                shift
+                ;;
+            --consistent)
+                # Mantida por compatibilidade: o dump único consistente é o padrão
+                PER_TABLE_MODE=false
+                ;;
+            --per-table)
+                PER_TABLE_MODE=true
+                ;;
+            --dedup)
+                DEDUP_MODE=true
+                ;;
             *)
                 echo "Opção desconhecida: $1"
                 show_help
@@ -360,6 +624,7 @@ main() {
     
     # Carregar variáveis de ambiente
     export $(grep -v '^#' .env | xargs)
+    COMPRESSION_LEVEL=${BACKUP_COMPRESSION_LEVEL:-$COMPRESSION_LEVEL}
     
     # Configurar estrutura
     setup_backup_structure
@@ -393,27 +658,53 @@ main() {
         exit 0
     fi
     
-    # Executar backups
+    # Executar backups em paralelo: a janela fica próxima do banco mais lento
+    if [ "$DEDUP_MODE" = true ] && ! command -v python3 &>/dev/null; then
+        log_message "ERROR" "python3 not found (required by --dedup)"
+        echo -e "${RED}❌ python3 não encontrado (necessário para --dedup)${NC}"
+        exit 1
+    fi
+    detect_compressor
+    # Cabeçalho gravado antes dos jobs em paralelo: cada job só acrescenta linhas
+    [ -f "$METRICS_FILE" ] || echo "timestamp,engine,seconds,database_bytes,backup_bytes,status" > "$METRICS_FILE"
+    RUN_STATS=$(mktemp)
+    local window_start=$(date +%s.%N)
+    local pids=()
+    
     if [ "$all_flag" = true ] || [ "$backup_mysql_flag" = true ]; then
-        ((total_count++))
-        if backup_mysql; then
-            ((success_count++))
-        fi
+        backup_mysql &
+        pids+=($!)
     fi
     
     if [ "$all_flag" = true ] || [ "$backup_postgres_flag" = true ]; then
-        ((total_count++))
-        if backup_postgres; then
-            ((success_count++))
-        fi
+        backup_postgres &
+        pids+=($!)
     fi
     
     if [ "$all_flag" = true ] || [ "$backup_sqlserver_flag" = true ]; then
-        ((total_count++))
-        if backup_sqlserver; then
-            ((success_count++))
+        backup_sqlserver &
+        pids+=($!)
+    fi
+    
+    local pid
+    for pid in "${pids[@]}"; do
+        total_count=$((total_count + 1))
+        if wait "$pid"; then
+            success_count=$((success_count + 1))
         fi
+    done
+    
+    local window=$(awk -v s="$window_start" -v e="$(date +%s.%N)" 'BEGIN { printf "%.1f", e - s }')
+    local sequential=$(awk '{ total += $2 } END { printf "%.1f", total }' "$RUN_STATS")
+    if [ "$cron_mode" = false ] && [ -s "$RUN_STATS" ]; then
+        echo -e "\n${BLUE}⏱️  Tempos por banco:${NC}"
+        sort -k2 -nr "$RUN_STATS" | awk '{
+            printf "  %-10s %7.1fs %8.1f MB/s  %8.1f MB -> %8.1f MB  (%s)\n", $1, $2, $5, $3, $4, $6
+        }'
+        echo -e "  Janela de backup: ${window}s (soma sequencial: ${sequential}s)"
     fi
+    log_message "INFO" "Backup window: ${window}s (sum of engine durations: ${sequential}s)"
+    rm -f "$RUN_STATS"
     
     # Limpeza automática após backup completo
     if [ "$all_flag" = true ]; then
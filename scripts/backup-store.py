@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Repositório de Backups Deduplicado
+==================================
+
+Guarda dumps como snapshots em blocos endereçados pelo conteúdo:
+
+- os dumps (sem compressão) são cortados em blocos de tamanho variável,
+  com fronteiras escolhidas pelo próprio conteúdo;
+- cada bloco é gravado comprimido uma única vez, com o nome do seu SHA-256;
+- cada snapshot guarda apenas manifestos com a lista de blocos de cada arquivo.
+
+Uma linha alterada muda só o bloco em que está, então tabelas quase estáticas
+(produtos, clientes) não geram novos dados entre um backup e o próximo.
+
+Estrutura do repositório::
+
+    chunks/ab/abcd...{.zst,.z}        blocos comprimidos
+    snapshots/<id>/files/<nome>.json  manifesto de cada arquivo
+    snapshots/<id>/snapshot.json      resumo, gravado pelo commit
+
+Uso típico (veja ``backup-auto.sh --dedup``)::
+
+    mysqldump ... | backup-store.py put mysql_20250101 - --name clientes.sql
+    backup-store.py commit mysql_20250101
+    backup-store.py restore mysql_20250101 - --name clientes.sql | mysql ...
+"""
+
+import argparse
+import datetime
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+# zstd opcional: sem ele os blocos são comprimidos com zlib
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+DEFAULT_REPOSITORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'backups', 'dedup')
+
+class Chunker:
+    """Corte de um stream em blocos definidos pelo conteúdo
+    
+    As fronteiras caem em fins de linha (um registro por linha nos dumps de
+    texto; bytes ``\\n`` quaisquer em dumps binários). Depois de ``min_size``
+    bytes, cada linha fecha o bloco com probabilidade ``len(linha) / avg_size``,
+    decidida pelo CRC32 da linha: o tamanho médio fica perto de ``avg_size``
+    qualquer que seja o comprimento das linhas, e a mesma linha sempre produz a
+    mesma decisão, então inserções e remoções deslocam apenas os blocos vizinhos.
+    """
+    
+    def __init__(self, min_size: int = 16 * 1024, avg_size: int = 64 * 1024, max_size: int = 256 * 1024):
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError("Tamanhos de bloco devem respeitar 0 < min <= avg <= max")
+        self.min_size = min_size
+        self.max_size = max_size
+        # CRC32 uniforme em [0, 2^32): crc < len * threshold tem probabilidade len / avg
+        self.threshold = (1 << 32) // avg_size
+    
+    def chunks(self, stream: BinaryIO) -> Iterator[bytes]:
+        """Gera os blocos do stream, em ordem"""
+        crc32 = zlib.crc32
+        readline = stream.readline
+        min_size, max_size, threshold = self.min_size, self.max_size, self.threshold
+        parts = []
+        size = 0
+        while True:
+            line = readline(max_size)
+            if not line:
+                break
+            parts.append(line)
+            size += len(line)
+            if size >= max_size or (size >= min_size and crc32(line) < len(line) * threshold):
+                yield b''.join(parts)
+                parts = []
+                size = 0
+        if parts:
+            yield b''.join(parts)
+
+class BackupStore:
+    """Repositório de snapshots deduplicados em blocos endereçados pelo conteúdo
+    
+    Vários ``put`` podem gravar ao mesmo tempo, inclusive no mesmo snapshot: cada
+    bloco é escrito em arquivo temporário e renomeado, e um bloco repetido é
+    idêntico por definição. ``prune`` remove blocos e por isso exige acesso
+    exclusivo (lock no repositório).
+    """
+    
+    CODECS = ('.zst', '.z')
+    
+    def __init__(self, path: str, jobs: int = None, level: int = 6, chunker: Chunker = None):
+        self.path = path
+        self.jobs = jobs or os.cpu_count() or 2
+        self.level = level
+        self.chunker = chunker or Chunker()
+        self.codec = '.zst' if zstandard else '.z'
+        self._local = threading.local()
+        os.makedirs(os.path.join(path, 'chunks'), exist_ok=True)
+        os.makedirs(os.path.join(path, 'snapshots'), exist_ok=True)
+    
+    @contextmanager
+    def lock(self, exclusive: bool = False):
+        """Lock do repositório: compartilhado para gravar snapshots, exclusivo para o prune"""
+        with open(os.path.join(self.path, '.lock'), 'a') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+    
+    # Blocos
+    
+    def _chunk_path(self, digest: str, codec: str = None) -> str:
+        return os.path.join(self.path, 'chunks', digest[:2], digest + (codec or self.codec))
+    
+    def _find_chunk(self, digest: str) -> Optional[str]:
+        for codec in self.CODECS:
+            path = self._chunk_path(digest, codec)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _compress(self, data: bytes) -> bytes:
+        if zstandard:
+            # Um compressor por thread (ZstdCompressor não é thread-safe)
+            compressor = getattr(self._local, 'compressor', None)
+            if compressor is None:
+                compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+            return compressor.compress(data)
+        return zlib.compress(data, self.level)
+    
+    @staticmethod
+    def _decompress(path: str, data: bytes) -> bytes:
+        if path.endswith('.zst'):
+            if zstandard is None:
+                raise RuntimeError(f"Bloco {os.path.basename(path)} exige o módulo zstandard (pip install zstandard)")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+    
+    def _write_chunk(self, digest: str, data: bytes) -> int:
+        """Comprime e grava um bloco novo; devolve os bytes gravados"""
+        path = self._chunk_path(digest)
+        compressed = self._compress(data)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(compressed)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return len(compressed)
+    
+    def read_chunk(self, digest: str) -> bytes:
+        """Lê um bloco e confere o SHA-256 do conteúdo"""
+        path = self._find_chunk(digest)
+        if path is None:
+            raise FileNotFoundError(f"Bloco ausente no repositório: {digest}")
+        with open(path, 'rb') as handle:
+            data = self._decompress(path, handle.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Bloco corrompido: {digest}")
+        return data
+    
+    # Snapshots
+    
+    def _snapshot_path(self, snapshot: str) -> str:
+        if not snapshot or '/' in snapshot or snapshot.startswith('.'):
+            raise ValueError(f"Nome de snapshot inválido: {snapshot!r}")
+        return os.path.join(self.path, 'snapshots', snapshot)
+    
+    def _manifest_path(self, snapshot: str, name: str) -> str:
+        return os.path.join(self._snapshot_path(snapshot), 'files', quote(name, safe='') + '.json')
+    
+    def put(self, snapshot: str, name: str, stream: BinaryIO) -> Dict[str, Any]:
+        """Grava um arquivo (stream) no snapshot; só os blocos ainda inexistentes são escritos
+        
+        O corte e o hash rodam na thread atual; a compressão e a gravação dos
+        blocos novos vão para um pool de ``jobs`` threads (zlib, zstd e hashlib
+        liberam o GIL), com no máximo ``2 * jobs`` blocos em memória.
+        """
+        start = time.perf_counter()
+        file_hash = hashlib.sha256()
+        chunks: List[Tuple[str, int]] = []
+        pending = deque()
+        seen = set()
+        size = new_chunks = new_bytes = stored_bytes = 0
+        
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for data in self.chunker.chunks(stream):
+                file_hash.update(data)
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append((digest, len(data)))
+                size += len(data)
+                if digest in seen or self._find_chunk(digest):
+                    continue
+                seen.add(digest)
+                new_chunks += 1
+                new_bytes += len(data)
+                pending.append(pool.submit(self._write_chunk, digest, data))
+                if len(pending) >= 2 * self.jobs:
+                    stored_bytes += pending.popleft().result()
+            for future in pending:
+                stored_bytes += future.result()
+        
+        manifest = {
+            'name': name,
+            'size': size,
+            'sha256': file_hash.hexdigest(),
+            'chunks': chunks,
+            'new_chunks': new_chunks,
+            'new_bytes': new_bytes,
+            'stored_bytes': stored_bytes,
+            'seconds': round(time.perf_counter() - start, 3),
+            'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        }
+        path = self._manifest_path(snapshot, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(manifest, handle)
+        os.replace(path + '.tmp', path)
+        
+        logging.info(f"📦 {snapshot}/{name}: {format_bytes(size)} em {len(chunks)} blocos, "
+                     f"{new_chunks} novos ({format_bytes(stored_bytes)} gravados) em {manifest['seconds']:.1f}s")
+        return manifest
+    
+    def manifests(self, snapshot: str) -> List[Dict[str, Any]]:
+        """Manifestos dos arquivos de um snapshot, em ordem de nome"""
+        files_path = os.path.join(self._snapshot_path(snapshot), 'files')
+        if not os.path.isdir(files_path):
+            raise FileNotFoundError(f"Snapshot não encontrado: {snapshot}")
+        result = []
+        for entry in sorted(os.listdir(files_path)):
+            if entry.endswith('.json'):
+                with open(os.path.join(files_path, entry)) as handle:
+                    result.append(json.load(handle))
+        return result
+    
+    def commit(self, snapshot: str) -> Dict[str, Any]:
+        """Fecha o snapshot: grava o resumo que o marca como completo e restaurável"""
+        manifests = self.manifests(snapshot)
+        summary = {
+            'snapshot': snapshot,
+            'created_at': min(manifest['created_at'] for manifest in manifests) if manifests else None,
+            'committed_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'files': [manifest['name'] for manifest in manifests],
+            'size': sum(manifest['size'] for manifest in manifests),
+            'chunks': sum(len(manifest['chunks']) for manifest in manifests),
+            'new_chunks': sum(manifest['new_chunks'] for manifest in manifests),
+            'new_bytes': sum(manifest['new_bytes'] for manifest in manifests),
+            'stored_bytes': sum(manifest['stored_bytes'] for manifest in manifests),
+        }
+        path = os.path.join(self._snapshot_path(snapshot), 'snapshot.json')
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(summary, handle, indent=2)
+        os.replace(path + '.tmp', path)
+        
+        reused = 1 - summary['new_bytes'] / summary['size'] if summary['size'] else 0
+        logging.info(f"✅ Snapshot {snapshot}: {len(manifests)} arquivo(s), {format_bytes(summary['size'])}, "
+                     f"{reused:.1%} reaproveitado, {format_bytes(summary['stored_bytes'])} gravados")
+        return summary
+    
+    def snapshots(self) -> List[Dict[str, Any]]:
+        """Resumo de todos os snapshots; os não fechados aparecem com ``complete`` falso"""
+        result = []
+        snapshots_path = os.path.join(self.path, 'snapshots')
+        for snapshot in sorted(os.listdir(snapshots_path)):
+            summary_path = os.path.join(snapshots_path, snapshot, 'snapshot.json')
+            if os.path.exists(summary_path):
+                with open(summary_path) as handle:
+                    summary = json.load(handle)
+                summary['complete'] = True
+            else:
+                summary = {'snapshot': snapshot, 'complete': False,
+                           'created_at': datetime.datetime.fromtimestamp(
+                               os.path.getmtime(os.path.join(snapshots_path, snapshot))).isoformat(timespec='seconds')}
+            result.append(summary)
+        return result
+    
+    def restore(self, snapshot: str, destination: str, names: List[str] = None) -> Dict[str, Any]:
+        """Remonta os arquivos do snapshot em ``destination`` (``-``: stdout, um único arquivo)"""
+        if not os.path.exists(os.path.join(self._snapshot_path(snapshot), 'snapshot.json')):
+            raise FileNotFoundError(f"Snapshot inexistente ou incompleto (sem commit): {snapshot}")
+        manifests = [manifest for manifest in self.manifests(snapshot) if not names or manifest['name'] in names]
+        missing = set(names or []) - {manifest['name'] for manifest in manifests}
+        if missing:
+            raise FileNotFoundError(f"Arquivos fora do snapshot: {', '.join(sorted(missing))}")
+        if destination == '-' and len(manifests) != 1:
+            raise ValueError("Restauração para stdout exige exatamente um arquivo (--name)")
+        
+        start = time.perf_counter()
+        size = 0
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for manifest in manifests:
+                if destination == '-':
+                    target = sys.stdout.buffer
+                else:
+                    path = os.path.join(destination, manifest['name'])
+                    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                    target = open(path, 'wb')
+                try:
+                    file_hash = hashlib.sha256()
+                    for data in self._read_ahead(pool, manifest['chunks']):
+                        file_hash.update(data)
+                        target.write(data)
+                    target.flush()
+                finally:
+                    if target is not sys.stdout.buffer:
+                        target.close()
+                if file_hash.hexdigest() != manifest['sha256']:
+                    raise ValueError(f"SHA-256 de {manifest['name']} não confere após restauração")
+                size += manifest['size']
+        
+        seconds = time.perf_counter() - start
+        logging.info(f"♻️  Snapshot {snapshot}: {len(manifests)} arquivo(s), {format_bytes(size)} "
+                     f"restaurados em {seconds:.1f}s")
+        return {'success': True, 'files': len(manifests), 'size': size, 'seconds': seconds}
+    
+    def _read_ahead(self, pool: ThreadPoolExecutor, chunks: List[Tuple[str, int]]) -> Iterator[bytes]:
+        """Blocos do arquivo em ordem, lidos no pool com até ``2 * jobs`` blocos adiantados"""
+        pending = deque()
+        for digest, _ in chunks:
+            pending.append(pool.submit(self.read_chunk, digest))
+            if len(pending) >= 2 * self.jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    
+    def verify(self, snapshots: List[str] = None) -> Dict[str, Any]:
+        """Lê todos os blocos referenciados (uma vez cada) e confere os hashes"""
+        referenced = set()
+        for summary in self.snapshots():
+            if summary['complete'] and (not snapshots or summary['snapshot'] in snapshots):
+                for manifest in self.manifests(summary['snapshot']):
+                    referenced.update(digest for digest, _ in manifest['chunks'])
+        
+        errors = []
+        
+        def check(digest: str):
+            try:
+                self.read_chunk(digest)
+            except Exception as e:
+                errors.append(str(e))
+        
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            list(pool.map(check, referenced))
+        for error in errors[:20]:
+            logging.error(f"❌ {error}")
+        return {'success': not errors, 'chunks': len(referenced), 'errors': len(errors)}
+    
+    def prune(self, keep_days: int, keep_last: int = 1) -> Dict[str, Any]:
+        """Remove snapshots antigos e depois os blocos que nenhum snapshot restante referencia
+        
+        Snapshots são agrupados pelo prefixo do nome (até o último ``_backup_``
+        ou ``_``); os ``keep_last`` mais recentes de cada grupo ficam mesmo que
+        passem de ``keep_days``. Snapshots sem commit com mais de um dia são
+        tratados como execuções interrompidas e também removidos.
+        """
+        now = datetime.datetime.now()
+        limit = now - datetime.timedelta(days=keep_days)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for summary in self.snapshots():
+            groups.setdefault(snapshot_group(summary['snapshot']), []).append(summary)
+        
+        removed = []
+        for summaries in groups.values():
+            complete = sorted((summary for summary in summaries if summary['complete']),
+                              key=lambda summary: summary['created_at'] or '')
+            protected = {summary['snapshot'] for summary in complete[-keep_last:]} if keep_last > 0 else set()
+            for summary in summaries:
+                created_at = datetime.datetime.fromisoformat(summary['created_at']) if summary['created_at'] else now
+                expired = created_at < limit if summary['complete'] else created_at < now - datetime.timedelta(days=1)
+                if expired and summary['snapshot'] not in protected:
+                    shutil.rmtree(self._snapshot_path(summary['snapshot']))
+                    removed.append(summary['snapshot'])
+                    logging.info(f"🧹 Snapshot removido: {summary['snapshot']}")
+        
+        # Marcação dos blocos ainda referenciados e varredura do resto
+        referenced = set()
+        for summary in self.snapshots():
+            try:
+                manifests = self.manifests(summary['snapshot'])
+            except FileNotFoundError:
+                continue
+            for manifest in manifests:
+                referenced.update(digest for digest, _ in manifest['chunks'])
+        
+        freed_chunks = freed_bytes = 0
+        chunks_path = os.path.join(self.path, 'chunks')
+        for prefix in os.listdir(chunks_path):
+            prefix_path = os.path.join(chunks_path, prefix)
+            for entry in os.listdir(prefix_path):
+                digest = entry.split('.')[0]
+                if digest not in referenced:
+                    path = os.path.join(prefix_path, entry)
+                    freed_bytes += os.path.getsize(path)
+                    os.unlink(path)
+                    freed_chunks += 1
+        
+        logging.info(f"🧹 Prune: {len(removed)} snapshot(s) e {freed_chunks} blocos removidos "
+                     f"({format_bytes(freed_bytes)} liberados)")
+        return {'success': True, 'snapshots': removed, 'chunks': freed_chunks, 'bytes': freed_bytes}
+
+def snapshot_group(snapshot: str) -> str:
+    """Grupo de retenção de um snapshot: o nome sem o timestamp final"""
+    for separator in ('_backup_', '_'):
+        if separator in snapshot:
+            return snapshot.rsplit(separator, 1)[0]
+    return snapshot
+
+def format_bytes(size: float) -> str:
+    """Tamanho legível (B, KB, MB, GB)"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return f"{size:.1f}{unit}" if unit != 'B' else f"{int(size)}B"
+        size /= 1024
+
+def put_main(store: BackupStore, args: argparse.Namespace) -> bool:
+    """Grava stdin, um arquivo ou todos os arquivos de um diretório no snapshot"""
+    with store.lock():
+        if args.source == '-':
+            store.put(args.snapshot, args.name, sys.stdin.buffer)
+        elif os.path.isdir(args.source):
+            paths = []
+            for root, _, files in os.walk(args.source):
+                paths.extend(os.path.join(root, name) for name in files)
+            for path in sorted(paths):
+                name = os.path.relpath(path, args.source)
+                if args.name:
+                    name = os.path.join(args.name, name)
+                with open(path, 'rb') as handle:
+                    store.put(args.snapshot, name, handle)
+        else:
+            with open(args.source, 'rb') as handle:
+                store.put(args.snapshot, args.name or os.path.basename(args.source), handle)
+        if args.commit:
+            store.commit(args.snapshot)
+    return True
+
+def list_main(store: BackupStore, args: argparse.Namespace) -> bool:
+    """Lista os snapshots com tamanho lógico e bytes efetivamente gravados"""
+    snapshots = store.snapshots()
+    if args.json:
+        print(json.dumps(snapshots, indent=2))
+        return True
+    print(f"{'snapshot':<40} {'criado em':<20} {'arquivos':>8} {'tamanho':>10} {'novos':>10} {'gravado':>10}")
+    for summary in snapshots:
+        if not summary['complete']:
+            print(f"{summary['snapshot']:<40} {summary['created_at']:<20} {'(incompleto, sem commit)':>41}")
+            continue
+        print(f"{summary['snapshot']:<40} {summary['created_at'] or '-':<20} {len(summary['files']):>8} "
+              f"{format_bytes(summary['size']):>10} {format_bytes(summary['new_bytes']):>10} "
+              f"{format_bytes(summary['stored_bytes']):>10}")
+    
+    chunks_path = os.path.join(store.path, 'chunks')
+    stored = sum(entry.stat().st_size for prefix in os.scandir(chunks_path) for entry in os.scandir(prefix.path))
+    logical = sum(summary.get('size', 0) for summary in snapshots)
+    print(f"\n💾 Repositório: {format_bytes(stored)} em disco para {format_bytes(logical)} de snapshots"
+          + (f" ({logical / stored:.1f}x)" if stored else ''))
+    return True
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(
+        description='Repositório de backups deduplicado em blocos endereçados pelo conteúdo'
+    )
+    parser.add_argument('--repo', default=os.environ.get('BACKUP_DEDUP_DIR', DEFAULT_REPOSITORY),
+                        help='Diretório do repositório (padrão: backups/dedup ou $BACKUP_DEDUP_DIR)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Threads de compressão/leitura de blocos (padrão: nº de CPUs)')
+    parser.add_argument('--level', type=int, default=int(os.environ.get('BACKUP_COMPRESSION_LEVEL', 6)),
+                        help='Nível de compressão dos blocos (padrão: 6)')
+    parser.add_argument('--avg-chunk-kb', type=int, default=64,
+                        help='Tamanho médio dos blocos em KB (padrão: 64; mínimo 1/4 e máximo 4x)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    put = subparsers.add_parser('put', help='Grava stdin (-), um arquivo ou um diretório em um snapshot')
+    put.add_argument('snapshot', help='Nome do snapshot (ex.: mysql_backup_20250101_020000)')
+    put.add_argument('source', help='- para stdin, arquivo ou diretório')
+    put.add_argument('--name', default=None,
+                     help='Nome do arquivo no snapshot (obrigatório com stdin; prefixo para diretórios)')
+    put.add_argument('--commit', action='store_true', help='Fecha o snapshot após gravar')
+    
+    commit = subparsers.add_parser('commit', help='Fecha um snapshot (grava o resumo)')
+    commit.add_argument('snapshot')
+    
+    restore = subparsers.add_parser('restore', help='Restaura um snapshot em um diretório ou no stdout')
+    restore.add_argument('snapshot')
+    restore.add_argument('destination', help='Diretório de destino, ou - para stdout (um arquivo)')
+    restore.add_argument('--name', action='append', default=None,
+                         help='Arquivo a restaurar (pode repetir; padrão: todos)')
+    
+    listing = subparsers.add_parser('list', help='Lista os snapshots')
+    listing.add_argument('--json', action='store_true', help='Saída em JSON')
+    
+    verify = subparsers.add_parser('verify', help='Confere os hashes dos blocos referenciados')
+    verify.add_argument('snapshots', nargs='*', help='Snapshots a verificar (padrão: todos)')
+    
+    prune = subparsers.add_parser('prune', help='Remove snapshots antigos e blocos sem referência')
+    prune.add_argument('--keep-days', type=int, default=30, help='Retenção em dias (padrão: 30)')
+    prune.add_argument('--keep-last', type=int, default=1,
+                       help='Snapshots mais recentes mantidos por banco, mesmo se antigos (padrão: 1)')
+    
+    args = parser.parse_args()
+    if args.command == 'put' and args.source == '-' and not args.name:
+        parser.error("put com stdin (-) exige --name")
+    
+    avg_size = args.avg_chunk_kb * 1024
+    store = BackupStore(args.repo, jobs=args.jobs, level=args.level,
+                        chunker=Chunker(avg_size // 4, avg_size, avg_size * 4))
+    try:
+        if args.command == 'put':
+            success = put_main(store, args)
+        elif args.command == 'commit':
+            with store.lock():
+                store.commit(args.snapshot)
+            success = True
+        elif args.command == 'restore':
+            success = store.restore(args.snapshot, args.destination, args.name)['success']
+        elif args.command == 'list':
+            success = list_main(store, args)
+        elif args.command == 'verify':
+            result = store.verify(args.snapshots)
+            logging.info(f"🔍 {result['chunks']} blocos verificados, {result['errors']} com erro")
+            success = result['success']
+        else:
+            with store.lock(exclusive=True):
+                success = store.prune(args.keep_days, args.keep_last)['success']
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
+        logging.error(f"❌ {e}")
+        success = False
+    except BrokenPipeError:
+        success = False
+    
+    if not success:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
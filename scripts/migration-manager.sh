@@ -340,22 +340,18 @@ migrate_full() {
 sync_incremental() {
     local source_db=$1
     local target_db=$2
-    local since_timestamp=${3:-"24 hours ago"}
+    shift 2
     
     echo -e "${BLUE}🔄 Sincronização incremental: $source_db → $target_db${NC}"
-    echo "Desde: $since_timestamp"
     
-    # Implementação básica - pode ser expandida
-    case $source_db in
-        mysql)
-            local query="SELECT * FROM clientes WHERE updated_at >= DATE_SUB(NOW(), INTERVAL 1 DAY);"
-            docker exec mysql_db mysql -u"${DB_USER}" -p"${DB_PASSWORD}" "${DB_NAME}" -e "$query" > "${MIGRATION_DIR}/data/incremental_$(date +%Y%m%d_%H%M%S).sql"
-            ;;
-        postgres)
-            local query="SELECT * FROM clientes WHERE updated_at >= NOW() - INTERVAL '1 day';"
-            docker exec postgres_db psql -U "${POSTGRES_USER}" -d "${POSTGRES_DB}" -c "$query" > "${MIGRATION_DIR}/data/incremental_$(date +%Y%m%d_%H%M%S).sql"
-            ;;
-    esac
+    # Uma passada do sync do migration-pipeline: aplica no destino as alterações
+    # desde a marca d'água gravada lá (auto_data_sync); sem marca, copia tudo
+    local python="python3"
+    [ -x "${PROJECT_DIR}/.venv/bin/python" ] && python="${PROJECT_DIR}/.venv/bin/python"
+    if ! "$python" "${SCRIPT_DIR}/migration-pipeline.py" sync "$source_db" "$target_db" --once "$@"; then
+        echo -e "${RED}❌ Falha na sincronização incremental${NC}"
+        return 1
+    fi
     
     echo -e "${GREEN}✅ Sincronização incremental concluída${NC}"
 }
@@ -364,48 +360,15 @@ sync_incremental() {
 validate_migration() {
     local source_db=$1
     local target_db=$2
+    shift 2
     
     echo -e "${BLUE}✅ Validando migração...${NC}"
     
-    # Contar registros em cada tabela
-    local tables=("clientes" "produtos" "pedidos" "itens_pedido" "logs")
-    local validation_passed=true
-    
-    for table in "${tables[@]}"; do
-        echo -n "📊 Tabela $table: "
-        
-        local source_count=0
-        local target_count=0
-        
-        # Contar registros na origem
-        case $source_db in
-            mysql)
-                source_count=$(docker exec mysql_db mysql -u"${DB_USER}" -p"${DB_PASSWORD}" "${DB_NAME}" -e "SELECT COUNT(*) FROM $table;" -s -N 2>/dev/null || echo "0")
-                ;;
-            postgres)
-                source_count=$(docker exec postgres_db psql -U "${POSTGRES_USER}" -d "${POSTGRES_DB}" -c "SELECT COUNT(*) FROM $table;" -t 2>/dev/null | tr -d ' ' || echo "0")
-                ;;
-        esac
-        
-        # Contar registros no destino
-        case $target_db in
-            mysql)
-                target_count=$(docker exec mysql_db mysql -u"${DB_USER}" -p"${DB_PASSWORD}" "${DB_NAME}" -e "SELECT COUNT(*) FROM $table;" -s -N 2>/dev/null || echo "0")
-                ;;
-            postgres)
-                target_count=$(docker exec postgres_db psql -U "${POSTGRES_USER}" -d "${POSTGRES_DB}" -c "SELECT COUNT(*) FROM $table;" -t 2>/dev/null | tr -d ' ' || echo "0")
-                ;;
-        esac
-        
-        if [ "$source_count" = "$target_count" ]; then
-            echo -e "${GREEN}OK ($source_count registros)${NC}"
-        else
-            echo -e "${RED}FALHA (origem: $source_count, destino: $target_count)${NC}"
-            validation_passed=false
-        fi
-    done
-    
-    if [ "$validation_passed" = true ]; then
+    # Hashes por blocos da chave primária nos dois bancos (validate do
+    # migration-pipeline); só os blocos divergentes são detalhados linha a linha
+    local python="python3"
+    [ -x "${PROJECT_DIR}/.venv/bin/python" ] && python="${PROJECT_DIR}/.venv/bin/python"
+    if "$python" "${SCRIPT_DIR}/migration-pipeline.py" validate "$source_db" "$target_db" "$@"; then
         echo -e "${GREEN}🎉 Validação passou - migração bem-sucedida!${NC}"
         log_migration "INFO" "Migration validation passed"
         return 0
@@ -430,8 +393,8 @@ show_help() {
     echo "  migrate <source> <target>            - Migração completa"
     echo "  migrate-schema <source> <target>     - Migra apenas esquema"
     echo "  migrate-data <source> <target>       - Migra apenas dados"
-    echo "  sync <source> <target> [timestamp]   - Sincronização incremental"
-    echo "  validate <source> <target>           - Valida migração"
+    echo "  sync <source> <target> [opções]      - Sincronização incremental (uma passada)"
+    echo "  validate <source> <target> [opções]  - Valida migração (hashes por blocos)"
     echo "  list-migrations                      - Lista migrações realizadas"
     echo ""
     echo "Tipos de banco suportados:"
@@ -473,10 +436,10 @@ main() {
             migrate_full "${2}" "${3}" false true
             ;;
         sync)
-            sync_incremental "${2}" "${3}" "${4}"
+            sync_incremental "${@:2}"
             ;;
         validate)
-            validate_migration "${2}" "${3}"
+            validate_migration "${@:2}"
             ;;
         list-migrations)
             echo -e "${BLUE}📋 Arquivos de migração:${NC}"
@@ -0,0 +1,1425 @@
+#!/usr/bin/env python3
+"""
+Pipeline de Migração entre Bancos
+=================================
+
+Copia, replica e valida as tabelas do gerenciador entre MySQL, PostgreSQL
+e SQL Server:
+
+- migrate: cópia paralela por faixas de chave primária, com carga em massa;
+- sync: replicação incremental contínua a partir do updated_at;
+- validate: comparação de contagens e hashes por faixa de chave.
+
+Conexões, DataManager e bootstrap do schema vêm de ``auto-data-manager.py``.
+"""
+
+import argparse
+import datetime
+import decimal
+import importlib.util
+import itertools
+import json
+import logging
+import math
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# auto-data-manager.py não é importável pelo nome (hífen): carrega pelo caminho
+_spec = importlib.util.spec_from_file_location(
+    'auto_data_manager', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'auto-data-manager.py'))
+auto_data_manager = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = auto_data_manager
+_spec.loader.exec_module(auto_data_manager)
+
+from auto_data_manager import (  # noqa: E402
+    ConnectionPool, CsvStream, DataManager, DatabaseConfig, GenericTableGenerator, SchemaBootstrap
+)
+
+class TextCopyStream(CsvStream):
+    """Como CsvStream, no formato texto do COPY/LOAD DATA (TAB entre campos, \\N para NULL)"""
+    
+    SPECIAL = re.compile(r'[\\\t\n\r]')
+    
+    def __init__(self, rows: Iterable[Tuple], rows_per_read: int = 1000, bytes_prefix: str = '\\x'):
+        super().__init__(rows, rows_per_read)
+        self.bytes_prefix = self.escape(bytes_prefix)
+    
+    @staticmethod
+    def escape(text: str) -> str:
+        return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    
+    def field(self, value: Any) -> str:
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        if isinstance(value, bytes):
+            # Hexadecimal não tem caracteres a escapar
+            return self.bytes_prefix + value.hex()
+        text = str(value)
+        # A busca é bem mais barata que escapar (e quase nenhum valor precisa)
+        return self.escape(text) if self.SPECIAL.search(text) else text
+    
+    def _fill(self) -> bool:
+        chunk = list(itertools.islice(self._rows, self._rows_per_read))
+        if not chunk:
+            return False
+        self._buffer += ''.join('\t'.join(map(self.field, row)) + '\n' for row in chunk).encode('utf-8')
+        self.rows += len(chunk)
+        return True
+
+class Migrator:
+    """Migração de dados entre bancos em Python (comando migrate)"""
+    
+    # Níveis de dependência: em ordem; as tabelas (e faixas) de um nível em paralelo
+    LEVELS = (('clientes', 'produtos', 'logs', 'generic', 'generic_table'), ('pedidos',), ('itens_pedido',))
+    # Coluna das faixas de cada tabela (padrão: id)
+    SPLIT_COLUMNS = {'itens_pedido': 'pedido_id'}
+    # Chave primária de cada tabela (padrão: id)
+    KEY_COLUMNS = {'itens_pedido': ('pedido_id', 'produto_id')}
+    
+    # Classes de tipos (data_type do information_schema, em minúsculas)
+    INTEGER_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'integer', 'bigint'}
+    BINARY_TYPES = {'bytea', 'binary', 'varbinary', 'tinyblob', 'blob', 'mediumblob', 'longblob', 'image'}
+    JSON_TYPES = {'json', 'jsonb'}
+    TEXT_TYPES = {'char', 'character', 'varchar', 'character varying', 'text', 'tinytext', 'mediumtext',
+                  'longtext', 'nchar', 'nvarchar', 'ntext', 'name', 'xml', 'enum', 'set'}
+    NUMERIC_TYPES = {'decimal', 'numeric', 'money', 'smallmoney', 'float', 'real', 'double', 'double precision'}
+    DATETIME_TYPES = {'datetime', 'datetime2', 'smalldatetime', 'timestamp', 'timestamp without time zone'}
+    TIME_TYPES = {'time', 'time without time zone'}
+    SPATIAL_TYPES = {'geometry', 'geography', 'point', 'linestring', 'polygon', 'multipoint', 'multilinestring',
+                     'multipolygon', 'geometrycollection', 'line', 'lseg', 'box', 'path', 'circle'}
+    # Sem representação portátil entre bancos diferentes
+    NON_PORTABLE_TYPES = {'hierarchyid', 'sql_variant', 'ARRAY', 'USER-DEFINED'}
+    
+    def __init__(self, source: str, target: str, tables: Sequence[str] = None, workers: int = 4,
+                 split_rows: int = 250000, chunk_rows: int = 10000, truncate: bool = False,
+                 source_database: str = None, target_database: str = None):
+        self.source = source
+        self.target = target
+        all_tables = [table for level in self.LEVELS for table in level]
+        self.tables = [table for table in all_tables if not tables or table in tables]
+        self.workers = max(1, workers)
+        self.split_rows = max(1, split_rows)
+        self.chunk_rows = max(1, chunk_rows)
+        self.truncate = truncate
+        
+        source_options = {'database': source_database} if source_database else {}
+        target_options = {'database': target_database} if target_database else {}
+        if source == 'mysql':
+            source_options.update({'read_timeout': 3600})
+        if target == 'mysql':
+            target_options.update({'local_infile': True, 'read_timeout': 600, 'write_timeout': 600})
+        self.source_pool = ConnectionPool(source, min_size=1, max_size=self._pool_size(),
+                                          connect_options=source_options)
+        self.target_pool = ConnectionPool(target, min_size=1, max_size=self._pool_size(),
+                                          connect_options=target_options)
+        self.source_label = f"{source.upper()}{f'/{source_database}' if source_database else ''}"
+        self.target_label = f"{target.upper()}{f'/{target_database}' if target_database else ''}"
+        self._lock = threading.Lock()
+        self._nulled: Dict[str, int] = {}
+        self._load_data = target == 'mysql'
+    
+    def _pool_size(self) -> int:
+        # Uma conexão por worker, mais a do planejamento (mantida durante toda a migração)
+        return self.workers + 1
+    
+    def _manager(self, database_type: str, pool: ConnectionPool) -> 'DataManager':
+        manager = DataManager(database_type, pool=pool)
+        if not manager.connect():
+            raise RuntimeError(f"Falha ao conectar com {database_type}")
+        return manager
+    
+    # Planejamento
+    
+    @staticmethod
+    def table_columns(manager: 'DataManager', table: str) -> List[Tuple[str, str, Optional[int], bool]]:
+        """(nome, data_type, tamanho, unsigned) das colunas da tabela, na ordem da tabela"""
+        database_type = manager.database_type
+        unsigned = "column_type LIKE '%%unsigned%%'" if database_type == 'mysql' else '0'
+        cursor = manager.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT column_name, data_type, character_maximum_length, {unsigned} "
+                f"FROM information_schema.columns "
+                f"WHERE table_schema = {SchemaBootstrap.CURRENT_SCHEMA[database_type]} AND table_name = %s "
+                f"ORDER BY ordinal_position",
+                (table,)
+            )
+            columns = [(name.lower(), data_type if data_type in ('ARRAY', 'USER-DEFINED') else data_type.lower(),
+                        length, bool(is_unsigned))
+                       for name, data_type, length, is_unsigned in cursor.fetchall()]
+        finally:
+            cursor.close()
+            manager.connection.commit()
+        return columns
+    
+    def _portable(self, source_type: str, target_type: str) -> bool:
+        if self.target == 'sqlserver' and target_type == 'timestamp':
+            return False    # ROWVERSION: preenchida pelo banco
+        if self.source == self.target:
+            return self.source == 'postgres' or not ({source_type, target_type} & self.SPATIAL_TYPES)
+        return not ({source_type, target_type} & (self.SPATIAL_TYPES | self.NON_PORTABLE_TYPES))
+    
+    def column_plan(self, source: 'DataManager', target: 'DataManager', table: str) -> Optional[Dict[str, Any]]:
+        """Colunas comuns, seus tipos (origem, destino) e conversões de uma tabela (None se não existir na origem)"""
+        source_columns = self.table_columns(source, table)
+        if not source_columns:
+            return None
+        target_columns = {name: (data_type, length, unsigned)
+                          for name, data_type, length, unsigned in self.table_columns(target, table)}
+        
+        columns, types, converters, binary, skipped = [], [], [], set(), []
+        for name, source_type, _, _ in source_columns:
+            if name not in target_columns:
+                skipped.append(name)
+                continue
+            target_type, length, unsigned = target_columns[name]
+            if not self._portable(source_type, target_type):
+                skipped.append(name)
+                continue
+            converter = self._converter(f"{table}.{name}", source_type, target_type, length, unsigned)
+            if converter is not None:
+                converters.append((len(columns), converter))
+            if target_type in self.BINARY_TYPES:
+                binary.add(name)
+            columns.append(name)
+            types.append((source_type, target_type))
+        return {'columns': columns, 'types': types, 'converters': converters, 'binary': binary,
+                'skipped': skipped}
+    
+    def plan(self, source: 'DataManager', target: 'DataManager', table: str) -> Optional[Dict[str, Any]]:
+        """Colunas comuns, conversões e faixas de cópia de uma tabela (None se não existir na origem)"""
+        plan = self.column_plan(source, target, table)
+        if plan is None:
+            return None
+        split = self.SPLIT_COLUMNS.get(table, 'id')
+        cursor = source.connection.cursor()
+        try:
+            cursor.execute(f"SELECT MIN({split}), MAX({split}), COUNT(*) FROM {table}")
+            low, high, count = cursor.fetchone()
+        finally:
+            cursor.close()
+            source.connection.commit()
+        
+        ranges = [(None, None)]
+        if count > self.split_rows and low is not None:
+            parts = min(math.ceil(count / self.split_rows), self.workers * 4)
+            step = math.ceil((high - low + 1) / parts)
+            ranges = [(start, start + step) for start in range(low, high + 1, step)]
+        plan.update({'split': split, 'ranges': ranges, 'source_rows': count})
+        return plan
+    
+    # Conversão de tipos
+    
+    def _discard(self, column: str):
+        """Valor fora da faixa do tipo de destino: grava NULL e conta no relatório"""
+        with self._lock:
+            self._nulled[column] = self._nulled.get(column, 0) + 1
+    
+    @staticmethod
+    def _as_integer(value: Any, source_type: str) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return None if value is None else int(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return int.from_bytes(bytes(value), 'big')
+        if isinstance(value, str) and source_type in ('bit', 'bit varying'):
+            return int(value, 2) if value else 0
+        return int(value)
+    
+    @staticmethod
+    def _as_decimal(value: Any) -> Any:
+        if isinstance(value, str):
+            # money do PostgreSQL vem formatado ('-$1,234.56')
+            return decimal.Decimal(re.sub(r'[^0-9.\-]', '', value) or '0')
+        return value
+    
+    @staticmethod
+    def _range_literal(value: Any) -> Any:
+        """Range do psycopg2 no formato de entrada do PostgreSQL"""
+        if not hasattr(value, 'lower_inc'):
+            return value
+        if value.isempty:
+            return 'empty'
+        bound = lambda item: '' if item is None else f'"{item}"'
+        return (f"{'[' if value.lower_inc else '('}{bound(value.lower)},"
+                f"{bound(value.upper)}{']' if value.upper_inc else ')'}")
+    
+    @classmethod
+    def _array_literal(cls, value: Any) -> Any:
+        """Lista Python no formato de entrada de array do PostgreSQL"""
+        if not isinstance(value, list):
+            return value
+        def element(item):
+            if item is None:
+                return 'NULL'
+            if isinstance(item, list):
+                return cls._array_literal(item)
+            return '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        return '{' + ','.join(element(item) for item in value) + '}'
+    
+    def _converter(self, column: str, source_type: str, target_type: str, length: Optional[int],
+                   unsigned: bool) -> Optional[Callable[[Any], Any]]:
+        """Função que converte um valor da origem para a coluna de destino (None: sem conversão)"""
+        target = self.target
+        
+        if target_type in self.INTEGER_TYPES:
+            kind = 'INT' if target_type == 'integer' else target_type.upper()
+            kind = GenericTableGenerator.DIALECT_TYPES.get((target, kind), kind) + (' UNSIGNED' if unsigned else '')
+            low, high = (0, 2**64) if kind == 'BIGINT UNSIGNED' else GenericTableGenerator.INTEGER_RANGES[kind]
+            
+            def convert(value):
+                value = self._as_integer(value, source_type)
+                if value is not None and not low <= value < high:
+                    self._discard(column)
+                    return None
+                return value
+            return convert
+        
+        if target_type == 'bit':
+            if target == 'postgres':
+                width = length or 1
+                return lambda value: value if value is None or isinstance(value, str) else \
+                    format(self._as_integer(value, source_type), f'0{width}b')[-width:]
+            if target == 'sqlserver':
+                return lambda value: None if value is None else bool(self._as_integer(value, source_type))
+            return lambda value: self._as_integer(value, source_type)
+        
+        if target_type == 'boolean':
+            return lambda value: value if value is None or isinstance(value, bool) else \
+                bool(self._as_integer(value, source_type))
+        
+        if target_type in self.BINARY_TYPES:
+            return lambda value: value.encode('utf-8') if isinstance(value, str) else \
+                bytes(value) if isinstance(value, (bytearray, memoryview)) else value
+        
+        if target_type in self.JSON_TYPES:
+            return lambda value: json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+        
+        if target_type in self.TEXT_TYPES:
+            def convert(value):
+                if value is None or isinstance(value, str):
+                    return value
+                if isinstance(value, (dict, list)):
+                    return json.dumps(value, default=str)
+                if isinstance(value, (bytes, bytearray, memoryview)):
+                    return bytes(value).decode('utf-8', 'replace')
+                return str(value)
+            return convert
+        
+        if target_type in self.NUMERIC_TYPES:
+            if source_type == 'money':
+                return self._as_decimal
+            return None
+        
+        if target_type in self.DATETIME_TYPES:
+            # Sem fuso no destino: instantes com fuso vão para UTC
+            return lambda value: value.astimezone(datetime.timezone.utc).replace(tzinfo=None) \
+                if isinstance(value, datetime.datetime) and value.tzinfo else value
+        
+        if target_type in self.TIME_TYPES:
+            def convert(value):
+                if isinstance(value, datetime.time):
+                    return value.replace(tzinfo=None)
+                if isinstance(value, datetime.timedelta):
+                    # TIME do MySQL chega como timedelta (até 838 horas)
+                    seconds = int(value.total_seconds())
+                    if target == 'mysql':
+                        return f"{'-' if seconds < 0 else ''}{abs(seconds) // 3600}:{abs(seconds) // 60 % 60:02d}:{abs(seconds) % 60:02d}"
+                    if not 0 <= seconds < 86400:
+                        self._discard(column)
+                        return None
+                    return datetime.time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+                return value
+            return convert
+        
+        if target_type == 'interval':
+            # Dias separados das horas, como na origem ('6 days 08:20:38', não '152:20:38')
+            return lambda value: f"{value.days} days {value.seconds} seconds {value.microseconds} microseconds" \
+                if isinstance(value, datetime.timedelta) else value
+        
+        if target_type == 'date':
+            return lambda value: value.date() if isinstance(value, datetime.datetime) else value
+        
+        if target_type == 'year':
+            return lambda value: value.year if isinstance(value, (datetime.date, datetime.datetime)) else value
+        
+        if target_type in ('uuid', 'uniqueidentifier'):
+            return lambda value: None if value is None else str(value)
+        
+        if target_type == 'ARRAY':
+            return self._array_literal
+        
+        if target_type.endswith('range'):
+            return self._range_literal
+        
+        return None
+    
+    # Cópia
+    
+    def _rows(self, chunks: Iterable[List[Tuple]], converters: List[Tuple[int, Callable]]) -> Iterable[Tuple]:
+        for chunk in chunks:
+            if not converters:
+                yield from chunk
+                continue
+            for row in chunk:
+                row = list(row)
+                for index, convert in converters:
+                    row[index] = convert(row[index])
+                yield tuple(row)
+    
+    def _load(self, target: 'DataManager', table: str, plan: Dict[str, Any], rows: Iterable[Tuple]) -> int:
+        """Grava o fluxo de linhas no destino pelo caminho de carga do banco; devolve as linhas gravadas"""
+        columns = plan['columns']
+        connection = target.connection
+        
+        if self.target == 'postgres':
+            stream = TextCopyStream(rows)
+            cursor = connection.cursor()
+            try:
+                cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", stream, size=1 << 20)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+            return stream.rows
+        
+        if self.target == 'mysql' and self._load_data:
+            # Binários vão em hexadecimal para uma variável e são convertidos com UNHEX
+            fields = [f"@{column}" if column in plan['binary'] else column for column in columns]
+            conversions = ', '.join(f"{column} = UNHEX(@{column})" for column in columns if column in plan['binary'])
+            query = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                     f"({', '.join(fields)})" + (f" SET {conversions}" if conversions else ''))
+            return self._load_chunks(rows, lambda chunk: self._load_data_chunk(connection, query, chunk))
+        
+        identity = self.target == 'sqlserver' and self._has_identity(connection, table, columns)
+        if identity:
+            cursor = connection.cursor()
+            cursor.execute(f"SET IDENTITY_INSERT {table} ON")
+            cursor.close()
+        try:
+            def insert(chunk):
+                result = target.execute_batch(table, columns, chunk, id_column=None)
+                if not result['success']:
+                    raise RuntimeError(result['error'])
+                target.commit()
+            return self._load_chunks(rows, insert)
+        finally:
+            if identity:
+                cursor = connection.cursor()
+                cursor.execute(f"SET IDENTITY_INSERT {table} OFF")
+                cursor.close()
+    
+    def _load_chunks(self, rows: Iterable[Tuple], load: Callable[[List[Tuple]], None]) -> int:
+        total = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_rows))
+            if not chunk:
+                return total
+            load(chunk)
+            total += len(chunk)
+    
+    @staticmethod
+    def _load_data_chunk(connection, query: str, chunk: List[Tuple]):
+        with tempfile.NamedTemporaryFile('wb', suffix='.tsv', delete=False) as chunk_file:
+            chunk_file.write(TextCopyStream(chunk, bytes_prefix='').read())
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, (chunk_file.name,))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            os.unlink(chunk_file.name)
+    
+    @staticmethod
+    def _has_identity(connection, table: str, columns: Sequence[str]) -> bool:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT name FROM sys.identity_columns WHERE object_id = OBJECT_ID(%s)", (table,))
+            return any(name.lower() in columns for name, in cursor.fetchall())
+        finally:
+            cursor.close()
+    
+    def copy_range(self, table: str, plan: Dict[str, Any], low: Optional[int], high: Optional[int]) -> int:
+        """Copia uma faixa [low, high) da tabela (ou a tabela inteira) com conexões próprias"""
+        source = self._manager(self.source, self.source_pool)
+        target = None
+        chunks = None
+        try:
+            target = self._manager(self.target, self.target_pool)
+            if self.source == 'mysql':
+                # Leitura sem buffer: o servidor não pode desistir enquanto o destino grava
+                cursor = source.connection.cursor()
+                cursor.execute("SET SESSION net_write_timeout = 3600")
+                cursor.close()
+            
+            query = f"SELECT {', '.join(plan['columns'])} FROM {table}"
+            params = None
+            if low is not None:
+                query += f" WHERE {plan['split']} >= %s AND {plan['split']} < %s"
+                params = (low, high)
+            chunks = source.stream_query(query, params, self.chunk_rows)
+            return self._load(target, table, plan, self._rows(chunks, plan['converters']))
+        finally:
+            if chunks is not None:
+                chunks.close()
+            source.disconnect()
+            if target is not None:
+                target.disconnect()
+    
+    def _truncate(self, target: 'DataManager'):
+        """Esvazia as tabelas de destino, das dependentes para as referenciadas"""
+        tables = list(reversed(self.tables))
+        cursor = target.connection.cursor()
+        try:
+            if self.target == 'postgres':
+                cursor.execute(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
+            elif self.target == 'mysql':
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+                for table in tables:
+                    cursor.execute(f"TRUNCATE TABLE {table}")
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+            else:
+                for table in tables:
+                    cursor.execute(f"DELETE FROM {table}")
+            target.connection.commit()
+        finally:
+            cursor.close()
+        logging.info(f"🧹 Tabelas esvaziadas no destino: {', '.join(tables)}")
+    
+    def _reset_sequences(self, target: 'DataManager', table: str):
+        """PostgreSQL: sequências das colunas SERIAL continuam após o maior valor copiado"""
+        cursor = target.connection.cursor()
+        try:
+            cursor.execute("SELECT column_name FROM information_schema.columns WHERE table_schema = current_schema() "
+                           "AND table_name = %s AND column_default LIKE 'nextval(%%'", (table,))
+            for column, in cursor.fetchall():
+                cursor.execute(f"SELECT setval(pg_get_serial_sequence(%s, %s), COALESCE(MAX({column}), 1), "
+                               f"MAX({column}) IS NOT NULL) FROM {table}", (table, column))
+            target.connection.commit()
+        finally:
+            cursor.close()
+    
+    def _count(self, manager: 'DataManager', table: str) -> int:
+        cursor = manager.connection.cursor()
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+            manager.connection.commit()
+    
+    def run(self) -> Dict[str, Any]:
+        """Executa a migração e devolve o resumo por tabela"""
+        logging.info(f"🚚 Migrando {self.source_label} → {self.target_label}: {', '.join(self.tables)} "
+                     f"({self.workers} workers, faixas de até {self.split_rows} linhas)")
+        try:
+            source = self._manager(self.source, self.source_pool)
+            target = self._manager(self.target, self.target_pool)
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+        
+        summary = {'success': True, 'tables': {}}
+        start_time = time.monotonic()
+        try:
+            if not SchemaBootstrap(target).ensure():
+                return {'success': False, 'error': f'Falha ao verificar/criar o schema em {self.target_label}'}
+            if self.target == 'mysql':
+                cursor = target.connection.cursor()
+                cursor.execute("SELECT @@GLOBAL.local_infile")
+                self._load_data = bool(cursor.fetchone()[0])
+                cursor.close()
+                if not self._load_data:
+                    logging.warning("⚠️ local_infile desabilitado no servidor MySQL; usando INSERT em lote")
+            if self.truncate:
+                self._truncate(target)
+            
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='migrate') as executor:
+                for level in self.LEVELS:
+                    tables = [table for table in level if table in self.tables]
+                    plans = {}
+                    for table in tables:
+                        plan = self.plan(source, target, table)
+                        if plan is None:
+                            logging.warning(f"⚠️ {table} não existe em {self.source_label}, ignorada")
+                            continue
+                        plans[table] = plan
+                        if plan['skipped']:
+                            logging.warning(f"⚠️ {table}: colunas sem equivalente no destino ignoradas: "
+                                            f"{', '.join(plan['skipped'])}")
+                    
+                    futures = {table: [(executor.submit(self._timed_copy, table, plan, low, high), low, high)
+                                       for low, high in plan['ranges']]
+                               for table, plan in plans.items()}
+                    for table, range_futures in futures.items():
+                        rows, started, finished, errors = 0, None, None, []
+                        for future, low, high in range_futures:
+                            try:
+                                copied, range_start, range_end = future.result()
+                            except Exception as e:
+                                bounds = f" [{low}, {high})" if low is not None else ''
+                                errors.append(f"{table}{bounds}: {e}")
+                                continue
+                            rows += copied
+                            started = range_start if started is None else min(started, range_start)
+                            finished = range_end if finished is None else max(finished, range_end)
+                        summary['tables'][table] = self._table_report(table, plans[table], rows, started, finished,
+                                                                      errors)
+                    if any(report['errors'] for report in summary['tables'].values()):
+                        summary['success'] = False
+                        logging.error("❌ Falha na cópia; níveis dependentes não serão migrados")
+                        break
+            
+            for table, report in summary['tables'].items():
+                if self.target == 'postgres':
+                    self._reset_sequences(target, table)
+                report['target_rows'] = self._count(target, table)
+        except Exception as e:
+            logging.error(f"❌ Erro na migração {self.source_label} → {self.target_label}: {e}")
+            summary.update({'success': False, 'error': str(e)})
+        finally:
+            source.disconnect()
+            target.disconnect()
+            self.source_pool.close()
+            self.target_pool.close()
+        
+        elapsed = time.monotonic() - start_time
+        total_rows = sum(report['rows'] for report in summary['tables'].values())
+        summary.update({'rows': total_rows, 'seconds': elapsed})
+        self.log_report(summary)
+        return summary
+    
+    def _timed_copy(self, table: str, plan: Dict[str, Any], low: Optional[int],
+                    high: Optional[int]) -> Tuple[int, float, float]:
+        started = time.monotonic()
+        copied = self.copy_range(table, plan, low, high)
+        finished = time.monotonic()
+        if low is not None:
+            logging.info(f"📦 {table} [{low}, {high}): {copied} linhas em {finished - started:.1f}s")
+        return copied, started, finished
+    
+    def _table_report(self, table: str, plan: Dict[str, Any], rows: int, started: Optional[float],
+                      finished: Optional[float], errors: List[str]) -> Dict[str, Any]:
+        seconds = (finished - started) if started is not None else 0.0
+        with self._lock:
+            nulled = {column: count for column, count in self._nulled.items() if column.startswith(f"{table}.")}
+        for error in errors:
+            logging.error(f"❌ {error}")
+        return {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds > 0 else 0.0,
+                'ranges': len(plan['ranges']), 'source_rows': plan['source_rows'], 'skipped_columns': plan['skipped'],
+                'nulled_values': nulled, 'errors': errors}
+    
+    def log_report(self, summary: Dict[str, Any]):
+        logging.info(f"📊 Migração {self.source_label} → {self.target_label}:")
+        for table, report in summary['tables'].items():
+            check = '✅' if report.get('target_rows') == report['source_rows'] and not report['errors'] else '⚠️'
+            logging.info(f"   {check} {table:<14} {report['rows']:>10} linhas em {report['seconds']:6.1f}s "
+                         f"({report['rows_per_second']:>9,.0f} linhas/s, {report['ranges']} faixa(s)) "
+                         f"origem={report['source_rows']} destino={report.get('target_rows', '?')}")
+            for column, count in report['nulled_values'].items():
+                logging.warning(f"      {column}: {count} valor(es) fora da faixa do destino gravados como NULL")
+        icon = '🎉' if summary['success'] else '❌'
+        logging.info(f"{icon} {summary['rows']} linhas em {summary['seconds']:.1f}s")
+
+def migrate_main(argv: List[str]):
+    """Comando migrate: cópia de dados entre bancos em paralelo"""
+    parser = argparse.ArgumentParser(
+        prog='migration-pipeline.py migrate',
+        description='Migra as tabelas do gerenciador entre bancos (leitura em fluxo, carga em massa, '
+                    'tabelas e faixas de chave em paralelo)'
+    )
+    parser.add_argument('source', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de origem')
+    parser.add_argument('target', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de destino')
+    parser.add_argument('--tables', default=None,
+                        help='Tabelas a migrar, separadas por vírgula (padrão: todas)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Cópias simultâneas (tabelas ou faixas de chave) (padrão: 4)')
+    parser.add_argument('--split-rows', type=int, default=250000,
+                        help='Tabelas maiores que isso são divididas em faixas da chave (padrão: 250000)')
+    parser.add_argument('--chunk-rows', type=int, default=10000,
+                        help='Linhas por bloco de leitura e de carga (padrão: 10000)')
+    parser.add_argument('--truncate', action='store_true',
+                        help='Esvazia as tabelas de destino antes da cópia')
+    parser.add_argument('--source-database', default=None,
+                        help='Database de origem, se diferente do configurado')
+    parser.add_argument('--target-database', default=None,
+                        help='Database de destino, se diferente do configurado')
+    args = parser.parse_args(argv)
+    
+    known = [table for level in Migrator.LEVELS for table in level]
+    tables = [table.strip() for table in args.tables.split(',') if table.strip()] if args.tables else None
+    unknown = set(tables or []) - set(known)
+    if unknown:
+        parser.error(f"Tabelas desconhecidas: {', '.join(sorted(unknown))}")
+    if args.source == args.target and args.source_database == args.target_database:
+        parser.error("Origem e destino são o mesmo banco (use --target-database para outro database)")
+    
+    migrator = Migrator(args.source, args.target, tables, args.workers, args.split_rows, args.chunk_rows,
+                        args.truncate, args.source_database, args.target_database)
+    if not migrator.run()['success']:
+        sys.exit(1)
+
+class IncrementalSync(Migrator):
+    """Sincronização incremental contínua entre bancos (CDC por updated_at)"""
+    
+    WATERMARK_TABLE = 'auto_data_sync'
+    WATERMARK_DDL = {
+        'postgres': "CREATE TABLE auto_data_sync (origem VARCHAR(100) NOT NULL, tabela VARCHAR(64) NOT NULL, "
+                    "marca VARCHAR(400) NOT NULL, linhas BIGINT NOT NULL DEFAULT 0, "
+                    "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (origem, tabela))",
+        'mysql': "CREATE TABLE auto_data_sync (origem VARCHAR(100) NOT NULL, tabela VARCHAR(64) NOT NULL, "
+                 "marca VARCHAR(400) NOT NULL, linhas BIGINT NOT NULL DEFAULT 0, "
+                 "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (origem, tabela)) ENGINE=InnoDB",
+        'sqlserver': "CREATE TABLE auto_data_sync (origem NVARCHAR(100) NOT NULL, tabela NVARCHAR(64) NOT NULL, "
+                     "marca NVARCHAR(400) NOT NULL, linhas BIGINT NOT NULL DEFAULT 0, "
+                     "updated_at DATETIME2 DEFAULT GETDATE(), PRIMARY KEY (origem, tabela))",
+    }
+    
+    # Relógio da origem (mesmo relógio dos DEFAULTs/triggers de updated_at)
+    CLOCK_QUERIES = {'postgres': 'SELECT LOCALTIMESTAMP', 'mysql': 'SELECT NOW(6)', 'sqlserver': 'SELECT SYSDATETIME()'}
+    
+    # updated_at como texto exato: o DATETIME2 do SQL Server tem 100ns, o datetime do Python só µs
+    MARK_EXPRESSIONS = {'sqlserver': 'CONVERT(VARCHAR(27), updated_at, 121)'}
+    
+    INDEX_STATEMENTS = {
+        'postgres': "CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})",
+        'mysql': "CREATE INDEX {name} ON {table} ({columns})",
+        'sqlserver': "IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = '{name}') "
+                     "CREATE INDEX {name} ON {table} ({columns})",
+    }
+    
+    def __init__(self, source: str, target: str, tables: Sequence[str] = None, workers: int = 4,
+                 page_rows: int = 5000, interval: float = 1.0, lag: float = 2.0, reset: bool = False,
+                 source_database: str = None, target_database: str = None):
+        super().__init__(source, target, tables, workers, chunk_rows=page_rows,
+                         source_database=source_database, target_database=target_database)
+        self.interval = max(0.0, interval)
+        self.lag = datetime.timedelta(seconds=max(0.0, lag))
+        self.reset = reset
+        self.origin = f"{source}/{source_database or getattr(DatabaseConfig, source.upper())['database']}"
+        self.watermarks: Dict[str, Tuple[str, List[Any]]] = {}
+        self.applied: Dict[str, int] = {table: 0 for table in self.tables}
+        # Conexões de cada tabela (origem, destino), mantidas entre as passadas
+        self._sessions: Dict[str, Tuple['DataManager', 'DataManager']] = {}
+        self._errors: Dict[str, str] = {}
+    
+    def _pool_size(self) -> int:
+        # Um par de conexões por tabela, mais a de controle
+        return len(self.tables) + 1
+    
+    # Preparação
+    
+    def _ensure_watermark_table(self, target: 'DataManager'):
+        cursor = target.connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM information_schema.tables "
+                f"WHERE table_schema = {SchemaBootstrap.CURRENT_SCHEMA[self.target]} AND table_name = %s",
+                (self.WATERMARK_TABLE,)
+            )
+            if not cursor.fetchone()[0]:
+                cursor.execute(self.WATERMARK_DDL[self.target])
+                logging.info(f"✅ Tabela {self.WATERMARK_TABLE} criada em {self.target_label}")
+            if self.reset:
+                cursor.execute(f"DELETE FROM {self.WATERMARK_TABLE} WHERE origem = %s", (self.origin,))
+                logging.info(f"🧹 Marcas d'água de {self.origin} descartadas: sincronização desde o início")
+            cursor.execute(f"SELECT tabela, marca FROM {self.WATERMARK_TABLE} WHERE origem = %s", (self.origin,))
+            for table, mark in cursor.fetchall():
+                mark = json.loads(mark)
+                self.watermarks[table] = (mark[0], mark[1:])
+            target.connection.commit()
+        except Exception:
+            target.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    def _ensure_index(self, source: 'DataManager', table: str, keys: Sequence[str]):
+        """Índice (updated_at, chave) na origem, percorrido pelas páginas keyset"""
+        name = f"idx_{table}_sync"
+        cursor = source.connection.cursor()
+        try:
+            if self.source == 'mysql':
+                cursor.execute("SELECT COUNT(*) FROM information_schema.statistics "
+                               "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+                               (table, name))
+                if cursor.fetchone()[0]:
+                    return
+            cursor.execute(self.INDEX_STATEMENTS[self.source].format(
+                name=name, table=table, columns=', '.join(('updated_at',) + tuple(keys))))
+            source.connection.commit()
+        finally:
+            cursor.close()
+    
+    def _check_target_triggers(self, target: 'DataManager'):
+        """Avisa sobre triggers de updated_at do SQL Server que sobrescreveriam o valor da origem"""
+        if self.target != 'sqlserver':
+            return
+        cursor = target.connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT t.name FROM sys.triggers t JOIN sys.sql_modules m ON m.object_id = t.object_id "
+                "WHERE t.name LIKE 'tr[_]%[_]updated[_]at' AND m.definition NOT LIKE '%auto[_]data[_]sync%'"
+            )
+            stale = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+            target.connection.commit()
+        if stale:
+            logging.warning(f"⚠️ Triggers sem a verificação de SESSION_CONTEXT('auto_data_sync') em "
+                            f"{self.target_label}: {', '.join(sorted(stale))}. Eles trocam o updated_at "
+                            f"replicado por GETDATE(); recrie-os como em init/sqlserver/init_script.sql")
+    
+    def _session(self, table: str) -> Tuple['DataManager', 'DataManager']:
+        if table not in self._sessions:
+            source = self._manager(self.source, self.source_pool)
+            target = self._manager(self.target, self.target_pool)
+            self._configure_target(target)
+            self._sessions[table] = (source, target)
+        return self._sessions[table]
+    
+    def _configure_target(self, target: 'DataManager'):
+        """Aplica as linhas como réplica: sem triggers (updated_at da origem) e sem checar FKs"""
+        cursor = target.connection.cursor()
+        try:
+            if self.target == 'postgres':
+                cursor.execute("SET session_replication_role = replica")
+            elif self.target == 'mysql':
+                cursor.execute("SET SESSION foreign_key_checks = 0")
+            elif self.target == 'sqlserver':
+                cursor.execute("EXEC sp_set_session_context @key = N'auto_data_sync', @value = 1")
+            target.connection.commit()
+        except Exception as e:
+            target.connection.rollback()
+            logging.warning(f"⚠️ Triggers e FKs do destino continuam ativos: {e}")
+        finally:
+            cursor.close()
+    
+    # Passadas
+    
+    def _clock(self, source: 'DataManager') -> datetime.datetime:
+        cursor = source.connection.cursor()
+        try:
+            cursor.execute(self.CLOCK_QUERIES[self.source])
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+            source.connection.commit()
+    
+    @staticmethod
+    def _mark_text(value: Any) -> str:
+        if isinstance(value, datetime.datetime):
+            return value.isoformat(' ', 'microseconds')
+        return str(value)
+    
+    @staticmethod
+    def _after(columns: Sequence[str], values: Sequence[Any]) -> Tuple[str, List[Any]]:
+        """(c1, c2, ...) > (v1, v2, ...) expandido (o SQL Server não compara tuplas)"""
+        clause, params = f"{columns[-1]} > %s", [values[-1]]
+        for column, value in zip(reversed(columns[:-1]), reversed(values[:-1])):
+            clause = f"{column} > %s OR ({column} = %s AND ({clause}))"
+            params = [value, value] + params
+        return clause, params
+    
+    def _page_query(self, table: str, plan: Dict[str, Any], bound: str,
+                    mark: Optional[Tuple[str, List[Any]]]) -> Tuple[str, List[Any]]:
+        order = ('updated_at',) + plan['keys']
+        where, params = "updated_at < %s", [bound]
+        if mark:
+            after, after_params = self._after(order, [mark[0]] + list(mark[1]))
+            # O limite inferior isolado deixa o otimizador usar a faixa do índice
+            where += f" AND updated_at >= %s AND ({after})"
+            params += [mark[0]] + after_params
+        columns = ', '.join([self.MARK_EXPRESSIONS.get(self.source, 'updated_at')] + plan['columns'])
+        order_by = ', '.join(order)
+        if self.source == 'sqlserver':
+            return f"SELECT TOP ({self.chunk_rows}) {columns} FROM {table} WHERE {where} ORDER BY {order_by}", params
+        return f"SELECT {columns} FROM {table} WHERE {where} ORDER BY {order_by} LIMIT {self.chunk_rows}", params
+    
+    def _save_watermark(self, cursor, table: str, mark: Tuple[str, List[Any]], rows: int):
+        text = json.dumps([mark[0]] + list(mark[1]), default=str)
+        cursor.execute(f"UPDATE {self.WATERMARK_TABLE} SET marca = %s, linhas = linhas + %s, "
+                       f"updated_at = CURRENT_TIMESTAMP WHERE origem = %s AND tabela = %s",
+                       (text, rows, self.origin, table))
+        if cursor.rowcount == 0:
+            cursor.execute(f"INSERT INTO {self.WATERMARK_TABLE} (origem, tabela, marca, linhas) "
+                           f"VALUES (%s, %s, %s, %s)", (self.origin, table, text, rows))
+    
+    def _apply(self, target: 'DataManager', table: str, plan: Dict[str, Any], rows: List[Tuple],
+               mark: Tuple[str, List[Any]]):
+        """Upsert da página e nova marca d'água em uma única transação"""
+        connection = target.connection
+        if self.target == 'mysql':
+            connection.begin()
+        cursor = connection.cursor()
+        try:
+            target.upsert_rows(cursor, table, plan['columns'], rows, plan['keys'])
+            self._save_watermark(cursor, table, mark, len(rows))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    def sync_table(self, table: str, plan: Dict[str, Any], bound: str) -> int:
+        """Aplica as alterações da tabela até ``bound``, página a página; devolve as linhas aplicadas"""
+        source, target = self._session(table)
+        key_indexes = [plan['columns'].index(key) + 1 for key in plan['keys']]
+        applied = 0
+        while True:
+            mark = self.watermarks.get(table)
+            query, params = self._page_query(table, plan, bound, mark)
+            cursor = source.connection.cursor()
+            try:
+                cursor.execute(query, tuple(params))
+                page = cursor.fetchall()
+            finally:
+                cursor.close()
+                source.connection.commit()
+            if not page:
+                return applied
+            
+            last = page[-1]
+            new_mark = (self._mark_text(last[0]), [last[index] for index in key_indexes])
+            rows = list(self._rows([[row[1:] for row in page]], plan['converters']))
+            self._apply(target, table, plan, rows, new_mark)
+            self.watermarks[table] = new_mark
+            applied += len(page)
+            with self._lock:
+                self.applied[table] += len(page)
+            if len(page) < self.chunk_rows or new_mark == mark:
+                return applied
+    
+    def _pass(self, executor: ThreadPoolExecutor, plans: Dict[str, Dict[str, Any]],
+              control: 'DataManager') -> Dict[str, int]:
+        """Uma passada por nível de FK, com o mesmo limite de tempo para todas as tabelas"""
+        bound = self._mark_text(self._clock(control) - self.lag)
+        applied = {}
+        for level in self.LEVELS:
+            futures = {table: executor.submit(self.sync_table, table, plans[table], bound)
+                       for table in level if table in plans}
+            for table, future in futures.items():
+                try:
+                    applied[table] = future.result()
+                    self._errors.pop(table, None)
+                except Exception as e:
+                    # A página volta na próxima passada; o mesmo erro só é registrado uma vez
+                    if self._errors.get(table) != str(e):
+                        logging.error(f"❌ {table}: {e} (repetindo na próxima passada)")
+                    self._errors[table] = str(e)
+                    self._discard_session(table)
+        return applied
+    
+    def _discard_session(self, table: str):
+        """Descarta as conexões da tabela após um erro (podem ter caído)"""
+        for manager in self._sessions.pop(table, ()):
+            try:
+                manager.connection.rollback()
+            except Exception:
+                pass
+            manager.disconnect()
+    
+    def run(self, once: bool = False) -> Dict[str, Any]:
+        """Sincroniza continuamente (até Ctrl+C) ou em uma única passada (``once``)"""
+        logging.info(f"🔄 Sincronizando {self.source_label} → {self.target_label}: {', '.join(self.tables)} "
+                     f"(páginas de {self.chunk_rows} linhas, folga de {self.lag.total_seconds():g}s)")
+        try:
+            source = self._manager(self.source, self.source_pool)
+            target = self._manager(self.target, self.target_pool)
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+        
+        summary = {'success': True, 'passes': 0}
+        start_time = time.monotonic()
+        try:
+            if not SchemaBootstrap(target).ensure():
+                return {'success': False, 'error': f'Falha ao verificar/criar o schema em {self.target_label}'}
+            self._ensure_watermark_table(target)
+            self._check_target_triggers(target)
+            
+            plans = {}
+            for table in self.tables:
+                plan = self.column_plan(source, target, table)
+                keys = self.KEY_COLUMNS.get(table, ('id',))
+                if plan is None or not {'updated_at', *keys} <= set(plan['columns']):
+                    logging.warning(f"⚠️ {table} sem updated_at/chave em comum nos dois bancos, ignorada")
+                    continue
+                if plan['skipped']:
+                    logging.warning(f"⚠️ {table}: colunas sem equivalente no destino ignoradas: "
+                                    f"{', '.join(plan['skipped'])}")
+                plan['keys'] = keys
+                self._ensure_index(source, table, keys)
+                plans[table] = plan
+                mark = self.watermarks.get(table)
+                logging.info(f"📍 {table}: " + (f"desde {mark[0]} (chave {mark[1]})" if mark else "desde o início"))
+            
+            last_report, reported = time.monotonic(), 0
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='sync') as executor:
+                while True:
+                    pass_start = time.monotonic()
+                    applied = self._pass(executor, plans, source)
+                    summary['passes'] += 1
+                    changed = {table: rows for table, rows in applied.items() if rows}
+                    if changed:
+                        logging.info(f"🔄 Passada {summary['passes']}: "
+                                     + ', '.join(f"{table}={rows}" for table, rows in changed.items())
+                                     + f" em {time.monotonic() - pass_start:.2f}s")
+                    if once:
+                        break
+                    now = time.monotonic()
+                    if now - last_report >= 30:
+                        total = sum(self.applied.values())
+                        logging.info(f"📈 {total} linhas aplicadas ({(total - reported) / (now - last_report):.1f}/s "
+                                     f"nos últimos {now - last_report:.0f}s), {len(self._errors)} tabela(s) com erro")
+                        last_report, reported = now, total
+                    time.sleep(max(0.0, self.interval - (time.monotonic() - pass_start)))
+        except KeyboardInterrupt:
+            logging.info("⏹️ Sincronização interrompida pelo usuário")
+        except Exception as e:
+            logging.error(f"❌ Erro na sincronização {self.source_label} → {self.target_label}: {e}")
+            summary.update({'success': False, 'error': str(e)})
+        finally:
+            for table in list(self._sessions):
+                self._discard_session(table)
+            if self.target == 'postgres':
+                for table, rows in self.applied.items():
+                    if rows:
+                        self._reset_sequences(target, table)
+            source.disconnect()
+            target.disconnect()
+            self.source_pool.close()
+            self.target_pool.close()
+        
+        summary.update({'rows': dict(self.applied), 'seconds': time.monotonic() - start_time,
+                        'errors': dict(self._errors)})
+        if self._errors:
+            summary['success'] = False
+        logging.info(f"📊 Sincronização {self.source_label} → {self.target_label}: {summary['passes']} passada(s), "
+                     f"{sum(self.applied.values())} linhas em {summary['seconds']:.1f}s")
+        for table, rows in self.applied.items():
+            mark = self.watermarks.get(table)
+            logging.info(f"   {'❌' if table in self._errors else '✅'} {table:<14} {rows:>10} linhas"
+                         + (f"  marca {mark[0]}" if mark else ''))
+        return summary
+
+def sync_main(argv: List[str]):
+    """Comando sync: replicação incremental contínua entre bancos"""
+    parser = argparse.ArgumentParser(
+        prog='migration-pipeline.py sync',
+        description="Replica continuamente as alterações (por updated_at) de um banco para outro, "
+                    "com marca d'água persistida no destino"
+    )
+    parser.add_argument('source', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de origem')
+    parser.add_argument('target', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de destino')
+    parser.add_argument('--tables', default=None,
+                        help='Tabelas a sincronizar, separadas por vírgula (padrão: todas)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Tabelas sincronizadas simultaneamente (padrão: 4)')
+    parser.add_argument('--page-rows', type=int, default=5000,
+                        help='Linhas por página lida e por transação de upsert (padrão: 5000)')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Segundos entre o início de passadas consecutivas (padrão: 1)')
+    parser.add_argument('--lag', type=float, default=2.0,
+                        help='Folga em segundos: só entram alterações mais antigas que isso (padrão: 2)')
+    parser.add_argument('--once', action='store_true',
+                        help='Executa uma única passada e termina')
+    parser.add_argument('--reset', action='store_true',
+                        help="Descarta as marcas d'água e sincroniza desde o início")
+    parser.add_argument('--source-database', default=None,
+                        help='Database de origem, se diferente do configurado')
+    parser.add_argument('--target-database', default=None,
+                        help='Database de destino, se diferente do configurado')
+    args = parser.parse_args(argv)
+    
+    known = [table for level in Migrator.LEVELS for table in level]
+    tables = [table.strip() for table in args.tables.split(',') if table.strip()] if args.tables else None
+    unknown = set(tables or []) - set(known)
+    if unknown:
+        parser.error(f"Tabelas desconhecidas: {', '.join(sorted(unknown))}")
+    if args.source == args.target and args.source_database == args.target_database:
+        parser.error("Origem e destino são o mesmo banco (use --target-database para outro database)")
+    
+    sync = IncrementalSync(args.source, args.target, tables, args.workers, args.page_rows, args.interval,
+                           args.lag, args.reset, args.source_database, args.target_database)
+    if not sync.run(once=args.once)['success']:
+        sys.exit(1)
+
+class MigrationValidator(Migrator):
+    """Validação de migração por hashes de faixas da chave primária"""
+    
+    # Texto canônico de cada classe de tipo, por banco ({c}: coluna)
+    CANONICAL = {
+        'integer': {'postgres': 'CAST({c} AS TEXT)', 'mysql': 'CAST({c} AS CHAR)',
+                    'sqlserver': 'CAST({c} AS VARCHAR(20))'},
+        'text': {'postgres': 'CAST({c} AS TEXT)', 'mysql': '{c}', 'sqlserver': 'CAST({c} AS NVARCHAR(MAX))'},
+        'numeric': {'postgres': 'CAST(CAST({c} AS NUMERIC(38, 6)) AS TEXT)',
+                    'mysql': 'CAST(CAST({c} AS DECIMAL(38, 6)) AS CHAR)',
+                    'sqlserver': 'CAST(CAST({c} AS DECIMAL(38, 6)) AS VARCHAR(50))'},
+        'datetime': {'postgres': "to_char({c}, 'YYYY-MM-DD HH24:MI:SS.US')",
+                     'mysql': "DATE_FORMAT({c}, '%%Y-%%m-%%d %%H:%%i:%%s.%%f')",
+                     'sqlserver': 'CONVERT(VARCHAR(26), CAST({c} AS DATETIME2(6)), 121)'},
+        'date': {'postgres': "to_char({c}, 'YYYY-MM-DD')", 'mysql': "DATE_FORMAT({c}, '%%Y-%%m-%%d')",
+                 'sqlserver': 'CONVERT(VARCHAR(10), {c}, 23)'},
+        'time': {'postgres': "to_char(DATE '2000-01-01' + {c}, 'HH24:MI:SS.US')",
+                 'mysql': "TIME_FORMAT({c}, '%%H:%%i:%%s.%%f')",
+                 'sqlserver': 'CAST(CAST({c} AS TIME(6)) AS VARCHAR(15))'},
+        'binary': {'postgres': 'md5({c})', 'mysql': 'MD5({c})',
+                   'sqlserver': "LOWER(CONVERT(VARCHAR(32), HASHBYTES('MD5', CAST({c} AS VARBINARY(MAX))), 2))"},
+        'uuid': {'postgres': 'CAST({c} AS TEXT)', 'mysql': 'LOWER({c})', 'sqlserver': 'LOWER(CAST({c} AS CHAR(36)))'},
+        # Só entre bancos do mesmo tipo
+        'other': {'postgres': 'CAST({c} AS TEXT)', 'mysql': 'CAST({c} AS CHAR)',
+                  'sqlserver': 'CAST({c} AS NVARCHAR(MAX))'},
+    }
+    # Variações por tipo da coluna
+    CANONICAL_TYPES = {
+        ('postgres', 'boolean'): 'CAST(CAST({c} AS INT) AS TEXT)',
+        ('postgres', 'bit'): 'CAST(CAST({c} AS BIGINT) AS TEXT)',
+        ('mysql', 'bit'): 'CAST(CAST({c} AS UNSIGNED) AS CHAR)',
+        ('postgres', 'timestamp with time zone'): "to_char({c} AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS.US')",
+        ('sqlserver', 'datetimeoffset'): 'CONVERT(VARCHAR(26), CAST(SWITCHOFFSET({c}, 0) AS DATETIME2(6)), 121)',
+        ('sqlserver', 'char'): 'RTRIM({c})',
+        ('sqlserver', 'nchar'): 'RTRIM({c})',
+        ('sqlserver', 'geometry'): '{c}.STAsText()',
+        ('sqlserver', 'geography'): '{c}.STAsText()',
+    }
+    
+    # Resumo de cada bloco: (bloco, linhas, soma dos 32 primeiros bits do MD5, soma dos 32 seguintes)
+    DIGEST_QUERIES = {
+        'postgres': "SELECT chunk, COUNT(*), SUM(('x' || substr(h, 1, 8))::bit(32)::bigint), "
+                    "SUM(('x' || substr(h, 9, 8))::bit(32)::bigint) "
+                    "FROM (SELECT ({split} - %s) / %s AS chunk, md5({row}) AS h FROM {table} "
+                    "WHERE {split} >= %s AND {split} < %s) hashes GROUP BY chunk",
+        'mysql': "SELECT chunk, COUNT(*), SUM(CAST(CONV(SUBSTRING(h, 1, 8), 16, 10) AS UNSIGNED)), "
+                 "SUM(CAST(CONV(SUBSTRING(h, 9, 8), 16, 10) AS UNSIGNED)) "
+                 "FROM (SELECT ({split} - %s) DIV %s AS chunk, MD5({row}) AS h FROM {table} "
+                 "WHERE {split} >= %s AND {split} < %s) hashes GROUP BY chunk",
+        # HASHBYTES sobre o texto em UTF-8 (como md5/MD5 nos outros bancos), não em UTF-16
+        'sqlserver': "SELECT chunk, COUNT(*), SUM(CAST(SUBSTRING(h, 1, 4) AS BIGINT)), "
+                     "SUM(CAST(SUBSTRING(h, 5, 4) AS BIGINT)) "
+                     "FROM (SELECT ({split} - %s) / %s AS chunk, "
+                     "HASHBYTES('MD5', CONVERT(VARCHAR(MAX), {row} COLLATE Latin1_General_100_BIN2_UTF8)) AS h "
+                     "FROM {table} WHERE {split} >= %s AND {split} < %s) hashes GROUP BY chunk",
+    }
+    
+    def __init__(self, source: str, target: str, tables: Sequence[str] = None, workers: int = 4,
+                 chunk_rows: int = 1000, show: int = 10, max_drill: int = 100,
+                 source_database: str = None, target_database: str = None):
+        super().__init__(source, target, tables, workers, chunk_rows=chunk_rows,
+                         source_database=source_database, target_database=target_database)
+        self.show = max(0, show)
+        self.max_drill = max(0, max_drill)
+    
+    # Forma canônica
+    
+    def _type_class(self, database_type: str, data_type: str) -> Optional[str]:
+        if database_type == 'sqlserver' and data_type == 'timestamp':
+            return None     # ROWVERSION: gerada pelo banco
+        if data_type in self.INTEGER_TYPES or data_type in ('bit', 'boolean', 'year'):
+            return 'integer'
+        if data_type in self.TEXT_TYPES and data_type != 'xml':
+            return 'text'
+        if data_type in self.NUMERIC_TYPES:
+            return 'numeric'
+        if data_type in self.DATETIME_TYPES or data_type in ('timestamp with time zone', 'datetimeoffset'):
+            return 'datetime'
+        if data_type == 'date':
+            return 'date'
+        if data_type in self.TIME_TYPES:
+            return 'time'
+        if data_type in self.BINARY_TYPES:
+            return 'binary'
+        if data_type in ('uuid', 'uniqueidentifier'):
+            return 'uuid'
+        return 'other'
+    
+    def _canonical(self, database_type: str, data_type: str, type_class: str, column: str) -> str:
+        template = self.CANONICAL_TYPES.get((database_type, data_type), self.CANONICAL[type_class][database_type])
+        return template.format(c=column)
+    
+    def compare_plan(self, source: 'DataManager', target: 'DataManager', table: str) -> Optional[Dict[str, Any]]:
+        """Colunas comparáveis e sua forma canônica em cada banco (None se a tabela não existir na origem)"""
+        plan = self.column_plan(source, target, table)
+        if plan is None:
+            return None
+        columns, expressions, excluded = [], {'source': [], 'target': []}, list(plan['skipped'])
+        for name, (source_type, target_type) in zip(plan['columns'], plan['types']):
+            source_class = self._type_class(self.source, source_type)
+            target_class = self._type_class(self.target, target_type)
+            comparable = source_class is not None and target_class is not None and (
+                (source_class == target_class and (source_class != 'other' or self.source == self.target))
+                or {source_class, target_class} == {'uuid', 'text'}
+            )
+            if not comparable:
+                excluded.append(name)
+                continue
+            columns.append(name)
+            expressions['source'].append(self._canonical(self.source, source_type, source_class, name))
+            expressions['target'].append(self._canonical(self.target, target_type, target_class, name))
+        keys = self.KEY_COLUMNS.get(table, ('id',))
+        return {'columns': columns, 'expressions': expressions, 'excluded': excluded, 'keys': keys,
+                'split': self.SPLIT_COLUMNS.get(table, 'id'),
+                'missing_keys': [key for key in keys if key not in plan['columns']]}
+    
+    @staticmethod
+    def _row_expression(expressions: Sequence[str], columns: Sequence[str]) -> str:
+        # NULL ('n') distinto de qualquer valor ('v' + texto)
+        parts = [f"CASE WHEN {column} IS NULL THEN 'n' ELSE CONCAT('v', {expression}) END"
+                 for column, expression in zip(columns, expressions)]
+        # CONCAT aninhado: o PostgreSQL aceita até 100 argumentos por função
+        groups = ["CONCAT('|', " + ", '|', ".join(parts[start:start + 40]) + ")"
+                  for start in range(0, len(parts), 40)]
+        return "CONCAT('#', " + ", ".join(groups) + ")"
+    
+    # Consultas (cada uma com conexão própria, em paralelo)
+    
+    def _side(self, side: str) -> Tuple[str, ConnectionPool]:
+        return (self.source, self.source_pool) if side == 'source' else (self.target, self.target_pool)
+    
+    def _query(self, side: str, query: str, params: tuple = None) -> List[Tuple]:
+        database_type, pool = self._side(side)
+        manager = self._manager(database_type, pool)
+        try:
+            cursor = manager.connection.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+                manager.connection.commit()
+        finally:
+            manager.disconnect()
+    
+    def _bounds(self, side: str, table: str, split: str) -> Tuple[Optional[int], Optional[int], int]:
+        return self._query(side, f"SELECT MIN({split}), MAX({split}), COUNT(*) FROM {table}")[0]
+    
+    def _digests(self, side: str, table: str, plan: Dict[str, Any], low: int, step: int, start: int,
+                 end: int) -> Dict[int, Tuple[int, int, int]]:
+        """Resumo dos blocos da faixa [start, end) da coluna de faixas"""
+        database_type, _ = self._side(side)
+        query = self.DIGEST_QUERIES[database_type].format(
+            split=plan['split'], table=table, row=self._row_expression(plan['expressions'][side], plan['columns']))
+        rows = self._query(side, query, (low, step, start, end))
+        return {int(chunk): (int(count), int(first), int(second)) for chunk, count, first, second in rows}
+    
+    def _chunk_rows(self, side: str, table: str, plan: Dict[str, Any], start: int,
+                    end: int) -> Dict[Tuple, Tuple]:
+        """Linhas (forma canônica) de um bloco, pela chave primária"""
+        keys = plan['keys']
+        query = (f"SELECT {', '.join(list(keys) + plan['expressions'][side])} FROM {table} "
+                 f"WHERE {plan['split']} >= %s AND {plan['split']} < %s")
+        return {tuple(row[:len(keys)]): tuple(row[len(keys):])
+                for row in self._query(side, query, (start, end))}
+    
+    # Validação
+    
+    def validate_table(self, executors: Dict[str, ThreadPoolExecutor], table: str,
+                       plan: Dict[str, Any]) -> Dict[str, Any]:
+        report = {'chunks': 0, 'mismatched_chunks': 0, 'missing': 0, 'extra': 0, 'different': 0,
+                  'samples': [], 'excluded_columns': plan['excluded'], 'undrilled_chunks': 0}
+        split = plan['split']
+        bounds = {side: executors[side].submit(self._bounds, side, table, split) for side in executors}
+        bounds = {side: future.result() for side, future in bounds.items()}
+        report['source_rows'], report['target_rows'] = bounds['source'][2], bounds['target'][2]
+        filled = [side_bounds for side_bounds in bounds.values() if side_bounds[0] is not None]
+        if not filled:
+            return report
+        low = min(side_low for side_low, _, _ in filled)
+        high = max(side_high for _, side_high, _ in filled)
+        # Blocos de ~chunk_rows linhas pela densidade da chave na origem (chaves
+        # soltas no destino, muito fora da faixa, não esticam os blocos)
+        base_low, base_high, base_rows = bounds['source'] if bounds['source'][0] is not None else filled[0]
+        step = max(1, math.ceil((base_high - base_low + 1) * self.chunk_rows / max(base_rows, 1)))
+        # Varreduras: a faixa da origem em ``workers`` partes, mais o que o destino tiver fora dela
+        per_part = math.ceil((base_high - base_low + 1) / self.workers)
+        ranges = [(start, min(start + per_part, base_high + 1)) for start in range(base_low, base_high + 1, per_part)]
+        if low < base_low:
+            ranges.append((low, base_low))
+        if high > base_high:
+            ranges.append((base_high + 1, high + 1))
+        
+        futures = {side: [executors[side].submit(self._digests, side, table, plan, low, step, start, end)
+                          for start, end in ranges]
+                   for side in executors}
+        digests = {side: {} for side in executors}
+        for side, side_futures in futures.items():
+            for future in side_futures:
+                # Um bloco pode ser dividido entre duas varreduras: as partes se somam
+                for chunk, digest in future.result().items():
+                    previous = digests[side].get(chunk, (0, 0, 0))
+                    digests[side][chunk] = tuple(a + b for a, b in zip(previous, digest))
+        
+        all_chunks = set(digests['source']) | set(digests['target'])
+        mismatched = sorted(chunk for chunk in all_chunks
+                            if digests['source'].get(chunk) != digests['target'].get(chunk))
+        report.update({'chunks': len(all_chunks), 'mismatched_chunks': len(mismatched),
+                       'undrilled_chunks': max(0, len(mismatched) - self.max_drill)})
+        
+        # Só os blocos divergentes são lidos linha a linha
+        drill = [(low + chunk * step, low + (chunk + 1) * step) for chunk in mismatched[:self.max_drill]]
+        pending = [(executors['source'].submit(self._chunk_rows, 'source', table, plan, start, end),
+                    executors['target'].submit(self._chunk_rows, 'target', table, plan, start, end))
+                   for start, end in drill]
+        for source_future, target_future in pending:
+            source_rows, target_rows = source_future.result(), target_future.result()
+            for key in sorted(set(source_rows) | set(target_rows), key=str):
+                if key not in target_rows:
+                    kind, columns = 'missing', []
+                elif key not in source_rows:
+                    kind, columns = 'extra', []
+                elif source_rows[key] != target_rows[key]:
+                    kind = 'different'
+                    columns = [column for column, source_value, target_value
+                               in zip(plan['columns'], source_rows[key], target_rows[key])
+                               if source_value != target_value]
+                else:
+                    continue
+                report[kind] += 1
+                if len(report['samples']) < self.show:
+                    report['samples'].append({'key': list(key), 'kind': kind, 'columns': columns})
+        return report
+    
+    def run(self) -> Dict[str, Any]:
+        """Valida as tabelas e devolve o relatório por tabela"""
+        logging.info(f"🔍 Validando {self.source_label} → {self.target_label}: {', '.join(self.tables)} "
+                     f"(blocos de ~{self.chunk_rows} linhas, {self.workers} varreduras por banco)")
+        try:
+            source = self._manager(self.source, self.source_pool)
+            target = self._manager(self.target, self.target_pool)
+        except RuntimeError as e:
+            return {'success': False, 'error': str(e)}
+        
+        summary = {'success': True, 'tables': {}}
+        start_time = time.monotonic()
+        executors = {side: ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f'validate-{side}')
+                     for side in ('source', 'target')}
+        try:
+            plans = {}
+            for table in self.tables:
+                plan = self.compare_plan(source, target, table)
+                if plan is None:
+                    logging.warning(f"⚠️ {table} não existe em {self.source_label}, ignorada")
+                    continue
+                if not plan['columns'] or plan['missing_keys']:
+                    summary['tables'][table] = {'error': f'tabela ausente ou sem a chave em {self.target_label}'}
+                    continue
+                plans[table] = plan
+            source.disconnect()
+            target.disconnect()
+            
+            for table, plan in plans.items():
+                table_start = time.monotonic()
+                try:
+                    report = self.validate_table(executors, table, plan)
+                except Exception as e:
+                    report = {'error': str(e)}
+                report['seconds'] = time.monotonic() - table_start
+                summary['tables'][table] = report
+                self.log_table(table, report)
+        except Exception as e:
+            logging.error(f"❌ Erro na validação {self.source_label} → {self.target_label}: {e}")
+            summary.update({'success': False, 'error': str(e)})
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
+            source.disconnect()
+            target.disconnect()
+            self.source_pool.close()
+            self.target_pool.close()
+        
+        summary['seconds'] = time.monotonic() - start_time
+        for report in summary['tables'].values():
+            if report.get('error') or report['mismatched_chunks'] or report['source_rows'] != report['target_rows']:
+                summary['success'] = False
+        icon = '🎉' if summary['success'] else '❌'
+        logging.info(f"{icon} Validação {self.source_label} → {self.target_label} "
+                     f"{'sem divergências' if summary['success'] else 'com divergências'} "
+                     f"em {summary['seconds']:.1f}s")
+        return summary
+    
+    def log_table(self, table: str, report: Dict[str, Any]):
+        if report.get('error'):
+            logging.error(f"   ❌ {table:<14} {report['error']}")
+            return
+        check = '✅' if not report['mismatched_chunks'] and report['source_rows'] == report['target_rows'] else '❌'
+        logging.info(f"   {check} {table:<14} origem={report['source_rows']} destino={report['target_rows']} "
+                     f"blocos={report['chunks']} divergentes={report['mismatched_chunks']} "
+                     f"({report['seconds']:.1f}s)")
+        if report['mismatched_chunks']:
+            logging.warning(f"      ausentes no destino={report['missing']} sobrando={report['extra']} "
+                            f"diferentes={report['different']}"
+                            + (f" ({report['undrilled_chunks']} bloco(s) não detalhados)"
+                               if report['undrilled_chunks'] else ''))
+        for sample in report['samples']:
+            columns = f" ({', '.join(sample['columns'])})" if sample['columns'] else ''
+            logging.warning(f"      {sample['kind']:<9} chave={sample['key']}{columns}")
+        if report['excluded_columns']:
+            logging.info(f"      colunas não comparadas: {', '.join(report['excluded_columns'])}")
+
+def validate_main(argv: List[str]):
+    """Comando validate: comparação de tabelas entre bancos por hashes de faixas"""
+    parser = argparse.ArgumentParser(
+        prog='migration-pipeline.py validate',
+        description='Compara as tabelas de dois bancos por hashes de blocos da chave primária, '
+                    'detalhando só os blocos divergentes'
+    )
+    parser.add_argument('source', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de origem')
+    parser.add_argument('target', choices=['mysql', 'postgres', 'sqlserver'], help='Banco de destino')
+    parser.add_argument('--tables', default=None,
+                        help='Tabelas a validar, separadas por vírgula (padrão: todas)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Varreduras simultâneas em cada banco (padrão: 4)')
+    parser.add_argument('--chunk-rows', type=int, default=1000,
+                        help='Linhas aproximadas por bloco com hash (padrão: 1000)')
+    parser.add_argument('--show', type=int, default=10,
+                        help='Linhas divergentes mostradas por tabela (padrão: 10)')
+    parser.add_argument('--max-drill', type=int, default=100,
+                        help='Blocos divergentes lidos linha a linha por tabela (padrão: 100)')
+    parser.add_argument('--source-database', default=None,
+                        help='Database de origem, se diferente do configurado')
+    parser.add_argument('--target-database', default=None,
+                        help='Database de destino, se diferente do configurado')
+    args = parser.parse_args(argv)
+    
+    known = [table for level in Migrator.LEVELS for table in level]
+    tables = [table.strip() for table in args.tables.split(',') if table.strip()] if args.tables else None
+    unknown = set(tables or []) - set(known)
+    if unknown:
+        parser.error(f"Tabelas desconhecidas: {', '.join(sorted(unknown))}")
+    if args.source == args.target and args.source_database == args.target_database:
+        parser.error("Origem e destino são o mesmo banco (use --target-database para outro database)")
+    
+    validator = MigrationValidator(args.source, args.target, tables, args.workers, args.chunk_rows, args.show,
+                                   args.max_drill, args.source_database, args.target_database)
+    if not validator.run()['success']:
+        sys.exit(1)
+
+# Subcomandos do pipeline
+COMMANDS = {
+    'migrate': migrate_main,
+    'sync': sync_main,
+    'validate': validate_main,
+}
+
+def main():
+    """Função principal"""
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print(f"Uso: migration-pipeline.py {{{','.join(COMMANDS)}}} <origem> <destino> [opções]")
+        print("     migration-pipeline.py <comando> --help")
+        sys.exit(2)
+    COMMANDS[sys.argv[1]](sys.argv[2:])
+
+if __name__ == "__main__":
+    main()
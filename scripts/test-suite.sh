@@ -206,6 +206,112 @@ count_test $?
 run_test "Arquivo de backup PostgreSQL não está vazio" "[ -s /tmp/test_backup_postgres.sql ]"
 count_test $?
 
+# Repositório deduplicado (backup-store.py): não depende dos containers
+STORE="python3 ${SCRIPT_DIR}/backup-store.py --repo /tmp/test_backup_store/repo"
+STORE_DATA=/tmp/test_backup_store
+rm -rf "$STORE_DATA" && mkdir -p "$STORE_DATA"
+seq 1 200000 | awk '{ printf "%d\tcliente %d\tcliente%d@teste.com\n", $1, $1, $1 }' > "$STORE_DATA/clientes.sql"
+sed 's/^100000\tcliente 100000\t/100000\tcliente alterado\t/' "$STORE_DATA/clientes.sql" > "$STORE_DATA/clientes_v2.sql"
+
+run_test "Dedup: put + commit de um dump" "$STORE put teste_backup_1 $STORE_DATA/clientes.sql --commit"
+count_test $?
+
+run_test "Dedup: restauração idêntica byte a byte" "$STORE restore teste_backup_1 $STORE_DATA/restore_1 && cmp $STORE_DATA/clientes.sql $STORE_DATA/restore_1/clientes.sql"
+count_test $?
+
+run_test "Dedup: uma linha alterada grava só 1-2 blocos novos" "$STORE put teste_backup_2 - --name clientes.sql --commit < $STORE_DATA/clientes_v2.sql && python3 -c \"import json, sys; s = json.load(open(sys.argv[1])); sys.exit(0 if 0 < s['new_chunks'] <= 2 < s['chunks'] else 1)\" $STORE_DATA/repo/snapshots/teste_backup_2/snapshot.json"
+count_test $?
+
+run_test "Dedup: restauração do snapshot alterado (stdout)" "$STORE restore teste_backup_2 - --name clientes.sql | cmp - $STORE_DATA/clientes_v2.sql"
+count_test $?
+
+# Envelhece o primeiro snapshot: o prune remove-o, mas mantém os blocos ainda usados pelo segundo
+python3 -c "import json, sys; path = sys.argv[1]; s = json.load(open(path)); s['created_at'] = '2000-01-01T00:00:00'; json.dump(s, open(path, 'w'))" "$STORE_DATA/repo/snapshots/teste_backup_1/snapshot.json"
+
+run_test "Dedup: prune remove o snapshot antigo" "$STORE prune --keep-days 1 --keep-last 1 && [ ! -d $STORE_DATA/repo/snapshots/teste_backup_1 ] && [ -d $STORE_DATA/repo/snapshots/teste_backup_2 ]"
+count_test $?
+
+run_test "Dedup: blocos referenciados sobrevivem ao prune" "$STORE verify && $STORE restore teste_backup_2 - --name clientes.sql | cmp - $STORE_DATA/clientes_v2.sql"
+count_test $?
+
+run_test "Dedup: só os blocos exclusivos do snapshot removido são apagados" "[ \$(find $STORE_DATA/repo/chunks -type f | wc -l) -eq \$(python3 -c \"import json, sys; print(len({c[0] for c in json.load(open(sys.argv[1]))['chunks']}))\" $STORE_DATA/repo/snapshots/teste_backup_2/files/clientes.sql.json) ]"
+count_test $?
+
+echo -e "\n${BLUE}🐍 Testes do Gerenciador de Dados${NC}"
+echo "=================================="
+
+# Unidades do auto-data-manager.py: não dependem dos containers
+PYTHON="python3"
+[ -x "${PROJECT_DIR}/.venv/bin/python" ] && PYTHON="${PROJECT_DIR}/.venv/bin/python"
+
+# Executa um trecho Python (asserts) com o auto-data-manager.py carregado, sem conectar aos bancos
+adm_check() {
+    "$PYTHON" -c "
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location('auto_data_manager', '${SCRIPT_DIR}/auto-data-manager.py')
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+exec(sys.argv[1], vars(module))
+" "$1"
+}
+
+HISTOGRAM_CHECK='
+rng = random.Random(42)
+samples = [rng.lognormvariate(math.log(0.005), 1.0) for _ in range(200000)]
+histogram = LatencyHistogram()
+for sample in samples:
+    histogram.record(sample)
+ordered = sorted(samples)
+for fraction in (0.5, 0.9, 0.95, 0.99, 0.999):
+    exact = ordered[math.ceil(fraction * len(ordered)) - 1] * 1000
+    assert abs(histogram.percentile(fraction) - exact) / exact <= 1 / 256, fraction
+'
+
+COMMIT_POLICY_CHECK='
+valid = {"statement": "statement", "cycle": "cycle", "count": "count:100", "count:10": "count:10",
+         "interval": "interval:100", "interval:50": "interval:50", "interval:0.5": "interval:0.5"}
+for spec, expected in valid.items():
+    assert str(CommitPolicy.parse(spec)) == expected, spec
+for spec in ("", "foo", "foo:1", "statement:5", "cycle:2", "count:0", "count:-3", "count:x", "count:1.5",
+             "interval:0", "interval:-1", "interval:abc", "interval:nan", "interval:inf"):
+    try:
+        CommitPolicy.parse(spec)
+    except ValueError:
+        continue
+    raise AssertionError(spec)
+'
+
+PROFILES_CHECK="
+import glob
+paths = sorted(glob.glob('${PROJECT_DIR}/profiles/*.toml') + glob.glob('${PROJECT_DIR}/profiles/*.y*ml'))
+assert paths
+for path in paths:
+    profile = WorkloadProfile.load(path)
+    assert profile.phases and profile.workers > 0, path
+"
+
+LATENCY_SUMMARY_CHECK='
+assert latency_summary([]) == {}
+summary = latency_summary([i / 1000 for i in range(100, 0, -1)])
+for key, expected in {"mean_ms": 50.5, "p50_ms": 50, "p95_ms": 95, "p99_ms": 99, "max_ms": 100}.items():
+    assert math.isclose(summary[key], expected), key
+summary = latency_summary([0.030, 0.010, 0.020])
+assert [round(summary[key]) for key in ("p50_ms", "p95_ms", "p99_ms")] == [20, 30, 30]
+assert round(latency_summary([0.007])["p50_ms"]) == 7
+'
+
+run_test "Gerenciador: histograma com erro relativo <= 1/256 (amostra lognormal)" "adm_check \"\$HISTOGRAM_CHECK\""
+count_test $?
+
+run_test "Gerenciador: CommitPolicy.parse aceita e rejeita as especificações" "adm_check \"\$COMMIT_POLICY_CHECK\""
+count_test $?
+
+run_test "Gerenciador: todos os perfis de profiles/ carregam" "adm_check \"\$PROFILES_CHECK\""
+count_test $?
+
+run_test "Gerenciador: latency_summary usa nearest-rank" "adm_check \"\$LATENCY_SUMMARY_CHECK\""
+count_test $?
+
 echo -e "\n${BLUE}🌐 Testes de Rede${NC}"
 echo "=================="
 
@@ -232,6 +338,7 @@ count_test $?
 
 # Limpeza de arquivos de teste
 rm -f /tmp/test_backup_*.sql
+rm -rf /tmp/test_backup_store
 
 # Relatório final
 echo -e "\n${PURPLE}📊 RELATÓRIO FINAL${NC}"